@@ -2,7 +2,7 @@
 import asyncio
 import logging
 from collections import OrderedDict
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple, cast
 
 import jwt
@@ -20,10 +20,14 @@ from .providers import auth_provider_from_config, AuthProvider, LoginFlow
 EVENT_USER_ADDED = 'user_added'
 EVENT_USER_REMOVED = 'user_removed'
 
+# Number of validated access tokens to remember
+ACCESS_TOKEN_CACHE_SIZE = 256
+
 _LOGGER = logging.getLogger(__name__)
 _MfaModuleDict = Dict[str, MultiFactorAuthModule]
 _ProviderKey = Tuple[str, Optional[str]]
 _ProviderDict = Dict[_ProviderKey, AuthProvider]
+_CachedAccessToken = Tuple[models.RefreshToken, datetime]
 
 
 async def auth_manager_from_config(
@@ -74,6 +78,10 @@ class AuthManager:
         self._store = store
         self._providers = providers
         self._mfa_modules = mfa_modules
+        # Validated access tokens mapped to their refresh token and the time
+        # they expire, least recently used first.
+        self._access_token_cache = \
+            OrderedDict()  # type: OrderedDict[str, _CachedAccessToken]
         self.login_flow = data_entry_flow.FlowManager(
             hass, self._async_create_login_flow,
             self._async_finish_login_flow)
@@ -364,6 +372,10 @@ class AuthManager:
         """Delete a refresh token."""
         await self._store.async_remove_refresh_token(refresh_token)
 
+        for token, (cached, _) in list(self._access_token_cache.items()):
+            if cached.id == refresh_token.id:
+                self._access_token_cache.pop(token)
+
     @callback
     def async_create_access_token(self,
                                   refresh_token: models.RefreshToken,
@@ -381,6 +393,22 @@ class AuthManager:
     async def async_validate_access_token(
             self, token: str) -> Optional[models.RefreshToken]:
         """Return refresh token if an access token is valid."""
+        cached = self._access_token_cache.get(token)
+
+        if cached is not None:
+            refresh_token, expires = cached
+
+            # Tokens of removed refresh tokens or users are no longer valid.
+            if (dt_util.utcnow() < expires and
+                    await self.async_get_refresh_token(refresh_token.id)
+                    is refresh_token):
+                self._access_token_cache.move_to_end(token)
+                if not refresh_token.user.is_active:
+                    return None
+                return refresh_token
+
+            self._access_token_cache.pop(token, None)
+
         try:
             unverif_claims = jwt.decode(token, verify=False)
         except jwt.InvalidTokenError:
@@ -397,7 +425,7 @@ class AuthManager:
             issuer = refresh_token.id
 
         try:
-            jwt.decode(
+            claims = jwt.decode(
                 token,
                 jwt_key,
                 leeway=10,
@@ -410,6 +438,12 @@ class AuthManager:
         if refresh_token is None or not refresh_token.user.is_active:
             return None
 
+        # Without the leeway, so expired tokens are always decoded again.
+        self._access_token_cache[token] = (
+            refresh_token, dt_util.utc_from_timestamp(claims['exp']))
+        if len(self._access_token_cache) > ACCESS_TOKEN_CACHE_SIZE:
+            self._access_token_cache.popitem(last=False)
+
         return refresh_token
 
     async def _async_create_login_flow(
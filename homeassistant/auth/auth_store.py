@@ -2,6 +2,7 @@
 import asyncio
 from collections import OrderedDict
 from datetime import timedelta
+import hashlib
 import hmac
 from logging import getLogger
 from typing import Any, Dict, List, Optional  # noqa: F401
@@ -37,6 +38,11 @@ class AuthStore:
         self._users = None  # type: Optional[Dict[str, models.User]]
         self._groups = None  # type: Optional[Dict[str, models.Group]]
         self._perm_lookup = None  # type: Optional[PermissionLookup]
+        # Indexes of the refresh tokens of all users, by id and by the hash
+        # of their token.
+        self._refresh_tokens = {}  # type: Dict[str, models.RefreshToken]
+        self._refresh_tokens_by_hash = \
+            {}  # type: Dict[str, models.RefreshToken]
         self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY,
                                                  private=True)
         self._lock = asyncio.Lock()
@@ -136,6 +142,8 @@ class AuthStore:
             assert self._users is not None
 
         self._users.pop(user.id)
+        for refresh_token in user.refresh_tokens.values():
+            self._async_unindex_refresh_token(refresh_token)
         self._async_schedule_save()
 
     async def async_update_user(
@@ -217,6 +225,7 @@ class AuthStore:
 
         refresh_token = models.RefreshToken(**kwargs)
         user.refresh_tokens[refresh_token.id] = refresh_token
+        self._async_index_refresh_token(refresh_token)
 
         self._async_schedule_save()
         return refresh_token
@@ -228,10 +237,13 @@ class AuthStore:
             await self._async_load()
             assert self._users is not None
 
-        for user in self._users.values():
-            if user.refresh_tokens.pop(refresh_token.id, None):
-                self._async_schedule_save()
-                break
+        found = self._refresh_tokens.get(refresh_token.id)
+        if found is None:
+            return
+
+        self._async_unindex_refresh_token(found)
+        found.user.refresh_tokens.pop(found.id, None)
+        self._async_schedule_save()
 
     async def async_get_refresh_token(
             self, token_id: str) -> Optional[models.RefreshToken]:
@@ -240,12 +252,7 @@ class AuthStore:
             await self._async_load()
             assert self._users is not None
 
-        for user in self._users.values():
-            refresh_token = user.refresh_tokens.get(token_id)
-            if refresh_token is not None:
-                return refresh_token
-
-        return None
+        return self._refresh_tokens.get(token_id)
 
     async def async_get_refresh_token_by_token(
             self, token: str) -> Optional[models.RefreshToken]:
@@ -254,15 +261,31 @@ class AuthStore:
             await self._async_load()
             assert self._users is not None
 
-        found = None
+        found = self._refresh_tokens_by_hash.get(_hash_token(token))
 
-        for user in self._users.values():
-            for refresh_token in user.refresh_tokens.values():
-                if hmac.compare_digest(refresh_token.token, token):
-                    found = refresh_token
+        # The hash only narrows the lookup down, the token itself is still
+        # compared in constant time.
+        if found is None or not hmac.compare_digest(found.token, token):
+            return None
 
         return found
 
+    @callback
+    def _async_index_refresh_token(
+            self, refresh_token: models.RefreshToken) -> None:
+        """Add a refresh token to the lookup indexes."""
+        self._refresh_tokens[refresh_token.id] = refresh_token
+        self._refresh_tokens_by_hash[_hash_token(refresh_token.token)] = \
+            refresh_token
+
+    @callback
+    def _async_unindex_refresh_token(
+            self, refresh_token: models.RefreshToken) -> None:
+        """Remove a refresh token from the lookup indexes."""
+        self._refresh_tokens.pop(refresh_token.id, None)
+        self._refresh_tokens_by_hash.pop(
+            _hash_token(refresh_token.token), None)
+
     @callback
     def async_log_refresh_token_usage(
             self, refresh_token: models.RefreshToken,
@@ -461,6 +484,7 @@ class AuthStore:
                 last_used_ip=rt_dict.get('last_used_ip'),
             )
             users[rt_dict['user_id']].refresh_tokens[token.id] = token
+            self._async_index_refresh_token(token)
 
         self._groups = groups
         self._users = users
@@ -559,6 +583,11 @@ class AuthStore:
         self._groups = groups
 
 
+def _hash_token(token: str) -> str:
+    """Return the key of a token in the refresh token index."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
 def _system_admin_group() -> models.Group:
     """Create system admin group."""
     return models.Group(
@@ -23,7 +23,8 @@ from homeassistant.exceptions import (
 from homeassistant.helpers import template
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.helpers.state import AsyncTrackStates
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import (
+    JSONEncoder, dumps_event, dumps_states)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -101,7 +102,12 @@ class APIEventStream(HomeAssistantView):
             if event.event_type == EVENT_HOMEASSISTANT_STOP:
                 data = stop_obj
             else:
-                data = json.dumps(event, cls=JSONEncoder)
+                try:
+                    data = dumps_event(event)
+                except ValueError:
+                    # Out of range floats are not valid JSON but were
+                    # always streamed
+                    data = json.dumps(event, cls=JSONEncoder)
 
             await to_write.put(data)
 
@@ -190,7 +196,11 @@ class APIStatesView(HomeAssistantView):
             state for state in request.app['hass'].states.async_all()
             if entity_perm(state.entity_id, 'read')
         ]
-        return self.json(states)
+        try:
+            return self.json_raw(dumps_states(states))
+        except (ValueError, TypeError):
+            # Report the invalid state the regular way
+            return self.json(states)
 
 
 class APIEntityStateView(HomeAssistantView):
@@ -207,9 +217,13 @@ class APIEntityStateView(HomeAssistantView):
             raise Unauthorized(entity_id=entity_id)
 
         state = request.app['hass'].states.get(entity_id)
-        if state:
+        if not state:
+            return self.json_message("Entity not found.", HTTP_NOT_FOUND)
+        try:
+            return self.json_raw(state.as_json())
+        except (ValueError, TypeError):
+            # Report the invalid state the regular way
             return self.json(state)
-        return self.json_message("Entity not found.", HTTP_NOT_FOUND)
 
     async def post(self, request, entity_id):
         """Update state of entity."""
@@ -34,7 +34,8 @@ from homeassistant.components import websocket_api
 import homeassistant.helpers.config_validation as cv
 from homeassistant.setup import async_when_setup
 
-from .const import DOMAIN, DATA_CAMERA_PREFS
+from .const import DOMAIN, DATA_CAMERA_FRAMES, DATA_CAMERA_PREFS
+from .frames import CameraFrames
 from .prefs import CameraPreferences
 
 _LOGGER = logging.getLogger(__name__)
@@ -122,7 +123,7 @@ async def async_get_image(hass, entity_id, timeout=10):
 
     with suppress(asyncio.CancelledError, asyncio.TimeoutError):
         with async_timeout.timeout(timeout, loop=hass.loop):
-            image = await camera.async_camera_image()
+            image = await camera.async_camera_frame()
 
             if image:
                 return Image(camera.content_type, image)
@@ -141,6 +142,26 @@ async def async_get_mjpeg_stream(hass, request, entity_id):
 async def async_get_still_stream(request, image_cb, content_type, interval):
     """Generate an HTTP MJPEG stream from camera images.
 
+    This method must be run in the event loop.
+    """
+    fetched = False
+
+    async def next_image():
+        """Fetch the next image after waiting for the interval."""
+        nonlocal fetched
+
+        if fetched:
+            await asyncio.sleep(interval)
+
+        fetched = True
+        return await image_cb()
+
+    return await _async_write_still_stream(request, next_image, content_type)
+
+
+async def _async_write_still_stream(request, next_image, content_type):
+    """Write images to an HTTP MJPEG stream until there are no more.
+
     This method must be run in the event loop.
     """
     response = web.StreamResponse()
@@ -160,7 +181,7 @@ async def async_get_still_stream(request, image_cb, content_type, interval):
     last_image = None
 
     while True:
-        img_bytes = await image_cb()
+        img_bytes = await next_image()
         if not img_bytes:
             break
 
@@ -173,8 +194,6 @@ async def async_get_still_stream(request, image_cb, content_type, interval):
                 await write_to_mjpeg_stream(img_bytes)
             last_image = img_bytes
 
-        await asyncio.sleep(interval)
-
     return response
 
 
@@ -204,6 +223,7 @@ async def async_setup(hass, config):
     prefs = CameraPreferences(hass)
     await prefs.async_initialize()
     hass.data[DATA_CAMERA_PREFS] = prefs
+    hass.data[DATA_CAMERA_FRAMES] = CameraFrames(hass, prefs)
 
     hass.http.register_view(CameraImageView(component))
     hass.http.register_view(CameraMjpegStream(component))
@@ -345,13 +365,38 @@ class Camera(Entity):
         """
         return self.hass.async_add_job(self.camera_image)
 
+    async def async_camera_frame(self):
+        """Return bytes of camera image, shared with concurrent requests.
+
+        This method must be run in the event loop.
+        """
+        frames = self.hass.data.get(DATA_CAMERA_FRAMES)
+
+        if frames is None:
+            return await self.async_camera_image()
+
+        return await frames.async_get_frame(self)
+
     async def handle_async_still_stream(self, request, interval):
         """Generate an HTTP MJPEG stream from camera images.
 
+        All clients streaming the camera at the same interval are served
+        from a single fetch of each image.
         This method must be run in the event loop.
         """
-        return await async_get_still_stream(request, self.async_camera_image,
-                                            self.content_type, interval)
+        frames = self.hass.data.get(DATA_CAMERA_FRAMES)
+
+        if frames is None:
+            return await async_get_still_stream(
+                request, self.async_camera_image, self.content_type, interval)
+
+        queue = frames.async_subscribe(self, interval)
+
+        try:
+            return await _async_write_still_stream(
+                request, queue.get, self.content_type)
+        finally:
+            frames.async_unsubscribe(self, interval, queue)
 
     async def handle_async_mjpeg_stream(self, request):
         """Serve an HTTP MJPEG stream from the camera.
@@ -482,7 +527,7 @@ class CameraImageView(CameraView):
         """Serve camera image."""
         with suppress(asyncio.CancelledError, asyncio.TimeoutError):
             with async_timeout.timeout(10, loop=request.app['hass'].loop):
-                image = await camera.async_camera_image()
+                image = await camera.async_camera_frame()
 
             if image:
                 return web.Response(body=image,
@@ -579,6 +624,8 @@ async def websocket_get_prefs(hass, connection, msg):
     vol.Required('type'): 'camera/update_prefs',
     vol.Required('entity_id'): cv.entity_id,
     vol.Optional('preload_stream'): bool,
+    vol.Optional('frame_max_age'): vol.All(vol.Coerce(float),
+                                           vol.Range(min=0)),
 })
 async def websocket_update_prefs(hass, connection, msg):
     """Handle request for account info."""
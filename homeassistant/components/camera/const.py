@@ -2,5 +2,7 @@
 DOMAIN = 'camera'
 
 DATA_CAMERA_PREFS = 'camera_prefs'
+DATA_CAMERA_FRAMES = 'camera_frames'
 
 PREF_PRELOAD_STREAM = 'preload_stream'
+PREF_FRAME_MAX_AGE = 'frame_max_age'
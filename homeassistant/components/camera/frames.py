@@ -0,0 +1,192 @@
+"""Shared fetching of camera frames."""
+import asyncio
+from collections import OrderedDict
+import logging
+
+import async_timeout
+import attr
+
+from homeassistant.core import callback
+
+_LOGGER = logging.getLogger(__name__)
+
+FETCH_TIMEOUT = 10  # seconds
+MAX_CACHE_SIZE = 16 * 1024 * 1024  # bytes
+
+
+@attr.s(slots=True)
+class CachedFrame:
+    """Represent a frame fetched from a camera."""
+
+    content = attr.ib(type=bytes)
+    fetched = attr.ib(type=float)
+
+
+class CameraFrames:
+    """Fetch camera frames once for all clients requesting them.
+
+    Concurrent requests for a frame of the same camera share one upstream
+    fetch. Frames are cached for the max age configured in the camera
+    preferences, within a limit of memory for all cameras together.
+    """
+
+    def __init__(self, hass, prefs, max_size=MAX_CACHE_SIZE):
+        """Initialize the camera frames."""
+        self.hass = hass
+        self._prefs = prefs
+        self._max_size = max_size
+        self._size = 0
+        self._frames = OrderedDict()  # least recently used first
+        self._fetches = {}
+        self._broadcasts = {}
+
+    async def async_get_frame(self, camera):
+        """Return the current frame of a camera."""
+        entity_id = camera.entity_id
+        max_age = self._prefs.get(entity_id).frame_max_age
+        cached = self._frames.get(entity_id)
+
+        if (cached is not None and
+                self.hass.loop.time() - cached.fetched < max_age):
+            self._frames.move_to_end(entity_id)
+            return cached.content
+
+        fetch = self._fetches.get(entity_id)
+
+        if fetch is None:
+            fetch = self._fetches[entity_id] = self.hass.async_create_task(
+                self._async_fetch(camera, max_age))
+
+        # A client going away should not cancel the fetch of the others
+        return await asyncio.shield(fetch)
+
+    async def _async_fetch(self, camera, max_age):
+        """Fetch a frame from the camera and cache it."""
+        entity_id = camera.entity_id
+
+        try:
+            with async_timeout.timeout(FETCH_TIMEOUT, loop=self.hass.loop):
+                image = await camera.async_camera_image()
+        finally:
+            del self._fetches[entity_id]
+
+        self._async_discard(entity_id)
+
+        if image and max_age > 0 and len(image) <= self._max_size:
+            self._frames[entity_id] = CachedFrame(
+                image, self.hass.loop.time())
+            self._size += len(image)
+
+            while self._size > self._max_size:
+                _, evicted = self._frames.popitem(last=False)
+                self._size -= len(evicted.content)
+
+        return image
+
+    @callback
+    def _async_discard(self, entity_id):
+        """Remove the cached frame of a camera."""
+        cached = self._frames.pop(entity_id, None)
+
+        if cached is not None:
+            self._size -= len(cached.content)
+
+    @callback
+    def async_subscribe(self, camera, interval):
+        """Subscribe to the frames of a camera, fetched at an interval.
+
+        Returns a queue that receives new frames and None once the camera
+        stops returning frames.
+        """
+        key = (camera.entity_id, interval)
+        broadcast = self._broadcasts.get(key)
+
+        if broadcast is None:
+            broadcast = self._broadcasts[key] = FrameBroadcast(
+                self, camera, interval)
+
+        return broadcast.async_subscribe()
+
+    @callback
+    def async_unsubscribe(self, camera, interval, queue):
+        """Stop sending frames to a queue."""
+        key = (camera.entity_id, interval)
+        broadcast = self._broadcasts.get(key)
+
+        if broadcast is not None and broadcast.async_unsubscribe(queue):
+            del self._broadcasts[key]
+
+
+class FrameBroadcast:
+    """Fetch the frames of a camera at an interval for all subscribers."""
+
+    def __init__(self, frames, camera, interval):
+        """Initialize the broadcast."""
+        self._frames = frames
+        self._camera = camera
+        self._interval = interval
+        self._queues = []
+        self._last_image = None
+        self._task = None
+
+    @callback
+    def async_subscribe(self):
+        """Return a new queue receiving the frames."""
+        queue = asyncio.Queue(maxsize=1, loop=self._frames.hass.loop)
+        self._queues.append(queue)
+
+        if self._task is None:
+            self._task = self._frames.hass.async_create_task(
+                self._async_produce())
+        elif self._last_image is not None:
+            queue.put_nowait(self._last_image)
+
+        return queue
+
+    @callback
+    def async_unsubscribe(self, queue):
+        """Remove a queue, return True if it was the last one."""
+        self._queues.remove(queue)
+
+        if self._queues:
+            return False
+
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+        return True
+
+    @callback
+    def _async_send(self, image):
+        """Send an image to all queues, replacing unread ones."""
+        for queue in self._queues:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(image)
+
+    async def _async_produce(self):
+        """Fetch frames and send the changed ones to the subscribers."""
+        try:
+            while True:
+                try:
+                    image = await self._frames.async_get_frame(self._camera)
+                except asyncio.TimeoutError:
+                    image = None
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception("Error fetching frame of %s",
+                                      self._camera.entity_id)
+                    image = None
+
+                if not image:
+                    break
+
+                if image != self._last_image:
+                    self._last_image = image
+                    self._async_send(image)
+
+                await asyncio.sleep(self._interval)
+
+            self._async_send(None)
+        finally:
+            self._task = None
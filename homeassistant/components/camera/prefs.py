@@ -1,5 +1,5 @@
 """Preference management for camera component."""
-from .const import DOMAIN, PREF_PRELOAD_STREAM
+from .const import DOMAIN, PREF_FRAME_MAX_AGE, PREF_PRELOAD_STREAM
 
 STORAGE_KEY = DOMAIN
 STORAGE_VERSION = 1
@@ -22,6 +22,11 @@ class CameraEntityPreferences:
         """Return if stream is loaded on hass start."""
         return self._prefs.get(PREF_PRELOAD_STREAM, False)
 
+    @property
+    def frame_max_age(self):
+        """Return how many seconds a fetched frame can be reused."""
+        return self._prefs.get(PREF_FRAME_MAX_AGE, 0)
+
 
 class CameraPreferences:
     """Handle camera preferences."""
@@ -42,13 +47,14 @@ class CameraPreferences:
         self._prefs = prefs
 
     async def async_update(self, entity_id, *, preload_stream=_UNDEF,
-                           stream_options=_UNDEF):
+                           stream_options=_UNDEF, frame_max_age=_UNDEF):
         """Update camera preferences."""
         if not self._prefs.get(entity_id):
             self._prefs[entity_id] = {}
 
         for key, value in (
                 (PREF_PRELOAD_STREAM, preload_stream),
+                (PREF_FRAME_MAX_AGE, frame_max_age),
         ):
             if value is not _UNDEF:
                 self._prefs[entity_id][key] = value
@@ -24,6 +24,8 @@ DOMAIN = 'group'
 
 ENTITY_ID_FORMAT = DOMAIN + '.{}'
 
+DATA_EXPANDED_GROUPS = 'group_expanded'
+
 CONF_ENTITIES = 'entities'
 CONF_VIEW = 'view'
 CONF_CONTROL = 'control'
@@ -127,7 +129,14 @@ def expand_entity_ids(hass, entity_ids):
 
     Async friendly.
     """
+    return _expand_entity_ids(hass, entity_ids, [])
+
+
+def _expand_entity_ids(hass, entity_ids, depends):
+    """Expand entity_ids, adding the group members used to depends."""
     found_ids = []
+    seen_ids = set()
+
     for entity_id in entity_ids:
         if not isinstance(entity_id, str):
             continue
@@ -139,26 +148,61 @@ def expand_entity_ids(hass, entity_ids):
             domain, _ = ha.split_entity_id(entity_id)
 
             if domain == DOMAIN:
-                child_entities = get_entity_ids(hass, entity_id)
-                if entity_id in child_entities:
-                    child_entities = list(child_entities)
-                    child_entities.remove(entity_id)
-                found_ids.extend(
-                    ent_id for ent_id
-                    in expand_entity_ids(hass, child_entities)
-                    if ent_id not in found_ids)
-
+                child_ids = _expand_group(hass, entity_id, depends)
             else:
-                if entity_id not in found_ids:
-                    found_ids.append(entity_id)
+                child_ids = (entity_id,)
 
         except AttributeError:
             # Raised by split_entity_id if entity_id is not a string
-            pass
+            continue
+
+        for ent_id in child_ids:
+            if ent_id not in seen_ids:
+                seen_ids.add(ent_id)
+                found_ids.append(ent_id)
 
     return found_ids
 
 
+def _group_members(hass, entity_id):
+    """Return the entity_id attribute of a group, None if it has none."""
+    group = hass.states.get(entity_id)
+
+    if not group:
+        return None
+
+    return group.attributes.get(ATTR_ENTITY_ID)
+
+
+def _expand_group(hass, entity_id, depends):
+    """Return the expanded members of a group.
+
+    Expansions are cached together with the member lists of all nested
+    groups they were built from. They are reused as long as these are still
+    the same objects, so any change of group membership invalidates them.
+    """
+    expanded = hass.data.get(DATA_EXPANDED_GROUPS)
+
+    if expanded is None:
+        expanded = hass.data[DATA_EXPANDED_GROUPS] = {}
+
+    cached = expanded.get(entity_id)
+
+    if cached is None or any(
+            _group_members(hass, group_id) is not members
+            for group_id, members in cached[0]):
+        members = _group_members(hass, entity_id)
+        group_depends = [(entity_id, members)]
+        child_entities = [ent_id for ent_id in members or ()
+                          if ent_id != entity_id]
+        cached = expanded[entity_id] = (
+            group_depends,
+            _expand_entity_ids(hass, child_entities, group_depends))
+
+    depends.extend(cached[0])
+    return cached[1]
+
+
 @bind_hass
 def get_entity_ids(hass, entity_id, domain_filter=None):
     """Get members of this group.
@@ -362,6 +406,10 @@ class Group(Entity):
         self._order = order
         self._assumed_state = False
         self._async_unsub_state_changed = None
+        # Whether each member is on and has an assumed state
+        self._member_states = {}
+        self._on_count = 0
+        self._assumed_count = 0
 
     @staticmethod
     def create_group(hass, name, entity_ids=None, user_defined=True,
@@ -528,6 +576,41 @@ class Group(Entity):
         self._async_update_group_state(new_state)
         await self.async_update_ha_state()
 
+    @callback
+    def _async_count_member(self, entity_id, state):
+        """Update the member counters for a changed member state."""
+        old = self._member_states.pop(entity_id, None)
+
+        if old is not None:
+            self._on_count -= old[0]
+            self._assumed_count -= old[1]
+
+        if state is None:
+            return
+
+        new = (state.state == self.group_on,
+               bool(state.attributes.get(ATTR_ASSUMED_STATE)))
+        self._member_states[entity_id] = new
+        self._on_count += new[0]
+        self._assumed_count += new[1]
+
+    @callback
+    def _async_count_members(self):
+        """Count the states of all members."""
+        self._member_states = {}
+        self._on_count = 0
+        self._assumed_count = 0
+
+        for entity_id in self.tracking:
+            self._async_count_member(
+                entity_id, self.hass.states.get(entity_id))
+
+    def _mode_applies(self, count):
+        """Return if the group mode applies to count members."""
+        if self.mode is all:
+            return count == len(self._member_states)
+        return count > 0
+
     @property
     def _tracking_states(self):
         """Return the states that the group is tracking."""
@@ -546,61 +629,37 @@ class Group(Entity):
         """Update group state.
 
         Optionally you can provide the only state changed since last update
-        allowing this method to take shortcuts.
+        allowing this method to only update the counters of that member.
 
         This method must be run in the event loop.
         """
-        # To store current states of group entities. Might not be needed.
-        states = None
-        gr_state = self._state
-        gr_on = self.group_on
-        gr_off = self.group_off
-
         # We have not determined type of group yet
-        if gr_on is None:
+        if self.group_on is None:
             if tr_state is None:
                 states = self._tracking_states
-
-                for state in states:
-                    gr_on, gr_off = \
-                        _get_group_on_off(state.state)
-                    if gr_on is not None:
-                        break
             else:
-                gr_on, gr_off = _get_group_on_off(tr_state.state)
-
-            if gr_on is not None:
-                self.group_on, self.group_off = gr_on, gr_off
-
-        # We cannot determine state of the group
-        if gr_on is None:
-            return
+                states = (tr_state,)
 
-        # pylint: disable=too-many-boolean-expressions
-        if tr_state is None or ((gr_state == gr_on and
-                                 tr_state.state == gr_off) or
-                                (gr_state == gr_off and
-                                 tr_state.state == gr_on) or
-                                tr_state.state not in (gr_on, gr_off)):
-            if states is None:
-                states = self._tracking_states
-
-            if self.mode(state.state == gr_on for state in states):
-                self._state = gr_on
+            for state in states:
+                gr_on, gr_off = _get_group_on_off(state.state)
+                if gr_on is not None:
+                    self.group_on, self.group_off = gr_on, gr_off
+                    break
             else:
-                self._state = gr_off
+                # We cannot determine state of the group
+                return
 
-        elif tr_state.state in (gr_on, gr_off):
-            self._state = tr_state.state
+            # Members were not counted against the on state yet
+            tr_state = None
 
-        if tr_state is None or self._assumed_state and \
-           not tr_state.attributes.get(ATTR_ASSUMED_STATE):
-            if states is None:
-                states = self._tracking_states
+        if tr_state is None:
+            self._async_count_members()
+        else:
+            self._async_count_member(tr_state.entity_id, tr_state)
 
-            self._assumed_state = self.mode(
-                state.attributes.get(ATTR_ASSUMED_STATE) for state
-                in states)
+        if self._mode_applies(self._on_count):
+            self._state = self.group_on
+        else:
+            self._state = self.group_off
 
-        elif tr_state.attributes.get(ATTR_ASSUMED_STATE):
-            self._assumed_state = True
+        self._assumed_state = self._mode_applies(self._assumed_count)
@@ -30,6 +30,9 @@ CONFIG_SCHEMA = vol.Schema({
 SIGNIFICANT_DOMAINS = ('thermostat', 'climate', 'water_heater')
 IGNORE_DOMAINS = ('zone', 'scene',)
 
+# Number of rows fetched at once when streaming states
+STREAM_BATCH_SIZE = 500
+
 
 def get_significant_states(hass, start_time, end_time=None, entity_ids=None,
                            filters=None, include_start_time_state=True):
@@ -41,21 +44,12 @@ def get_significant_states(hass, start_time, end_time=None, entity_ids=None,
     thermostat so that we get current temperature in our graphs).
     """
     timer_start = time.perf_counter()
-    from homeassistant.components.recorder.models import States
 
     with session_scope(hass=hass) as session:
-        query = session.query(States).filter(
-            (States.domain.in_(SIGNIFICANT_DOMAINS) |
-             (States.last_changed == States.last_updated)) &
-            (States.last_updated > start_time))
+        query = _significant_states_query(
+            session, start_time, end_time, entity_ids, filters)
 
-        if filters:
-            query = filters.apply(query, entity_ids)
-
-        if end_time is not None:
-            query = query.filter(States.last_updated < end_time)
-
-        query = query.order_by(States.last_updated)
+        query = query.order_by(*_order_by(entity_ids))
 
         states = (
             state for state in execute(query)
@@ -72,6 +66,98 @@ def get_significant_states(hass, start_time, end_time=None, entity_ids=None,
         include_start_time_state)
 
 
+def stream_significant_states(hass, start_time, end_time=None,
+                              entity_ids=None, filters=None,
+                              include_start_time_state=True,
+                              entity_order=()):
+    """Yield the significant states of every entity during a period.
+
+    Works like get_significant_states, but yields a generator of states for
+    every entity, so the states are never kept in memory all at once. Each
+    generator has to be consumed before the next one is requested. Entities
+    in entity_order are returned first, in that order.
+    """
+    from sqlalchemy import case
+    from homeassistant.components.recorder.models import States
+
+    start_states = {}
+    if include_start_time_state:
+        for state in get_states(hass, start_time, entity_ids, filters=filters):
+            state.last_changed = start_time
+            state.last_updated = start_time
+            start_states[state.entity_id] = state
+
+    ranks = {entity_id: rank for rank, entity_id in enumerate(entity_order)}
+    # Entities to return first that may not have changed during the period
+    ranked_start_states = sorted(
+        (ranks[entity_id], entity_id) for entity_id in start_states
+        if entity_id in ranks)
+    ranked_start_states.reverse()
+
+    def unchanged_before(rank):
+        """Yield the ranked entities before rank without changes."""
+        while ranked_start_states and ranked_start_states[-1][0] < rank:
+            _, entity_id = ranked_start_states.pop()
+            if entity_id in start_states:
+                yield _entity_states(start_states.pop(entity_id), ())
+
+    with session_scope(hass=hass) as session:
+        query = _significant_states_query(
+            session, start_time, end_time, entity_ids, filters)
+
+        order_by = [States.entity_id, States.last_updated]
+        if ranks:
+            order_by.insert(0, case(
+                [(States.entity_id == entity_id, rank)
+                 for entity_id, rank in ranks.items()],
+                else_=len(ranks)))
+
+        states = (
+            state for state in
+            (row.to_native() for row in
+             query.order_by(*order_by).yield_per(STREAM_BATCH_SIZE))
+            if (state is not None and _is_significant(state) and
+                not state.attributes.get(ATTR_HIDDEN, False)))
+
+        for entity_id, group in groupby(states, lambda state: state.entity_id):
+            yield from unchanged_before(ranks.get(entity_id, len(ranks)))
+            yield _entity_states(start_states.pop(entity_id, None), group)
+
+    yield from unchanged_before(len(ranks))
+
+    for state in start_states.values():
+        yield _entity_states(state, ())
+
+
+def _entity_states(start_state, states):
+    """Yield the state at the start of the period and its changes."""
+    if start_state is not None:
+        yield start_state
+
+    yield from states
+
+
+def _significant_states_query(session, start_time, end_time, entity_ids,
+                              filters):
+    """Return the query for significant states during a period."""
+    from homeassistant.components.recorder.models import States
+
+    query = session.query(States).filter(
+        (States.domain.in_(SIGNIFICANT_DOMAINS) |
+         (States.last_changed == States.last_updated)) &
+        (States.last_updated > start_time))
+
+    if filters:
+        query = filters.apply(query, entity_ids)
+    elif entity_ids is not None:
+        query = query.filter(States.entity_id.in_(entity_ids))
+
+    if end_time is not None:
+        query = query.filter(States.last_updated < end_time)
+
+    return query
+
+
 def state_changes_during_period(hass, start_time, end_time=None,
                                 entity_id=None):
     """Return states changes during UTC period start_time - end_time."""
@@ -91,7 +177,7 @@ def state_changes_during_period(hass, start_time, end_time=None,
         entity_ids = [entity_id] if entity_id is not None else None
 
         states = execute(
-            query.order_by(States.last_updated))
+            query.order_by(*_order_by(entity_ids)))
 
     return states_to_json(hass, states, start_time, entity_ids)
 
@@ -112,7 +198,9 @@ def get_last_state_changes(hass, number_of_states, entity_id):
         entity_ids = [entity_id] if entity_id is not None else None
 
         states = execute(
-            query.order_by(States.last_updated.desc()).limit(number_of_states))
+            query.order_by(*(
+                column.desc() for column in _order_by(entity_ids))
+            ).limit(number_of_states))
 
     return states_to_json(hass, reversed(states),
                           start_time,
@@ -120,10 +208,26 @@ def get_last_state_changes(hass, number_of_states, entity_id):
                           include_start_time_state=False)
 
 
+def _order_by(entity_ids):
+    """Return the columns to order states of entity_ids chronologically.
+
+    When the entities are known, ordering by entity_id first lets the
+    database walk the (entity_id, last_updated) index instead of sorting all
+    matching states by last_updated.
+    """
+    from homeassistant.components.recorder.models import States
+
+    if entity_ids is None:
+        return (States.last_updated,)
+
+    return (States.entity_id, States.last_updated)
+
+
 def get_states(hass, utc_point_in_time, entity_ids=None, run=None,
                filters=None):
     """Return the states at a specific point in time."""
-    from homeassistant.components.recorder.models import States
+    from homeassistant.components.recorder.models import (
+        States, StateSnapshots)
 
     if run is None:
         run = recorder.run_information(hass, utc_point_in_time)
@@ -135,6 +239,8 @@ def get_states(hass, utc_point_in_time, entity_ids=None, run=None,
     from sqlalchemy import and_, func
 
     with session_scope(hass=hass) as session:
+        snapshot_time = None
+
         if entity_ids and len(entity_ids) == 1:
             # Use an entirely different (and extremely fast) query if we only
             # have a single entity id
@@ -151,18 +257,24 @@ def get_states(hass, utc_point_in_time, entity_ids=None, run=None,
         else:
             # We have more than one entity to look at (most commonly we want
             # all entities,) so we need to do a search on all states since the
-            # last recorder run started.
+            # last snapshot of the recorder run, or since the run started.
+            snapshot_time = session.query(
+                func.max(StateSnapshots.snapshot_time)
+            ).filter(
+                (StateSnapshots.snapshot_time >= run.start) &
+                (StateSnapshots.snapshot_time < utc_point_in_time)
+            ).scalar()
 
             most_recent_states_by_date = session.query(
                 States.entity_id.label('max_entity_id'),
                 func.max(States.last_updated).label('max_last_updated')
             ).filter(
-                (States.last_updated >= run.start) &
+                (States.last_updated >= (snapshot_time or run.start)) &
                 (States.last_updated < utc_point_in_time)
             )
 
             if entity_ids:
-                most_recent_states_by_date.filter(
+                most_recent_states_by_date = most_recent_states_by_date.filter(
                     States.entity_id.in_(entity_ids))
 
             most_recent_states_by_date = most_recent_states_by_date.group_by(
@@ -180,20 +292,54 @@ def get_states(hass, utc_point_in_time, entity_ids=None, run=None,
             most_recent_state_ids = most_recent_state_ids.group_by(
                 States.entity_id)
 
-        most_recent_state_ids = most_recent_state_ids.subquery()
+        states = {}
+
+        if snapshot_time is not None:
+            # States that did not change since the snapshot
+            snapshot_state_ids = session.query(
+                func.max(States.state_id).label('max_state_id')
+            ).join(StateSnapshots, and_(
+                States.entity_id == StateSnapshots.entity_id,
+                States.last_updated == StateSnapshots.last_updated)
+            ).filter(
+                StateSnapshots.snapshot_time == snapshot_time
+            )
+
+            if entity_ids:
+                snapshot_state_ids = snapshot_state_ids.filter(
+                    StateSnapshots.entity_id.in_(entity_ids))
+
+            snapshot_state_ids = snapshot_state_ids.group_by(States.entity_id)
 
-        query = session.query(States).join(
-            most_recent_state_ids,
-            States.state_id == most_recent_state_ids.c.max_state_id
-        ).filter((~States.domain.in_(IGNORE_DOMAINS)))
+            for state in _get_states_by_id(
+                    session, snapshot_state_ids, entity_ids, filters):
+                states[state.entity_id] = state
 
-        if filters:
-            query = filters.apply(query, entity_ids)
+        for state in _get_states_by_id(
+                session, most_recent_state_ids, entity_ids, filters):
+            states[state.entity_id] = state
 
-        return [state for state in execute(query)
+        return [state for state in states.values()
                 if not state.attributes.get(ATTR_HIDDEN, False)]
 
 
+def _get_states_by_id(session, state_ids, entity_ids, filters):
+    """Return the states selected by the state_ids query."""
+    from homeassistant.components.recorder.models import States
+
+    state_ids = state_ids.subquery()
+
+    query = session.query(States).join(
+        state_ids,
+        States.state_id == state_ids.c.max_state_id
+    ).filter((~States.domain.in_(IGNORE_DOMAINS)))
+
+    if filters:
+        query = filters.apply(query, entity_ids)
+
+    return execute(query)
+
+
 def states_to_json(
         hass,
         states,
@@ -306,30 +452,21 @@ class HistoryPeriodView(HomeAssistantView):
 
         hass = request.app['hass']
 
-        result = await hass.async_add_job(
-            get_significant_states, hass, start_time, end_time,
-            entity_ids, self.filters, include_start_time_state)
-        result = list(result.values())
+        # Optionally order the result to respect the ordering given
+        # by any entities explicitly included in the configuration.
+        entity_order = ()
+        if self.use_include_order:
+            entity_order = self.filters.included_entities
+
+        response = await self.json_stream(
+            request, stream_significant_states, hass, start_time, end_time,
+            entity_ids, self.filters, include_start_time_state, entity_order)
+
         if _LOGGER.isEnabledFor(logging.DEBUG):
             elapsed = time.perf_counter() - timer_start
-            _LOGGER.debug(
-                'Extracted %d states in %fs', sum(map(len, result)), elapsed)
-
-        # Optionally reorder the result to respect the ordering given
-        # by any entities explicitly included in the configuration.
+            _LOGGER.debug('Streamed history in %fs', elapsed)
 
-        if self.use_include_order:
-            sorted_result = []
-            for order_entity in self.filters.included_entities:
-                for state_list in result:
-                    if state_list[0].entity_id == order_entity:
-                        sorted_result.append(state_list)
-                        result.remove(state_list)
-                        break
-            sorted_result.extend(result)
-            result = sorted_result
-
-        return await hass.async_add_job(self.json, result)
+        return response
 
 
 class Filters:
@@ -1,9 +1,13 @@
 """Ban logic for HTTP component."""
-from collections import defaultdict
-from datetime import datetime
-from ipaddress import ip_address
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from ipaddress import (
+    IPv4Address, IPv4Network, IPv6Address, IPv6Network, ip_address,
+    ip_network)
 import logging
 import os
+from typing import (  # noqa: F401
+    Dict, Iterable, Iterator, List, Set, Tuple, Union)
 
 from aiohttp.web import middleware
 from aiohttp.web_exceptions import HTTPForbidden, HTTPUnauthorized
@@ -13,12 +17,15 @@ from homeassistant.config import load_yaml_config_file
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
+import homeassistant.util.dt as dt_util
 from homeassistant.util.yaml import dump
 
 from .const import KEY_REAL_IP
 
 _LOGGER = logging.getLogger(__name__)
 
+IpAddress = Union[IPv4Address, IPv6Address]
+
 KEY_BANNED_IPS = 'ha_banned_ips'
 KEY_FAILED_LOGIN_ATTEMPTS = 'ha_failed_login_attempts'
 KEY_LOGIN_THRESHOLD = 'ha_login_threshold'
@@ -29,6 +36,11 @@ NOTIFICATION_ID_LOGIN = 'http-login'
 IP_BANS_FILE = 'ip_bans.yaml'
 ATTR_BANNED_AT = 'banned_at'
 
+# Failed login attempts are forgotten after this time or when more than
+# MAX_LOGIN_ATTEMPTS_TRACKED addresses failed to login.
+LOGIN_ATTEMPTS_EXPIRATION = timedelta(hours=24)
+MAX_LOGIN_ATTEMPTS_TRACKED = 10000
+
 SCHEMA_IP_BAN_ENTRY = vol.Schema({
     vol.Optional('banned_at'): vol.Any(None, cv.datetime)
 })
@@ -38,13 +50,13 @@ SCHEMA_IP_BAN_ENTRY = vol.Schema({
 def setup_bans(hass, app, login_threshold):
     """Create IP Ban middleware for the app."""
     app.middlewares.append(ban_middleware)
-    app[KEY_FAILED_LOGIN_ATTEMPTS] = defaultdict(int)
+    app[KEY_FAILED_LOGIN_ATTEMPTS] = LoginAttempts()
     app[KEY_LOGIN_THRESHOLD] = login_threshold
 
     async def ban_startup(app):
         """Initialize bans when app starts up."""
-        app[KEY_BANNED_IPS] = await async_load_ip_bans_config(
-            hass, hass.config.path(IP_BANS_FILE))
+        app[KEY_BANNED_IPS] = IpBanList(await async_load_ip_bans_config(
+            hass, hass.config.path(IP_BANS_FILE)))
 
     app.on_startup.append(ban_startup)
 
@@ -57,11 +69,7 @@ async def ban_middleware(request, handler):
         return await handler(request)
 
     # Verify if IP is not banned
-    ip_address_ = request[KEY_REAL_IP]
-    is_banned = any(ip_ban.ip_address == ip_address_
-                    for ip_ban in request.app[KEY_BANNED_IPS])
-
-    if is_banned:
+    if request[KEY_REAL_IP] in request.app[KEY_BANNED_IPS]:
         raise HTTPForbidden()
 
     try:
@@ -103,14 +111,14 @@ async def process_wrong_login(request):
             request.app[KEY_LOGIN_THRESHOLD] < 1):
         return
 
-    request.app[KEY_FAILED_LOGIN_ATTEMPTS][remote_addr] += 1
+    attempts = request.app[KEY_FAILED_LOGIN_ATTEMPTS].increment(remote_addr)
 
-    if (request.app[KEY_FAILED_LOGIN_ATTEMPTS][remote_addr] >=
-            request.app[KEY_LOGIN_THRESHOLD]):
+    if attempts >= request.app[KEY_LOGIN_THRESHOLD]:
         new_ban = IpBan(remote_addr)
-        request.app[KEY_BANNED_IPS].append(new_ban)
+        request.app[KEY_BANNED_IPS].add(new_ban)
+        request.app[KEY_FAILED_LOGIN_ATTEMPTS].pop(remote_addr)
 
-        await hass.async_add_job(
+        await hass.async_add_executor_job(
             update_ip_bans_config, hass.config.path(IP_BANS_FILE), new_ban)
 
         _LOGGER.warning(
@@ -135,22 +143,128 @@ async def process_success_login(request):
             request.app[KEY_LOGIN_THRESHOLD] < 1):
         return
 
-    if remote_addr in request.app[KEY_FAILED_LOGIN_ATTEMPTS] and \
-            request.app[KEY_FAILED_LOGIN_ATTEMPTS][remote_addr] > 0:
+    if remote_addr in request.app[KEY_FAILED_LOGIN_ATTEMPTS]:
         _LOGGER.debug('Login success, reset failed login attempts counter'
                       ' from %s', remote_addr)
         request.app[KEY_FAILED_LOGIN_ATTEMPTS].pop(remote_addr)
 
 
 class IpBan:
-    """Represents banned IP address."""
+    """Represents banned IP address or network."""
 
     def __init__(self, ip_ban: str, banned_at: datetime = None) -> None:
         """Initialize IP Ban object."""
-        self.ip_address = ip_address(ip_ban)
+        try:
+            self.ip_address = ip_address(ip_ban)
+        except ValueError:
+            self.ip_address = ip_network(ip_ban, strict=False)
         self.banned_at = banned_at or datetime.utcnow()
 
 
+class IpBanList:
+    """Banned IP addresses and networks with constant time lookups.
+
+    Banned networks are kept in one set per prefix length, so an address is
+    checked by masking it once for every prefix length in use.
+    """
+
+    def __init__(self, ip_bans: Iterable[IpBan] = ()) -> None:
+        """Initialize the IP ban list."""
+        self._ip_bans = []  # type: List[IpBan]
+        self._addresses = set()  # type: Set[IpAddress]
+        self._networks = {}  # type: Dict[Tuple[int, int], Set[int]]
+        for ip_ban in ip_bans:
+            self.add(ip_ban)
+
+    def __len__(self) -> int:
+        """Return the number of bans."""
+        return len(self._ip_bans)
+
+    def __iter__(self) -> Iterator[IpBan]:
+        """Iterate over the bans."""
+        return iter(self._ip_bans)
+
+    def __contains__(self, address: IpAddress) -> bool:
+        """Return if an IP address is banned."""
+        if address in self._addresses:
+            return True
+
+        for (version, prefixlen), networks in self._networks.items():
+            if version != address.version:
+                continue
+            shift = address.max_prefixlen - prefixlen
+            if int(address) >> shift in networks:
+                return True
+
+        return False
+
+    def add(self, ip_ban: IpBan) -> None:
+        """Add a ban."""
+        self._ip_bans.append(ip_ban)
+        banned = ip_ban.ip_address
+
+        if not isinstance(banned, (IPv4Network, IPv6Network)):
+            self._addresses.add(banned)
+            return
+
+        shift = banned.max_prefixlen - banned.prefixlen
+        self._networks.setdefault(
+            (banned.version, banned.prefixlen), set()).add(
+                int(banned.network_address) >> shift)
+
+
+class LoginAttempts:
+    """Failed login attempts per IP address.
+
+    Counters expire LOGIN_ATTEMPTS_EXPIRATION after the last failed attempt
+    and only the MAX_LOGIN_ATTEMPTS_TRACKED most recent addresses are kept.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the failed login attempts."""
+        # Address to failed attempts and time of the last one, least recent
+        # attempt first.
+        self._attempts = \
+            OrderedDict()  # type: OrderedDict[IpAddress, Tuple[int, datetime]]
+
+    def __contains__(self, address: IpAddress) -> bool:
+        """Return if there are failed attempts for an address."""
+        return self[address] > 0
+
+    def __getitem__(self, address: IpAddress) -> int:
+        """Return the number of failed attempts for an address."""
+        attempts = self._attempts.get(address)
+
+        if attempts is None:
+            return 0
+
+        if attempts[1] < dt_util.utcnow() - LOGIN_ATTEMPTS_EXPIRATION:
+            self._attempts.pop(address)
+            return 0
+
+        return attempts[0]
+
+    def increment(self, address: IpAddress) -> int:
+        """Record a failed attempt and return the failed attempts."""
+        count = self[address] + 1
+        self._attempts.pop(address, None)
+        self._attempts[address] = (count, dt_util.utcnow())
+
+        expired = dt_util.utcnow() - LOGIN_ATTEMPTS_EXPIRATION
+        while self._attempts:
+            _, (_, last_attempt) = next(iter(self._attempts.items()))
+            if (len(self._attempts) <= MAX_LOGIN_ATTEMPTS_TRACKED and
+                    last_attempt >= expired):
+                break
+            self._attempts.popitem(last=False)
+
+        return count
+
+    def pop(self, address: IpAddress) -> None:
+        """Forget the failed attempts for an address."""
+        self._attempts.pop(address, None)
+
+
 async def async_load_ip_bans_config(hass: HomeAssistant, path: str):
     """Load list of banned IPs from config file."""
     ip_list = []
@@ -171,6 +285,9 @@ async def async_load_ip_bans_config(hass: HomeAssistant, path: str):
         except vol.Invalid as err:
             _LOGGER.error("Failed to load IP ban %s: %s", ip_info, err)
             continue
+        except ValueError as err:
+            _LOGGER.error("Failed to load IP ban %s: %s", ip_ban, err)
+            continue
 
     return ip_list
 
@@ -2,6 +2,8 @@
 import asyncio
 import json
 import logging
+import threading
+from types import GeneratorType
 
 from aiohttp import web
 from aiohttp.web_exceptions import (
@@ -18,6 +20,11 @@ from .const import KEY_AUTHENTICATED, KEY_HASS, KEY_REAL_IP
 
 _LOGGER = logging.getLogger(__name__)
 
+# Size in bytes at which serialized JSON is written to a streamed response
+STREAM_CHUNK_SIZE = 65536
+# Chunks that can be serialized ahead of the client
+STREAM_MAX_PENDING_CHUNKS = 4
+
 
 class HomeAssistantView:
     """Base view for all views."""
@@ -46,43 +53,117 @@ class HomeAssistantView:
         except (ValueError, TypeError) as err:
             _LOGGER.error('Unable to serialize to JSON: %s\n%s', err, result)
             raise HTTPInternalServerError
+        return self.json_raw(msg, status_code, headers)
+
+    def json_raw(self, msg, status_code=200, headers=None):
+        """Return a response with JSON that is already serialized."""
+        if isinstance(msg, str):
+            msg = msg.encode('UTF-8')
         response = web.Response(
             body=msg, content_type=CONTENT_TYPE_JSON, status=status_code,
             headers=headers)
         response.enable_compression()
         return response
 
-    def json_message(self, message, status_code=200, message_code=None,
-                     headers=None):
-        """Return a JSON message response."""
-        data = {'message': message}
-        if message_code is not None:
-            data['code'] = message_code
-        return self.json(data, status_code, headers=headers)
+    async def json_stream(self, request, produce, *args):
+        """Stream the items returned by produce as a JSON array.
+
+        produce is called with args in the executor and returns an iterable.
+        The items are serialized and sent in chunks while it is consumed, so
+        the complete result is never kept in memory. Items that are
+        generators are streamed as nested arrays.
+
+        The response is only prepared once the first chunk is serialized, so
+        errors before that still return a 500. Later errors abort the
+        connection, as the client could not tell a truncated array apart.
+        """
+        hass = request.app[KEY_HASS]
+        chunks = asyncio.Queue(loop=hass.loop)
+        slots = threading.Semaphore(STREAM_MAX_PENDING_CHUNKS)
+        stopped = threading.Event()
+
+        def produce_chunks():
+            """Serialize the items and hand the chunks to the event loop."""
+            try:
+                for chunk in _json_array_chunks(produce(*args)):
+                    slots.acquire()
+                    if stopped.is_set():
+                        return
+                    hass.loop.call_soon_threadsafe(chunks.put_nowait, chunk)
+            except Exception as err:  # pylint: disable=broad-except
+                hass.loop.call_soon_threadsafe(chunks.put_nowait, err)
+            finally:
+                hass.loop.call_soon_threadsafe(chunks.put_nowait, None)
+
+        producer = hass.async_add_executor_job(produce_chunks)
+        response = None
+
+        try:
+            while True:
+                chunk = await chunks.get()
+                if chunk is None:
+                    break
+
+                if isinstance(chunk, Exception):
+                    _LOGGER.error("Error streaming JSON for %s: %s",
+                                  request.path, chunk, exc_info=chunk)
+                    if response is None:
+                        raise HTTPInternalServerError
+                    if request.transport is not None:
+                        request.transport.abort()
+                    return response
+
+                if response is None:
+                    response = web.StreamResponse()
+                    response.content_type = CONTENT_TYPE_JSON
+                    response.enable_compression()
+                    await response.prepare(request)
+
+                await response.write(chunk)
+                slots.release()
+        finally:
+            # Unblock the producer if the client went away
+            stopped.set()
+            slots.release()
+
+        await producer
+        await response.write_eof()
+        return response
+
+
+def _json_array_chunks(items):
+    """Serialize items as a JSON array and yield it in encoded chunks."""
+    parts = []
+    size = 0
+
+    for part in _iter_json_array(items):
+        parts.append(part)
+        size += len(part)
 
-    def register(self, app, router):
-        """Register the view with a router."""
-        assert self.url is not None, 'No url set for view'
-        urls = [self.url] + self.extra_urls
-        routes = []
+        if size >= STREAM_CHUNK_SIZE:
+            yield ''.join(parts).encode('UTF-8')
+            parts = []
+            size = 0
 
-        for method in ('get', 'post', 'delete', 'put', 'patch', 'head',
-                       'options'):
-            handler = getattr(self, method, None)
+    yield ''.join(parts).encode('UTF-8')
 
-            if not handler:
-                continue
 
-            handler = request_handler_factory(self, handler)
+def _iter_json_array(items):
+    """Yield the JSON of a list of items in parts."""
+    yield '['
+    separator = ''
 
-            for url in urls:
-                routes.append(router.add_route(method, url, handler))
+    for item in items:
+        yield separator
+        separator = ','
 
-        if not self.cors_allowed:
-            return
+        if isinstance(item, GeneratorType):
+            yield from _iter_json_array(item)
+        else:
+            yield json.dumps(
+                item, sort_keys=True, cls=JSONEncoder, allow_nan=False)
 
-        for route in routes:
-            app['allow_cors'](route)
+    yield ']'
 
 
 def request_handler_factory(view, handler):
@@ -1,7 +1,9 @@
 """Event parser and human readable log generator."""
 from datetime import timedelta
 from itertools import groupby
+import json
 import logging
+from types import MappingProxyType
 
 import voluptuous as vol
 
@@ -15,7 +17,7 @@ from homeassistant.const import (
     EVENT_AUTOMATION_TRIGGERED, EVENT_SCRIPT_STARTED, HTTP_BAD_REQUEST,
     STATE_NOT_HOME, STATE_OFF, STATE_ON)
 from homeassistant.core import (
-    DOMAIN as HA_DOMAIN, State, callback, split_entity_id)
+    DOMAIN as HA_DOMAIN, Context, State, callback, split_entity_id)
 from homeassistant.components.alexa.smart_home import EVENT_ALEXA_SMART_HOME
 from homeassistant.components.homekit.const import (
     ATTR_DISPLAY_NAME, ATTR_VALUE, DOMAIN as DOMAIN_HOMEKIT,
@@ -142,12 +144,9 @@ class LogbookView(HomeAssistantView):
         end_day = start_day + timedelta(days=period)
         hass = request.app['hass']
 
-        def json_events():
-            """Fetch events and generate JSON."""
-            return self.json(
-                _get_events(hass, self.config, start_day, end_day, entity_id))
-
-        return await hass.async_add_job(json_events)
+        return await self.json_stream(
+            request, _stream_events, hass, self.config, start_day, end_day,
+            entity_id)
 
 
 def humanify(hass, events):
@@ -334,22 +333,26 @@ def humanify(hass, events):
                 }
 
 
-def _get_related_entity_ids(session, entity_filter):
+def _get_related_entity_ids(hass, session):
+    """Return the entity ids that have recorded states."""
+    from homeassistant.components.recorder.const import DATA_INSTANCE
     from homeassistant.components.recorder.models import States
     from homeassistant.components.recorder.util import \
         RETRIES, QUERY_RETRY_WAIT
     from sqlalchemy.exc import SQLAlchemyError
     import time
 
+    instance = hass.data.get(DATA_INSTANCE)
+    if instance is not None and instance.entity_ids is not None:
+        return instance.entity_ids
+
     timer_start = time.perf_counter()
 
     query = session.query(States).with_entities(States.entity_id).distinct()
 
     for tryno in range(0, RETRIES):
         try:
-            result = [
-                row.entity_id for row in query
-                if entity_filter(row.entity_id)]
+            result = [row.entity_id for row in query]
 
             if _LOGGER.isEnabledFor(logging.DEBUG):
                 elapsed = time.perf_counter() - timer_start
@@ -367,6 +370,30 @@ def _get_related_entity_ids(session, entity_filter):
             time.sleep(QUERY_RETRY_WAIT)
 
 
+def _entity_ids_clause(hass, session, entities_filter):
+    """Return the SQL clause to filter states by the configured entities.
+
+    Return None if the filter keeps all entities. The clause only narrows
+    down the query, the events are still checked with _keep_event.
+    """
+    from homeassistant.components.recorder.models import States
+
+    kept, excluded = [], []
+    for entity_id in _get_related_entity_ids(hass, session):
+        if entities_filter(entity_id):
+            kept.append(entity_id)
+        else:
+            excluded.append(entity_id)
+
+    if not excluded:
+        return None
+
+    if len(excluded) < len(kept):
+        return ~States.entity_id.in_(excluded)
+
+    return States.entity_id.in_(kept)
+
+
 def _generate_filter_from_config(config):
     from homeassistant.helpers.entityfilter import generate_filter
 
@@ -390,6 +417,11 @@ def _generate_filter_from_config(config):
 
 def _get_events(hass, config, start_day, end_day, entity_id=None):
     """Get events for a period of time."""
+    return list(_stream_events(hass, config, start_day, end_day, entity_id))
+
+
+def _stream_events(hass, config, start_day, end_day, entity_id=None):
+    """Yield the logbook entries for a period of time."""
     from homeassistant.components.recorder.models import Events, States
     from homeassistant.components.recorder.util import session_scope
 
@@ -398,26 +430,102 @@ def _get_events(hass, config, start_day, end_day, entity_id=None):
     def yield_events(query):
         """Yield Events that are not filtered away."""
         for row in query.yield_per(500):
-            event = row.to_native()
+            event = LazyEvent(row)
             if _keep_event(event, entities_filter):
                 yield event
 
     with session_scope(hass=hass) as session:
         if entity_id is not None:
-            entity_ids = [entity_id.lower()]
+            entity_ids_clause = States.entity_id == entity_id.lower()
         else:
-            entity_ids = _get_related_entity_ids(session, entities_filter)
-
-        query = session.query(Events).order_by(Events.time_fired) \
+            entity_ids_clause = _entity_ids_clause(
+                hass, session, entities_filter)
+
+        states_clause = States.last_updated == States.last_changed
+        if entity_ids_clause is not None:
+            states_clause = states_clause & entity_ids_clause
+
+        query = session.query(
+            Events.event_type, Events.event_data, Events.time_fired,
+            Events.context_id, Events.context_user_id, States.state_id,
+            States.entity_id, States.state, States.attributes,
+            States.last_changed, States.last_updated) \
+            .order_by(Events.time_fired) \
             .outerjoin(States, (Events.event_id == States.event_id)) \
             .filter(Events.event_type.in_(ALL_EVENT_TYPES)) \
             .filter((Events.time_fired > start_day)
                     & (Events.time_fired < end_day)) \
-            .filter(((States.last_updated == States.last_changed) &
-                     States.entity_id.in_(entity_ids))
-                    | (States.state_id.is_(None)))
+            .filter(states_clause | (States.state_id.is_(None)))
+
+        yield from humanify(hass, yield_events(query))
+
 
-        return list(humanify(hass, yield_events(query)))
+class LazyEvent:
+    """An event read from the database that decodes its data on demand.
+
+    The data of state changed events is built from the joined state, so the
+    JSON holding both the old and the new state is not decoded.
+    """
+
+    def __init__(self, row):
+        """Initialize the event from a logbook query row."""
+        from homeassistant.components.recorder.models import \
+            _process_timestamp
+
+        self._row = row
+        self._data = None
+        self.event_type = row.event_type
+        self.time_fired = _process_timestamp(row.time_fired)
+        self.context = Context(id=row.context_id, user_id=row.context_user_id)
+
+    @property
+    def data(self):
+        """Return the event data.
+
+        The old state of a state changed event is not decoded. It is a
+        read-only mapping holding only the entity id, as the logbook only
+        checks that there is an old state.
+        """
+        if self._data is None:
+            self._data = self._decode_data()
+        return self._data
+
+    def _decode_data(self):
+        """Decode the event data."""
+        from homeassistant.components.recorder.models import \
+            _process_timestamp
+
+        row = self._row
+        event_data = row.event_data
+
+        # Events of new and removed entities are decoded completely. They
+        # are rare and the check can also match nested attributes.
+        if (self.event_type != EVENT_STATE_CHANGED or row.state_id is None or
+                '"old_state": null' in event_data or
+                '"new_state": null' in event_data):
+            try:
+                return json.loads(event_data)
+            except ValueError:
+                _LOGGER.exception("Error decoding event data: %s", event_data)
+                return {}
+
+        try:
+            attributes = json.loads(row.attributes)
+        except ValueError:
+            _LOGGER.exception("Error decoding attributes: %s", row.attributes)
+            attributes = {}
+
+        return {
+            'entity_id': row.entity_id,
+            'old_state': MappingProxyType({'entity_id': row.entity_id}),
+            'new_state': {
+                'entity_id': row.entity_id,
+                'state': row.state,
+                'attributes': attributes,
+                'last_changed': _process_timestamp(row.last_changed),
+                'last_updated': _process_timestamp(row.last_updated),
+            },
+        }
 
 
 def _keep_event(event, entities_filter):
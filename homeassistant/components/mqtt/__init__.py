@@ -2,15 +2,17 @@
 import asyncio
 from functools import partial, wraps
 import inspect
-from itertools import groupby
+from itertools import chain, groupby
 import json
 import logging
 from operator import attrgetter
 import os
 import socket
 import ssl
+import threading
 import time
-from typing import Any, Callable, List, Optional, Union, cast  # noqa: F401
+from typing import (  # noqa: F401
+    Any, Callable, Dict, List, Optional, Union, cast)
 
 import attr
 import requests.certs
@@ -642,12 +644,18 @@ class MQTT:
                  tls_version: Optional[int]) -> None:
         """Initialize Home Assistant MQTT client."""
         import paho.mqtt.client as mqtt
+        from paho.mqtt.matcher import MQTTMatcher
 
         self.hass = hass
         self.broker = broker
         self.port = port
         self.keepalive = keepalive
         self.subscriptions = []  # type: List[Subscription]
+        # Topic trie mapping topic filters to their subscriptions
+        self._matching_subscriptions = MQTTMatcher()
+        # Messages received by the paho thread, waiting to be handled
+        self._pending_messages = []  # type: List[Any]
+        self._pending_lock = threading.Lock()
         self.birth_message = birth_message
         self.connected = False
         self._mqttc = None  # type: mqtt.Client
@@ -737,18 +745,14 @@ class MQTT:
             raise HomeAssistantError("Topic needs to be a string!")
 
         subscription = Subscription(topic, msg_callback, qos, encoding)
-        self.subscriptions.append(subscription)
+        self._async_add_subscription(subscription)
 
         await self._async_perform_subscription(topic, qos)
 
         @callback
         def async_remove() -> None:
             """Remove subscription."""
-            if subscription not in self.subscriptions:
-                raise HomeAssistantError("Can't remove subscription twice")
-            self.subscriptions.remove(subscription)
-
-            if any(other.topic == topic for other in self.subscriptions):
+            if not self._async_remove_subscription(subscription):
                 # Other subscriptions on topic remaining - don't unsubscribe.
                 return
 
@@ -758,6 +762,36 @@ class MQTT:
 
         return async_remove
 
+    @callback
+    def _async_add_subscription(self, subscription: Subscription) -> None:
+        """Add a subscription to the subscriptions and the topic trie."""
+        self.subscriptions.append(subscription)
+
+        try:
+            self._matching_subscriptions[subscription.topic].append(
+                subscription)
+        except KeyError:
+            self._matching_subscriptions[subscription.topic] = [subscription]
+
+    @callback
+    def _async_remove_subscription(self, subscription: Subscription) -> bool:
+        """Remove a subscription.
+
+        Return if it was the last subscription on its topic.
+        """
+        if subscription not in self.subscriptions:
+            raise HomeAssistantError("Can't remove subscription twice")
+        self.subscriptions.remove(subscription)
+
+        topic_subscriptions = self._matching_subscriptions[subscription.topic]
+        topic_subscriptions.remove(subscription)
+
+        if topic_subscriptions:
+            return False
+
+        del self._matching_subscriptions[subscription.topic]
+        return True
+
     async def _async_unsubscribe(self, topic: str) -> None:
         """Unsubscribe from a topic.
 
@@ -809,31 +843,63 @@ class MQTT:
                 self.async_publish(*attr.astuple(self.birth_message)))
 
     def _mqtt_on_message(self, _mqttc, _userdata, msg) -> None:
-        """Message received callback."""
-        self.hass.add_job(self._mqtt_handle_message, msg)
+        """Message received callback.
+
+        Messages are buffered and handled in batches, so a flood of
+        messages only wakes up the event loop once per batch.
+        """
+        with self._pending_lock:
+            self._pending_messages.append(msg)
+            if len(self._pending_messages) > 1:
+                # A drain is already scheduled
+                return
+
+        self.hass.loop.call_soon_threadsafe(self._mqtt_handle_pending)
+
+    @callback
+    def _mqtt_handle_pending(self) -> None:
+        """Handle the messages received since the last drain."""
+        with self._pending_lock:
+            messages = self._pending_messages
+            self._pending_messages = []
+
+        for msg in messages:
+            self._mqtt_handle_message(msg)
 
     @callback
     def _mqtt_handle_message(self, msg) -> None:
         _LOGGER.debug("Received message on %s%s: %s", msg.topic,
                       " (retained)" if msg.retain else "", msg.payload)
 
-        for subscription in self.subscriptions:
-            if not _match_topic(subscription.topic, msg.topic):
-                continue
+        # Callbacks can change the subscriptions while they are dispatched
+        subscriptions = list(chain.from_iterable(
+            self._matching_subscriptions.iter_match(msg.topic)))
+
+        # Messages by encoding, None if the payload can't be decoded
+        messages = {}  # type: Dict[Optional[str], Optional[Message]]
+
+        for subscription in subscriptions:
+            encoding = subscription.encoding
 
-            payload = msg.payload  # type: SubscribePayloadType
-            if subscription.encoding is not None:
+            if encoding not in messages:
+                payload = msg.payload  # type: SubscribePayloadType
                 try:
-                    payload = msg.payload.decode(subscription.encoding)
+                    if encoding is not None:
+                        payload = msg.payload.decode(encoding)
                 except (AttributeError, UnicodeDecodeError):
                     _LOGGER.warning(
                         "Can't decode payload %s on %s with encoding %s",
-                        msg.payload, msg.topic, subscription.encoding)
-                    continue
+                        msg.payload, msg.topic, encoding)
+                    messages[encoding] = None
+                else:
+                    messages[encoding] = Message(
+                        msg.topic, payload, msg.qos, msg.retain)
+
+            message = messages[encoding]
+            if message is None:
+                continue
 
-            self.hass.async_run_job(
-                subscription.callback, Message(msg.topic, payload, msg.qos,
-                                               msg.retain))
+            self.hass.async_run_job(subscription.callback, message)
 
     def _mqtt_on_disconnect(self, _mqttc, _userdata, result_code: int) -> None:
         """Disconnected callback."""
@@ -872,18 +938,6 @@ def _raise_on_error(result_code: int) -> None:
             'Error talking to MQTT: {}'.format(mqtt.error_string(result_code)))
 
 
-def _match_topic(subscription: str, topic: str) -> bool:
-    """Test if topic matches subscription."""
-    from paho.mqtt.matcher import MQTTMatcher
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-    try:
-        next(matcher.iter_match(topic))
-        return True
-    except StopIteration:
-        return False
-
-
 class MqttAttributes(Entity):
     """Mixin used for platforms that support JSON attributes."""
 
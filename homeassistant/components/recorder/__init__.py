@@ -3,11 +3,13 @@ import asyncio
 from collections import namedtuple
 import concurrent.futures
 from datetime import datetime, timedelta
+from functools import partial
+import json
 import logging
 import queue
 import threading
 import time
-from typing import Any, Dict, Optional  # noqa: F401
+from typing import Any, Dict, FrozenSet, Optional  # noqa: F401
 
 import voluptuous as vol
 
@@ -18,6 +20,7 @@ from homeassistant.const import (
 from homeassistant.core import CoreState, HomeAssistant, callback
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entityfilter import generate_filter
+from homeassistant.helpers.json import JSONEncoder, dumps_data
 from homeassistant.helpers.typing import ConfigType
 import homeassistant.util.dt as dt_util
 
@@ -46,9 +49,16 @@ CONF_DB_URL = 'db_url'
 CONF_PURGE_KEEP_DAYS = 'purge_keep_days'
 CONF_PURGE_INTERVAL = 'purge_interval'
 CONF_EVENT_TYPES = 'event_types'
+CONF_COMMIT_INTERVAL = 'commit_interval'
+CONF_MAX_BATCH_SIZE = 'max_batch_size'
 
 CONNECT_RETRY_WAIT = 3
 
+DEFAULT_COMMIT_INTERVAL = 0
+DEFAULT_MAX_BATCH_SIZE = 1000
+
+SNAPSHOT_INTERVAL = timedelta(hours=1)
+
 FILTER_SCHEMA = vol.Schema({
     vol.Optional(CONF_EXCLUDE, default={}): vol.Schema({
         vol.Optional(CONF_DOMAINS): vol.All(cv.ensure_list, [cv.string]),
@@ -68,6 +78,10 @@ CONFIG_SCHEMA = vol.Schema({
         vol.Optional(CONF_PURGE_INTERVAL, default=1):
             vol.All(vol.Coerce(int), vol.Range(min=0)),
         vol.Optional(CONF_DB_URL): cv.string,
+        vol.Optional(CONF_COMMIT_INTERVAL, default=DEFAULT_COMMIT_INTERVAL):
+            vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Optional(CONF_MAX_BATCH_SIZE, default=DEFAULT_MAX_BATCH_SIZE):
+            vol.All(vol.Coerce(int), vol.Range(min=1)),
     })
 }, extra=vol.ALLOW_EXTRA)
 
@@ -98,6 +112,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     conf = config.get(DOMAIN, {})
     keep_days = conf.get(CONF_PURGE_KEEP_DAYS)
     purge_interval = conf.get(CONF_PURGE_INTERVAL)
+    commit_interval = conf.get(CONF_COMMIT_INTERVAL, DEFAULT_COMMIT_INTERVAL)
+    max_batch_size = conf.get(CONF_MAX_BATCH_SIZE, DEFAULT_MAX_BATCH_SIZE)
 
     db_url = conf.get(CONF_DB_URL, None)
     if not db_url:
@@ -108,7 +124,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     exclude = conf.get(CONF_EXCLUDE, {})
     instance = hass.data[DATA_INSTANCE] = Recorder(
         hass=hass, keep_days=keep_days, purge_interval=purge_interval,
-        uri=db_url, include=include, exclude=exclude)
+        uri=db_url, include=include, exclude=exclude,
+        commit_interval=commit_interval, max_batch_size=max_batch_size)
     instance.async_initialize()
     instance.start()
 
@@ -125,19 +142,43 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
 PurgeTask = namedtuple('PurgeTask', ['keep_days', 'repack'])
 
+# An event with its JSON columns serialized before it is queued. event_data
+# is None if the event could not be serialized, attributes is None if no
+# state has to be recorded for the event.
+RecordedEvent = namedtuple('RecordedEvent',
+                           ['event', 'event_data', 'attributes'])
+
+
+def _dumps(cached_json, obj):
+    """Return the cached JSON of an object.
+
+    The cached JSON rejects out of range floats, which the recorder always
+    stored the way the plain encoder writes them.
+    """
+    try:
+        return cached_json()
+    except ValueError:
+        return json.dumps(obj, cls=JSONEncoder)
+
 
 class Recorder(threading.Thread):
     """A threaded recorder class."""
 
     def __init__(self, hass: HomeAssistant, keep_days: int,
                  purge_interval: int, uri: str,
-                 include: Dict, exclude: Dict) -> None:
+                 include: Dict, exclude: Dict,
+                 commit_interval: int = DEFAULT_COMMIT_INTERVAL,
+                 max_batch_size: int = DEFAULT_MAX_BATCH_SIZE) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name='Recorder')
 
         self.hass = hass
         self.keep_days = keep_days
         self.purge_interval = purge_interval
+        self.commit_interval = commit_interval
+        self.max_batch_size = max_batch_size
+        self.last_commit_duration = None  # type: Optional[float]
+        self.last_commit_size = 0
         self.queue = queue.Queue()  # type: Any
         self.recording_start = dt_util.utcnow()
         self.db_url = uri
@@ -150,6 +191,16 @@ class Recorder(threading.Thread):
             exclude.get(CONF_DOMAINS, []), exclude.get(CONF_ENTITIES, []))
         self.exclude_t = exclude.get(CONF_EVENT_TYPES, [])
 
+        # Latest last_updated per entity, written to the snapshot table
+        self._snapshot_states = {}  # type: Dict[str, datetime]
+        self._snapshot_time = self.recording_start
+        self._latest_update = self.recording_start
+
+        # Entity ids that have recorded states, None until they are loaded.
+        # The set is replaced instead of updated, so other threads can use it
+        # without locking. Purged entities are not removed.
+        self.entity_ids = None  # type: Optional[FrozenSet[str]]
+
         self.get_session = None
 
     @callback
@@ -164,11 +215,15 @@ class Recorder(threading.Thread):
 
         self.queue.put(PurgeTask(keep_days, repack))
 
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of items waiting to be processed."""
+        return self.queue.qsize()
+
     def run(self):
         """Start processing events to save."""
-        from .models import States, Events
+        from .models import Events
         from homeassistant.components import persistent_notification
-        from sqlalchemy import exc
 
         tries = 1
         connected = False
@@ -180,6 +235,7 @@ class Recorder(threading.Thread):
                 self._setup_connection()
                 migration.migrate_schema(self)
                 self._setup_run()
+                self._load_entity_ids()
                 connected = True
                 _LOGGER.debug("Connected to recorder database")
             except Exception as err:  # pylint: disable=broad-except
@@ -258,8 +314,14 @@ class Recorder(threading.Thread):
 
             self.hass.helpers.event.track_point_in_time(async_purge, run)
 
+        # Tasks that were taken from the queue while filling a batch
+        pending = []
+
         while True:
-            event = self.queue.get()
+            if pending:
+                event = pending.pop()
+            else:
+                event = self.queue.get()
 
             if event is None:
                 self._close_run()
@@ -270,66 +332,219 @@ class Recorder(threading.Thread):
                 purge.purge_old_data(self, event.keep_days, event.repack)
                 self.queue.task_done()
                 continue
-            elif event.event_type == EVENT_TIME_CHANGED:
-                self.queue.task_done()
-                continue
-            elif event.event_type in self.exclude_t:
+
+            events = [event]
+            if self.commit_interval:
+                self._fill_batch(events, pending)
+
+            self._save_events(events)
+
+            for _ in events:
                 self.queue.task_done()
-                continue
 
-            entity_id = event.data.get(ATTR_ENTITY_ID)
-            if entity_id is not None:
-                if not self.entity_filter(entity_id):
-                    self.queue.task_done()
-                    continue
+    def _fill_batch(self, events, pending):
+        """Add queued events to the batch until it has to be committed.
+
+        The batch is complete when it reaches max_batch_size, when the
+        commit interval has passed since the batch was started or when a
+        task is queued. That task is added to pending so it is processed
+        after the batch.
+        """
+        deadline = time.monotonic() + self.commit_interval
+
+        while len(events) < self.max_batch_size:
+            try:
+                event = self.queue.get(
+                    timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                return
 
-            tries = 1
-            updated = False
-            while not updated and tries <= 10:
-                if tries != 1:
-                    time.sleep(CONNECT_RETRY_WAIT)
+            if event is None or isinstance(event, PurgeTask):
+                pending.append(event)
+                return
+
+            events.append(event)
+
+    def _keep_event(self, event):
+        """Return if an event should be recorded."""
+        if event.event_type == EVENT_TIME_CHANGED:
+            return False
+        if event.event_type in self.exclude_t:
+            return False
+
+        entity_id = event.data.get(ATTR_ENTITY_ID)
+        return entity_id is None or self.entity_filter(entity_id)
+
+    def _serialize_event(self, event):
+        """Serialize the JSON columns of an event into a RecordedEvent.
+
+        The JSON the states cache of themselves is reused.
+        """
+        try:
+            event_data = _dumps(partial(dumps_data, event.data), event.data)
+        except (TypeError, ValueError):
+            _LOGGER.warning("Event is not JSON serializable: %s", event)
+            event_data = None
+
+        attributes = None
+        if event.event_type == EVENT_STATE_CHANGED:
+            new_state = event.data.get('new_state')
+            if new_state is None:
+                attributes = '{}'
+            else:
                 try:
-                    with session_scope(session=self.get_session()) as session:
-                        try:
-                            dbevent = Events.from_event(event)
-                            session.add(dbevent)
-                            session.flush()
-                        except (TypeError, ValueError):
-                            _LOGGER.warning(
-                                "Event is not JSON serializable: %s", event)
-
-                        if event.event_type == EVENT_STATE_CHANGED:
-                            try:
-                                dbstate = States.from_event(event)
-                                dbstate.event_id = dbevent.event_id
-                                session.add(dbstate)
-                            except (TypeError, ValueError):
-                                _LOGGER.warning(
-                                    "State is not JSON serializable: %s",
-                                    event.data.get('new_state'))
-
-                    updated = True
-
-                except exc.OperationalError as err:
-                    _LOGGER.error("Error in database connectivity: %s. "
-                                  "(retrying in %s seconds)", err,
-                                  CONNECT_RETRY_WAIT)
-                    tries += 1
-
-                except exc.SQLAlchemyError:
-                    updated = True
-                    _LOGGER.exception("Error saving event: %s", event)
-
-            if not updated:
-                _LOGGER.error("Error in database update. Could not save "
-                              "after %d tries. Giving up", tries)
-
-            self.queue.task_done()
+                    attributes = _dumps(new_state.attributes_json,
+                                        dict(new_state.attributes))
+                except (TypeError, ValueError):
+                    _LOGGER.warning(
+                        "State is not JSON serializable: %s", new_state)
+
+        return RecordedEvent(event, event_data, attributes)
+
+    def _save_events(self, events):
+        """Save recorded events and their states in a single transaction."""
+        from .models import States, Events
+        from sqlalchemy import exc
+
+        if not events:
+            return
+
+        tries = 1
+        updated = False
+        while not updated and tries <= 10:
+            if tries != 1:
+                time.sleep(CONNECT_RETRY_WAIT)
+            try:
+                timer_start = time.perf_counter()
+
+                with session_scope(session=self.get_session()) as session:
+                    dbevents = [
+                        None if record.event_data is None else
+                        Events.from_event(record.event, record.event_data)
+                        for record in events]
+
+                    session.add_all(
+                        dbevent for dbevent in dbevents if dbevent is not None)
+                    session.flush()
+
+                    dbstates = []
+                    for record, dbevent in zip(events, dbevents):
+                        if record.attributes is None:
+                            continue
+                        dbstate = States.from_event(
+                            record.event, record.attributes)
+                        if dbevent is not None:
+                            dbstate.event_id = dbevent.event_id
+                        dbstates.append(dbstate)
+
+                    session.bulk_save_objects(dbstates)
+                    snapshot_states, latest_update, snapshot_time = \
+                        self._save_snapshot(session, dbstates)
+
+                updated = True
+                # Only track states once they are committed
+                self._snapshot_states.update(snapshot_states)
+                self._latest_update = latest_update
+                if snapshot_time is not None:
+                    self._snapshot_time = snapshot_time
+                self._add_entity_ids(dbstates)
+                self.last_commit_duration = time.perf_counter() - timer_start
+                self.last_commit_size = len(events)
+
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "Committed %d events in %fs, %d items queued",
+                        self.last_commit_size, self.last_commit_duration,
+                        self.queue_depth)
+
+            except exc.OperationalError as err:
+                _LOGGER.error("Error in database connectivity: %s. "
+                              "(retrying in %s seconds)", err,
+                              CONNECT_RETRY_WAIT)
+                tries += 1
+
+            except exc.SQLAlchemyError:
+                updated = True
+                if len(events) == 1:
+                    _LOGGER.exception("Error saving event: %s", events[0])
+                    continue
+
+                # Save the events one by one, so only the bad ones are lost
+                _LOGGER.warning("Error saving %d events, saving them one by "
+                                "one", len(events))
+                for record in events:
+                    self._save_events([record])
+
+        if not updated:
+            _LOGGER.error("Error in database update. Could not save "
+                          "after %d tries. Giving up", tries)
+
+    def _save_snapshot(self, session, dbstates):
+        """Save a snapshot of the latest states if one is due.
+
+        Return the latest states of the given states, the latest update and
+        the time of the saved snapshot or None. They are applied once the
+        states are committed.
+        """
+        from .models import StateSnapshots
+
+        latest = self._snapshot_states
+        updates = {}  # type: Dict[str, datetime]
+        latest_update = self._latest_update
+        for dbstate in dbstates:
+            last_updated = dbstate.last_updated
+            # History only looks at states recorded during the current run
+            if last_updated < self.recording_start:
+                continue
+            entity_id = dbstate.entity_id
+            if last_updated >= updates.get(
+                    entity_id, latest.get(entity_id, last_updated)):
+                updates[entity_id] = last_updated
+            if last_updated > latest_update:
+                latest_update = last_updated
+
+        if latest_update - self._snapshot_time < SNAPSHOT_INTERVAL:
+            return updates, latest_update, None
+
+        snapshot = dict(latest)
+        snapshot.update(updates)
+        session.bulk_insert_mappings(StateSnapshots, [
+            {'snapshot_time': latest_update, 'entity_id': entity_id,
+             'last_updated': last_updated}
+            for entity_id, last_updated in snapshot.items()])
+        _LOGGER.debug("Saved snapshot of %d states", len(snapshot))
+        return updates, latest_update, latest_update
+
+    def _load_entity_ids(self):
+        """Load the entity ids that have recorded states."""
+        from .models import States
+
+        with session_scope(session=self.get_session()) as session:
+            self.entity_ids = frozenset(
+                row.entity_id for row in
+                session.query(States.entity_id).distinct())
+
+    def _add_entity_ids(self, dbstates):
+        """Add the entity ids of newly recorded states."""
+        if self.entity_ids is None:
+            return
+
+        new_entity_ids = {
+            dbstate.entity_id for dbstate in dbstates
+            if dbstate.entity_id not in self.entity_ids}
+
+        if new_entity_ids:
+            self.entity_ids = self.entity_ids | new_entity_ids
 
     @callback
     def event_listener(self, event):
-        """Listen for new events and put them in the process queue."""
-        self.queue.put(event)
+        """Listen for new events and put them in the process queue.
+
+        Events that are not recorded are dropped here, so they never reach
+        the recorder thread.
+        """
+        if self._keep_event(event):
+            self.queue.put(self._serialize_event(event))
 
     def block_till_done(self):
         """Block till all events processed."""
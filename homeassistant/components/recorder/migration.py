@@ -44,6 +44,10 @@ def migrate_schema(instance):
                              new_version)
                 _apply_update(instance.engine, new_version, current_version)
                 session.add(SchemaChanges(schema_version=new_version))
+                # Record every finished step, so an interrupted migration
+                # (e.g. while building an index on a large database)
+                # resumes from the last finished version on the next start.
+                session.commit()
 
                 _LOGGER.info("Upgrade to version %s done", new_version)
         finally:
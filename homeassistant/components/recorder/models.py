@@ -37,11 +37,17 @@ class Events(Base):  # type: ignore
     # context_parent_id = Column(String(36), index=True)
 
     @staticmethod
-    def from_event(event):
-        """Create an event database object from a native event."""
+    def from_event(event, event_data=None):
+        """Create an event database object from a native event.
+
+        event_data can be passed if the event data was already serialized.
+        """
+        if event_data is None:
+            event_data = json.dumps(event.data, cls=JSONEncoder)
+
         return Events(
             event_type=event.event_type,
-            event_data=json.dumps(event.data, cls=JSONEncoder),
+            event_data=event_data,
             origin=str(event.origin),
             time_fired=event.time_fired,
             context_id=event.context.id,
@@ -95,8 +101,12 @@ class States(Base):   # type: ignore
     )
 
     @staticmethod
-    def from_event(event):
-        """Create object from a state_changed event."""
+    def from_event(event, attributes=None):
+        """Create object from a state_changed event.
+
+        attributes can be passed if the state attributes were already
+        serialized.
+        """
         entity_id = event.data['entity_id']
         state = event.data.get('new_state')
 
@@ -117,8 +127,10 @@ class States(Base):   # type: ignore
         else:
             dbstate.domain = state.domain
             dbstate.state = state.state
-            dbstate.attributes = json.dumps(dict(state.attributes),
-                                            cls=JSONEncoder)
+            if attributes is None:
+                attributes = json.dumps(dict(state.attributes),
+                                        cls=JSONEncoder)
+            dbstate.attributes = attributes
             dbstate.last_changed = state.last_changed
             dbstate.last_updated = state.last_updated
 
@@ -147,6 +159,21 @@ class States(Base):   # type: ignore
             return None
 
 
+class StateSnapshots(Base):   # type: ignore
+    """Latest state of every entity at a point in time.
+
+    Snapshots are written periodically by the recorder and reference the
+    states by entity_id and last_updated, so point in time lookups only have
+    to look at the states recorded after the nearest snapshot.
+    """
+
+    __tablename__ = 'state_snapshots'
+    snapshot_id = Column(Integer, primary_key=True)
+    snapshot_time = Column(DateTime(timezone=True), index=True)
+    entity_id = Column(String(255))
+    last_updated = Column(DateTime(timezone=True))
+
+
 class RecorderRuns(Base):   # type: ignore
     """Representation of recorder run."""
 
@@ -11,7 +11,7 @@ _LOGGER = logging.getLogger(__name__)
 
 def purge_old_data(instance, purge_days, repack):
     """Purge events and states older than purge_days ago."""
-    from .models import States, Events
+    from .models import States, Events, StateSnapshots
     from sqlalchemy.exc import SQLAlchemyError
 
     purge_before = dt_util.utcnow() - timedelta(days=purge_days)
@@ -29,6 +29,11 @@ def purge_old_data(instance, purge_days, repack):
                 .delete(synchronize_session=False)
             _LOGGER.debug("Deleted %s events", deleted_rows)
 
+            deleted_rows = session.query(StateSnapshots) \
+                .filter((StateSnapshots.snapshot_time < purge_before)) \
+                .delete(synchronize_session=False)
+            _LOGGER.debug("Deleted %s state snapshots", deleted_rows)
+
         # Execute sqlite vacuum command to free up space on disk
         if repack and instance.engine.driver == 'pysqlite':
             _LOGGER.debug("Vacuuming SQLite to free space")
@@ -1,6 +1,6 @@
 """Support for statistics for sensor values."""
 import logging
-import statistics
+import math
 from collections import deque
 
 import voluptuous as vol
@@ -16,6 +16,8 @@ from homeassistant.helpers.event import async_track_state_change
 from homeassistant.util import dt as dt_util
 from homeassistant.components.recorder.util import session_scope, execute
 
+from .window import SampleWindow
+
 _LOGGER = logging.getLogger(__name__)
 
 ATTR_AVERAGE_CHANGE = 'average_change'
@@ -84,7 +86,10 @@ class StatisticsSensor(Entity):
         self._max_age = max_age
         self._precision = precision
         self._unit_of_measurement = None
-        self.states = deque(maxlen=self._sampling_size)
+        if self.is_binary:
+            self.states = deque(maxlen=self._sampling_size)
+        else:
+            self.states = SampleWindow(self._sampling_size)
         self.ages = deque(maxlen=self._sampling_size)
 
         self.count = 0
@@ -208,33 +213,28 @@ class StatisticsSensor(Entity):
         self.count = len(self.states)
 
         if not self.is_binary:
-            try:  # require only one data point
-                self.mean = round(statistics.mean(self.states),
-                                  self._precision)
-                self.median = round(statistics.median(self.states),
-                                    self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            if self.states:  # require only one data point
+                self.mean = round(self.states.mean, self._precision)
+                self.median = round(self.states.median, self._precision)
+            else:
                 self.mean = self.median = STATE_UNKNOWN
 
-            try:  # require at least two data points
-                self.stdev = round(statistics.stdev(self.states),
-                                   self._precision)
-                self.variance = round(statistics.variance(self.states),
-                                      self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            if len(self.states) > 1:  # require at least two data points
+                variance = self.states.variance
+                self.stdev = round(math.sqrt(variance), self._precision)
+                self.variance = round(variance, self._precision)
+            else:
                 self.stdev = self.variance = STATE_UNKNOWN
 
             if self.states:
-                self.total = round(sum(self.states), self._precision)
-                self.min = round(min(self.states), self._precision)
-                self.max = round(max(self.states), self._precision)
+                self.total = round(self.states.total, self._precision)
+                self.min = round(self.states.min, self._precision)
+                self.max = round(self.states.max, self._precision)
 
                 self.min_age = self.ages[0]
                 self.max_age = self.ages[-1]
 
-                self.change = self.states[-1] - self.states[0]
+                self.change = self.states.last - self.states.first
                 self.average_change = self.change
                 self.change_rate = 0
 
@@ -0,0 +1,127 @@
+"""Sliding window of sensor samples with running statistics."""
+from array import array
+from bisect import bisect_left, insort
+import math
+
+
+class SampleWindow:
+    """Hold the last samples of a sensor and their statistics.
+
+    Samples are kept in an array used as a ring buffer. Mean and variance
+    are updated with Welford's method as samples enter and leave the window,
+    while a sorted copy of the samples gives the median, min and max.
+    """
+
+    def __init__(self, size):
+        """Initialize the window."""
+        self._size = size
+        self._samples = array('d')
+        self._start = 0
+        self._count = 0
+        self._sorted = []
+        self._total = 0.0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def __len__(self):
+        """Return the number of samples in the window."""
+        return self._count
+
+    def __iter__(self):
+        """Iterate over the samples, oldest first."""
+        for index in range(self._count):
+            yield self._samples[(self._start + index) % self._size]
+
+    def append(self, value):
+        """Add a sample, dropping the oldest one if the window is full.
+
+        Raises ValueError for NaN and infinite values, they would stay in the
+        running statistics after leaving the window.
+        """
+        if not math.isfinite(value):
+            raise ValueError('sample is not a finite number')
+
+        if self._count == self._size:
+            self.popleft()
+
+        # The array grows until it holds size samples
+        index = (self._start + self._count) % self._size
+        if index == len(self._samples):
+            self._samples.append(value)
+        else:
+            self._samples[index] = value
+
+        self._count += 1
+        insort(self._sorted, value)
+        self._total += value
+
+        delta = value - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (value - self._mean)
+
+    def popleft(self):
+        """Remove and return the oldest sample."""
+        if not self._count:
+            raise IndexError('pop from an empty window')
+
+        value = self._samples[self._start]
+        self._start = (self._start + 1) % self._size
+        self._count -= 1
+        del self._sorted[bisect_left(self._sorted, value)]
+
+        if not self._count:
+            self._start = 0
+            self._total = self._mean = self._m2 = 0.0
+            return value
+
+        self._total -= value
+
+        delta = value - self._mean
+        self._mean -= delta / self._count
+        self._m2 = max(self._m2 - delta * (value - self._mean), 0.0)
+        return value
+
+    @property
+    def first(self):
+        """Return the oldest sample."""
+        return self._samples[self._start]
+
+    @property
+    def last(self):
+        """Return the newest sample."""
+        return self._samples[(self._start + self._count - 1) % self._size]
+
+    @property
+    def total(self):
+        """Return the sum of the samples."""
+        return self._total
+
+    @property
+    def mean(self):
+        """Return the mean of the samples."""
+        return self._mean
+
+    @property
+    def variance(self):
+        """Return the sample variance, requires at least two samples."""
+        return self._m2 / (self._count - 1)
+
+    @property
+    def median(self):
+        """Return the median of the samples."""
+        middle = self._count // 2
+
+        if self._count % 2:
+            return self._sorted[middle]
+
+        return (self._sorted[middle - 1] + self._sorted[middle]) / 2
+
+    @property
+    def min(self):
+        """Return the smallest sample."""
+        return self._sorted[0]
+
+    @property
+    def max(self):
+        """Return the largest sample."""
+        return self._sorted[-1]
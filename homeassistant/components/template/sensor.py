@@ -11,11 +11,13 @@ from homeassistant.const import (
     ATTR_FRIENDLY_NAME, ATTR_UNIT_OF_MEASUREMENT, CONF_VALUE_TEMPLATE,
     CONF_ICON_TEMPLATE, CONF_ENTITY_PICTURE_TEMPLATE, ATTR_ENTITY_ID,
     CONF_SENSORS, EVENT_HOMEASSISTANT_START, CONF_FRIENDLY_NAME_TEMPLATE,
-    MATCH_ALL, CONF_DEVICE_CLASS)
+    CONF_DEVICE_CLASS)
 from homeassistant.exceptions import TemplateError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import Entity, async_generate_entity_id
-from homeassistant.helpers.event import async_track_state_change
+from homeassistant.helpers.event import (
+    async_track_render_info, async_track_state_change)
+from homeassistant.helpers.template import async_collect_render_info
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -50,42 +52,14 @@ async def async_setup_platform(hass, config, async_add_entities,
         unit_of_measurement = device_config.get(ATTR_UNIT_OF_MEASUREMENT)
         device_class = device_config.get(CONF_DEVICE_CLASS)
 
-        entity_ids = set()
-        manual_entity_ids = device_config.get(ATTR_ENTITY_ID)
-        invalid_templates = []
+        for template in (state_template, icon_template,
+                         entity_picture_template, friendly_name_template):
+            if template is not None:
+                template.hass = hass
 
-        for tpl_name, template in (
-                (CONF_VALUE_TEMPLATE, state_template),
-                (CONF_ICON_TEMPLATE, icon_template),
-                (CONF_ENTITY_PICTURE_TEMPLATE, entity_picture_template),
-                (CONF_FRIENDLY_NAME_TEMPLATE, friendly_name_template),
-        ):
-            if template is None:
-                continue
-            template.hass = hass
-
-            if manual_entity_ids is not None:
-                continue
-
-            template_entity_ids = template.extract_entities()
-            if template_entity_ids == MATCH_ALL:
-                entity_ids = MATCH_ALL
-                # Cut off _template from name
-                invalid_templates.append(tpl_name[:-9])
-            elif entity_ids != MATCH_ALL:
-                entity_ids |= set(template_entity_ids)
-
-        if invalid_templates:
-            _LOGGER.warning(
-                'Template sensor %s has no entity ids configured to track nor'
-                ' were we able to extract the entities to track from the %s '
-                'template(s). This entity will only be able to be updated '
-                'manually.', device, ', '.join(invalid_templates))
-
-        if manual_entity_ids is not None:
-            entity_ids = manual_entity_ids
-        elif entity_ids != MATCH_ALL:
-            entity_ids = list(entity_ids)
+        # Without configured entity ids, the sensor tracks the states its
+        # templates access while rendering.
+        entity_ids = device_config.get(ATTR_ENTITY_ID)
 
         sensors.append(
             SensorTemplate(
@@ -129,6 +103,8 @@ class SensorTemplate(Entity):
         self._entity_picture = None
         self._entities = entity_ids
         self._device_class = device_class
+        self._tracked = None
+        self._async_remove_tracker = None
 
     async def async_added_to_hass(self):
         """Register callbacks."""
@@ -140,8 +116,7 @@ class SensorTemplate(Entity):
         @callback
         def template_sensor_startup(event):
             """Update template on startup."""
-            if self._entities != MATCH_ALL:
-                # Track state change only for valid templates
+            if self._entities is not None:
                 async_track_state_change(
                     self.hass, self._entities, template_sensor_state_listener)
 
@@ -150,6 +125,43 @@ class SensorTemplate(Entity):
         self.hass.bus.async_listen_once(
             EVENT_HOMEASSISTANT_START, template_sensor_startup)
 
+    async def async_will_remove_from_hass(self):
+        """Stop tracking the states used by the templates."""
+        if self._async_remove_tracker is not None:
+            self._async_remove_tracker()
+            self._async_remove_tracker = None
+        self._tracked = None
+
+    @callback
+    def _async_track_render_info(self, info):
+        """Track the states accessed while rendering the templates."""
+        tracked = (info.all_states, info.entities, info.domains)
+
+        if tracked == self._tracked:
+            return
+
+        if self._async_remove_tracker is not None:
+            self._async_remove_tracker()
+            self._async_remove_tracker = None
+
+        if info.is_static:
+            if self._tracked is None:
+                _LOGGER.warning(
+                    'Template sensor %s has no entity ids configured to '
+                    'track and its templates do not use the state of any '
+                    'entity. This entity will only be able to be updated '
+                    'manually.', self.entity_id)
+        else:
+            @callback
+            def template_sensor_render_listener(entity, old_state, new_state):
+                """Handle changes of the rendered states."""
+                self.async_schedule_update_ha_state(True)
+
+            self._async_remove_tracker = async_track_render_info(
+                self.hass, info, template_sensor_render_listener)
+
+        self._tracked = tracked
+
     @property
     def name(self):
         """Return the name of the sensor."""
@@ -187,6 +199,15 @@ class SensorTemplate(Entity):
 
     async def async_update(self):
         """Update the state from the template."""
+        with async_collect_render_info(self.hass) as info:
+            self._async_render_templates()
+
+        if self._entities is None:
+            self._async_track_render_info(info)
+
+    @callback
+    def _async_render_templates(self):
+        """Render the templates of the sensor."""
         try:
             self._state = self._template.async_render()
         except TemplateError as ex:
@@ -4,7 +4,7 @@ import voluptuous as vol
 from homeassistant.auth.permissions.const import POLICY_READ
 from homeassistant.const import (
     MATCH_ALL, EVENT_TIME_CHANGED, EVENT_STATE_CHANGED)
-from homeassistant.core import callback, DOMAIN as HASS_DOMAIN
+from homeassistant.core import callback, split_entity_id, DOMAIN as HASS_DOMAIN
 from homeassistant.exceptions import Unauthorized, ServiceNotFound, \
     HomeAssistantError
 from homeassistant.helpers import config_validation as cv
@@ -17,6 +17,7 @@ from . import const, decorators, messages
 def async_register_commands(hass, async_reg):
     """Register commands."""
     async_reg(hass, handle_subscribe_events)
+    async_reg(hass, handle_subscribe_entities)
     async_reg(hass, handle_unsubscribe_events)
     async_reg(hass, handle_call_service)
     async_reg(hass, handle_get_states)
@@ -59,7 +60,8 @@ def handle_subscribe_events(hass, connection, msg):
                     event.data['entity_id'], POLICY_READ):
                 return
 
-            connection.send_message(messages.event_message(msg['id'], event))
+            connection.send_message(
+                messages.cached_event_message(msg['id'], event))
 
     else:
         @callback
@@ -68,9 +70,8 @@ def handle_subscribe_events(hass, connection, msg):
             if event.event_type == EVENT_TIME_CHANGED:
                 return
 
-            connection.send_message(messages.event_message(
-                msg['id'], event.as_dict()
-            ))
+            connection.send_message(
+                messages.cached_event_message(msg['id'], event))
 
     connection.subscriptions[msg['id']] = hass.bus.async_listen(
         event_type, forward_events)
@@ -78,6 +79,77 @@ def handle_subscribe_events(hass, connection, msg):
     connection.send_message(messages.result_message(msg['id']))
 
 
+@callback
+@decorators.websocket_command({
+    vol.Required('type'): 'subscribe_entities',
+    vol.Optional('entity_ids', default=[]): cv.entity_ids,
+    vol.Optional('domains', default=[]): vol.All(cv.ensure_list, [str]),
+    vol.Optional('attributes'): vol.All(cv.ensure_list, [str]),
+})
+def handle_subscribe_entities(hass, connection, msg):
+    """Handle subscribe entities command.
+
+    Forwards state_changed events of the given entities and domains. If
+    attributes is passed, only those attributes of the states are sent.
+
+    Async friendly.
+    """
+    entity_ids = set(msg['entity_ids'])
+    domains = set(msg['domains'])
+    attributes = msg.get('attributes')
+
+    if not entity_ids and not domains:
+        connection.send_message(messages.error_message(
+            msg['id'], const.ERR_INVALID_FORMAT,
+            'Entity ids or domains are required.'))
+        return
+
+    @callback
+    def forward_state_changes(event):
+        """Forward state changed events of the entities to websocket."""
+        entity_id = event.data['entity_id']
+
+        if (entity_id not in entity_ids and
+                split_entity_id(entity_id)[0] not in domains):
+            return
+
+        if not connection.user.permissions.check_entity(
+                entity_id, POLICY_READ):
+            return
+
+        if attributes is None:
+            connection.send_message(
+                messages.cached_event_message(msg['id'], event))
+            return
+
+        event_dict = event.as_dict()
+        event_dict['data'] = {
+            'entity_id': entity_id,
+            'old_state': _prune_state(event.data.get('old_state'),
+                                      attributes),
+            'new_state': _prune_state(event.data.get('new_state'),
+                                      attributes),
+        }
+        connection.send_message(messages.event_message(msg['id'], event_dict))
+
+    connection.subscriptions[msg['id']] = hass.bus.async_listen(
+        EVENT_STATE_CHANGED, forward_state_changes)
+
+    connection.send_message(messages.result_message(msg['id']))
+
+
+def _prune_state(state, attributes):
+    """Return the state as dict with only the given attributes."""
+    if state is None:
+        return None
+
+    state_dict = dict(state.as_dict())
+    state_dict['attributes'] = {
+        key: state.attributes[key] for key in attributes
+        if key in state.attributes}
+    return state_dict
+
+
 @callback
 @decorators.websocket_command({
     vol.Required('type'): 'unsubscribe_events',
@@ -148,7 +220,7 @@ def handle_get_states(hass, connection, msg):
         if entity_perm(state.entity_id, 'read')
     ]
 
-    connection.send_message(messages.result_message(
+    connection.send_message(messages.states_result_message(
         msg['id'], states))
 
 
@@ -1,8 +1,6 @@
 """View to accept incoming websocket connection."""
 import asyncio
 from contextlib import suppress
-from functools import partial
-import json
 import logging
 
 from aiohttp import web, WSMsgType
@@ -11,18 +9,15 @@ import async_timeout
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import callback
 from homeassistant.components.http import HomeAssistantView
-from homeassistant.helpers.json import JSONEncoder
 
 from .const import (
     MAX_PENDING_MSG, CANCELLATION_ERRORS, URL, ERR_UNKNOWN_ERROR,
     SIGNAL_WEBSOCKET_CONNECTED, SIGNAL_WEBSOCKET_DISCONNECTED,
-    DATA_CONNECTIONS)
+    DATA_CONNECTIONS, JSON_DUMP)
 from .auth import AuthPhase, auth_required_message
 from .error import Disconnect
 from .messages import error_message
 
-JSON_DUMP = partial(json.dumps, cls=JSONEncoder, allow_nan=False)
-
 
 class WebsocketAPIView(HomeAssistantView):
     """View to serve a websockets endpoint."""
@@ -61,6 +56,12 @@ class WebSocketHandler:
                 if message is None:
                     break
                 self._logger.debug("Sending %s", message)
+
+                # Message that was already serialized
+                if isinstance(message, str):
+                    await self.wsock.send_str(message)
+                    continue
+
                 try:
                     await self.wsock.send_json(message, dumps=JSON_DUMP)
                 except (ValueError, TypeError) as err:
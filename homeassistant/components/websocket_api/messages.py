@@ -3,6 +3,7 @@
 import voluptuous as vol
 
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.json import dumps_event, dumps_states
 
 from . import const
 
@@ -29,6 +30,21 @@ def result_message(iden, result=None):
     }
 
 
+def states_result_message(iden, states):
+    """Return a serialized success result message holding states.
+
+    The result is joined from the JSON each state caches of itself.
+    """
+    try:
+        states_json = dumps_states(states)
+    except (ValueError, TypeError):
+        # Let the connection report the invalid message
+        return result_message(iden, states)
+
+    return '{{"id": {}, "type": "result", "success": true, "result": {}}}'\
+        .format(iden, states_json)
+
+
 def error_message(iden, code, message):
     """Return an error result message."""
     return {
@@ -49,3 +65,42 @@ def event_message(iden, event):
         'type': 'event',
         'event': event,
     }
+
+
+def cached_event_message(iden, event):
+    """Return a serialized event message.
+
+    The event is serialized only once for all subscriptions it is forwarded
+    to, each message only adds its own id.
+    """
+    try:
+        event_json = _EVENT_JSON_CACHE.get(event)
+    except (ValueError, TypeError):
+        # Let the connection report the invalid message
+        return event_message(iden, event)
+
+    return '{{"id": {}, "type": "event", "event": {}}}'.format(
+        iden, event_json)
+
+
+class _EventJSONCache:
+    """Hold the JSON of the last serialized event.
+
+    Subscriptions forwarding an event are called one after another, so
+    remembering the last event is enough to serialize every event once.
+    """
+
+    def __init__(self):
+        """Initialize the cache."""
+        self._event = None
+        self._json = None
+
+    def get(self, event):
+        """Return the JSON of event."""
+        if event is not self._event:
+            self._json = dumps_event(event)
+            self._event = event
+        return self._json
+
+
+_EVENT_JSON_CACHE = _EventJSONCache()
@@ -1,5 +1,9 @@
 """Zone entity and functionality."""
-from homeassistant.const import ATTR_HIDDEN, ATTR_LATITUDE, ATTR_LONGITUDE
+import math
+
+from homeassistant.const import (
+    ATTR_HIDDEN, ATTR_LATITUDE, ATTR_LONGITUDE, EVENT_STATE_CHANGED)
+from homeassistant.core import callback
 from homeassistant.helpers.entity import Entity
 from homeassistant.loader import bind_hass
 from homeassistant.util.async_ import run_callback_threadsafe
@@ -12,6 +16,19 @@ ATTR_RADIUS = 'radius'
 
 STATE = 'zoning'
 
+DATA_ZONE_INDEX = 'zone_index'
+DATA_ZONE_INDEX_LISTENER = 'zone_index_listener'
+
+# Size in degrees of the grid cells zones are indexed by
+GRID_SIZE = 0.1
+# Lower bound of the meters per degree of latitude, and of longitude at the
+# equator, so that bounding boxes always contain the whole circle
+METERS_PER_DEGREE = 110000
+# Circles reaching beyond this latitude or covering more grid cells than
+# this are not bounded by the grid
+MAX_LATITUDE = 80
+MAX_GRID_CELLS = 400
+
 
 @bind_hass
 def active_zone(hass, latitude, longitude, radius=0):
@@ -27,17 +44,12 @@ def async_active_zone(hass, latitude, longitude, radius=0):
 
     This method must be run in the event loop.
     """
-    # Sort entity IDs so that we are deterministic if equal distance to 2 zones
-    zones = (hass.states.get(entity_id) for entity_id
-             in sorted(hass.states.async_entity_ids(DOMAIN)))
+    index = _async_get_zone_index(hass)
 
     min_dist = None
     closest = None
 
-    for zone in zones:
-        if zone.attributes.get(ATTR_PASSIVE):
-            continue
-
+    for zone in index.candidates(latitude, longitude, radius):
         zone_dist = distance(
             latitude, longitude,
             zone.attributes[ATTR_LATITUDE], zone.attributes[ATTR_LONGITUDE])
@@ -55,6 +67,35 @@ def async_active_zone(hass, latitude, longitude, radius=0):
     return closest
 
 
+@callback
+def _async_get_zone_index(hass):
+    """Return the index of the zone states.
+
+    The index is dropped when a zone state changes and built again on the
+    next lookup.
+    """
+    index = hass.data.get(DATA_ZONE_INDEX)
+
+    if index is not None:
+        return index
+
+    if DATA_ZONE_INDEX_LISTENER not in hass.data:
+        prefix = '{}.'.format(DOMAIN)
+
+        @callback
+        def zone_state_changed(event):
+            """Drop the index when a zone changed."""
+            if event.data.get('entity_id', '').startswith(prefix):
+                hass.data.pop(DATA_ZONE_INDEX, None)
+
+        hass.data[DATA_ZONE_INDEX_LISTENER] = hass.bus.async_listen(
+            EVENT_STATE_CHANGED, zone_state_changed)
+
+    index = hass.data[DATA_ZONE_INDEX] = ZoneIndex(
+        hass.states.async_all(DOMAIN))
+    return index
+
+
 def in_zone(zone, latitude, longitude, radius=0) -> bool:
     """Test if given latitude, longitude is in given zone.
 
@@ -67,6 +108,77 @@ def in_zone(zone, latitude, longitude, radius=0) -> bool:
     return zone_dist - radius < zone.attributes[ATTR_RADIUS]
 
 
+def _grid_cells(latitude, longitude, radius):
+    """Return the grid cells covered by a circle around a location.
+
+    Returns None if the circle can not be bounded by the grid.
+    """
+    lat_delta = max(radius, 0) / METERS_PER_DEGREE
+    max_latitude = abs(latitude) + lat_delta
+
+    if max_latitude > MAX_LATITUDE:
+        return None
+
+    lon_delta = lat_delta / math.cos(math.radians(max_latitude))
+
+    if abs(longitude) + lon_delta > 180:
+        return None
+
+    lat_range = range(math.floor((latitude - lat_delta) / GRID_SIZE),
+                      math.floor((latitude + lat_delta) / GRID_SIZE) + 1)
+    lon_range = range(math.floor((longitude - lon_delta) / GRID_SIZE),
+                      math.floor((longitude + lon_delta) / GRID_SIZE) + 1)
+
+    if len(lat_range) * len(lon_range) > MAX_GRID_CELLS:
+        return None
+
+    return [(lat, lon) for lat in lat_range for lon in lon_range]
+
+
+class ZoneIndex:
+    """Grid of the active zones by the cells their radius covers."""
+
+    def __init__(self, zones):
+        """Index the given zone states."""
+        # Sort by entity ID so that we are deterministic if equal distance
+        # to 2 zones
+        self._active = sorted(
+            (zone for zone in zones if not zone.attributes.get(ATTR_PASSIVE)),
+            key=lambda state: state.entity_id)
+        self._grid = {}
+        self._unbounded = []
+
+        for idx, zone in enumerate(self._active):
+            cells = _grid_cells(
+                zone.attributes[ATTR_LATITUDE],
+                zone.attributes[ATTR_LONGITUDE],
+                zone.attributes[ATTR_RADIUS])
+
+            if cells is None:
+                self._unbounded.append(idx)
+                continue
+
+            for cell in cells:
+                self._grid.setdefault(cell, []).append(idx)
+
+    def candidates(self, latitude, longitude, radius=0):
+        """Return the active zones a location could be in, sorted.
+
+        Zones are candidates when their bounding box overlaps the bounding
+        box of the location and its radius.
+        """
+        cells = _grid_cells(latitude, longitude, radius)
+
+        if cells is None:
+            return self._active
+
+        found = set(self._unbounded)
+        for cell in cells:
+            found.update(self._grid.get(cell, ()))
+
+        return [self._active[idx] for idx in sorted(found)]
+
+
 class Zone(Entity):
     """Representation of a Zone."""
 
@@ -9,6 +9,7 @@ from concurrent.futures import ThreadPoolExecutor
 import datetime
 import enum
 import functools
+import json
 import logging
 import os
 import pathlib
@@ -20,7 +21,7 @@ import uuid
 from types import MappingProxyType
 from typing import (  # noqa: F401 pylint: disable=unused-import
     Optional, Any, Callable, List, TypeVar, Dict, Coroutine, Set,
-    TYPE_CHECKING, Awaitable, Iterator)
+    TYPE_CHECKING, Awaitable, Iterator, Tuple)
 
 from async_timeout import timeout
 import attr
@@ -97,6 +98,14 @@ def is_callback(func: Callable[..., Any]) -> bool:
     return getattr(func, '_hass_callback', False) is True
 
 
+def _is_inline_listener(func: Callable[..., Any]) -> bool:
+    """Check if an event listener can be called directly from async_fire."""
+    # Check for partials to properly determine if it is a callback
+    while isinstance(func, functools.partial):
+        func = func.func
+    return is_callback(func)
+
+
 @callback
 def async_loop_exception_handler(_: Any, context: Dict) -> None:
     """Handle all exception inside the core loop."""
@@ -494,6 +503,9 @@ class EventBus:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners = {}  # type: Dict[str, List[Callable]]
+        # Per event type cache of the listeners (including MATCH_ALL) to call
+        # when the event is fired, invalidated when listeners change.
+        self._dispatch = {}  # type: Dict[str, List[Tuple[Callable, bool]]]
         self._hass = hass
 
     @callback
@@ -512,6 +524,16 @@ class EventBus:
             self._hass.loop, self.async_listeners
         ).result()
 
+    @callback
+    def async_has_listeners(self, event_type: str) -> bool:
+        """Return if there are listeners for a specific event type.
+
+        Listeners for all events (MATCH_ALL) are not taken into account.
+
+        This method must be run in the event loop.
+        """
+        return event_type in self._listeners
+
     def fire(self, event_type: str, event_data: Optional[Dict] = None,
              origin: EventOrigin = EventOrigin.local,
              context: Optional[Context] = None) -> None:
@@ -525,6 +547,34 @@ class EventBus:
                    context: Optional[Context] = None) -> None:
         """Fire an event.
 
+        This method must be run in the event loop.
+        """
+        listeners = self._dispatch.get(event_type)
+
+        if listeners is None:
+            listeners = self._async_build_dispatch(event_type)
+
+        event = Event(event_type, event_data, origin, None, context)
+
+        if event_type != EVENT_TIME_CHANGED:
+            _LOGGER.debug("Bus:Handling %s", event)
+
+        for func, run_inline in listeners:
+            if not run_inline:
+                self._hass.async_add_job(func, event)
+                continue
+
+            try:
+                func(event)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error running listener %s for %s",
+                                  func, event)
+
+    @callback
+    def _async_build_dispatch(
+            self, event_type: str) -> List[Tuple[Callable, bool]]:
+        """Build and cache the listeners to call for an event type.
+
         This method must be run in the event loop.
         """
         listeners = self._listeners.get(event_type, [])
@@ -535,16 +585,17 @@ class EventBus:
                 event_type != EVENT_HOMEASSISTANT_CLOSE):
             listeners = match_all_listeners + listeners
 
-        event = Event(event_type, event_data, origin, None, context)
+        dispatch = [(func, _is_inline_listener(func)) for func in listeners]
+        self._dispatch[event_type] = dispatch
+        return dispatch
 
-        if event_type != EVENT_TIME_CHANGED:
-            _LOGGER.debug("Bus:Handling %s", event)
-
-        if not listeners:
-            return
-
-        for func in listeners:
-            self._hass.async_add_job(func, event)
+    @callback
+    def _async_invalidate_dispatch(self, event_type: str) -> None:
+        """Drop cached listeners affected by a change to event_type."""
+        if event_type == MATCH_ALL:
+            self._dispatch.clear()
+        else:
+            self._dispatch.pop(event_type, None)
 
     def listen(
             self, event_type: str, listener: Callable) -> CALLBACK_TYPE:
@@ -578,6 +629,8 @@ class EventBus:
         else:
             self._listeners[event_type] = [listener]
 
+        self._async_invalidate_dispatch(event_type)
+
         def remove_listener() -> None:
             """Remove the listener."""
             self._async_remove_listener(event_type, listener)
@@ -645,6 +698,8 @@ class EventBus:
             # delete event_type list if empty
             if not self._listeners[event_type]:
                 self._listeners.pop(event_type)
+
+            self._async_invalidate_dispatch(event_type)
         except (KeyError, ValueError):
             # KeyError is key event_type listener did not exist
             # ValueError if listener did not exist within event_type
@@ -660,10 +715,14 @@ class State:
     last_changed: last time the state was changed, not the attributes.
     last_updated: last time this object was updated.
     context: Context in which it was created
+
+    States are immutable, their dict and JSON representations are created
+    once and shared by everything serializing them.
     """
 
     __slots__ = ['entity_id', 'state', 'attributes',
-                 'last_changed', 'last_updated', 'context']
+                 'last_changed', 'last_updated', 'context',
+                 '_as_dict', '_as_json', '_attributes_json']
 
     def __init__(self, entity_id: str, state: Any,
                  attributes: Optional[Dict] = None,
@@ -692,6 +751,9 @@ class State:
         self.last_updated = last_updated or dt_util.utcnow()
         self.last_changed = last_changed or self.last_updated
         self.context = context or Context()
+        self._as_dict = None  # type: Optional[Dict]
+        self._as_json = None  # type: Optional[str]
+        self._attributes_json = None  # type: Optional[str]
 
     @property
     def domain(self) -> str:
@@ -715,15 +777,46 @@ class State:
 
         Async friendly.
 
-        To be used for JSON serialization.
+        To be used for JSON serialization. The dict is shared and must not
+        be modified.
         Ensures: state == State.from_dict(state.as_dict())
         """
-        return {'entity_id': self.entity_id,
+        if self._as_dict is None:
+            self._as_dict = {
+                'entity_id': self.entity_id,
                 'state': self.state,
                 'attributes': dict(self.attributes),
                 'last_changed': self.last_changed,
                 'last_updated': self.last_updated,
                 'context': self.context.as_dict()}
+        return self._as_dict
+
+    def attributes_json(self) -> str:
+        """Return the attributes of the State serialized as JSON.
+
+        Async friendly.
+        """
+        if self._attributes_json is None:
+            from homeassistant.helpers.json import JSONEncoder
+            self._attributes_json = json.dumps(
+                dict(self.attributes), cls=JSONEncoder, allow_nan=False)
+        return self._attributes_json
+
+    def as_json(self) -> str:
+        """Return the dict representation of the State serialized as JSON.
+
+        Async friendly.
+        """
+        if self._as_json is None:
+            self._as_json = (
+                '{{"entity_id": {}, "state": {}, "attributes": {}, '
+                '"last_changed": "{}", "last_updated": "{}", '
+                '"context": {}}}').format(
+                    json.dumps(self.entity_id), json.dumps(self.state),
+                    self.attributes_json(), self.last_changed.isoformat(),
+                    self.last_updated.isoformat(),
+                    json.dumps(self.context.as_dict()))
+        return self._as_json
 
     @classmethod
     def from_dict(cls, json_dict: Dict) -> Any:
@@ -783,6 +876,8 @@ class StateMachine:
                  loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
         self._states = {}  # type: Dict[str, State]
+        # States by domain, so a domain can be looked up without a full scan
+        self._domain_index = {}  # type: Dict[str, Dict[str, State]]
         self._bus = bus
         self._loop = loop
 
@@ -803,23 +898,31 @@ class StateMachine:
         if domain_filter is None:
             return list(self._states.keys())
 
-        domain_filter = domain_filter.lower()
-
-        return [state.entity_id for state in self._states.values()
-                if state.domain == domain_filter]
+        return list(self._domain_index.get(domain_filter.lower(), ()))
 
-    def all(self) -> List[State]:
+    def all(self, domain_filter: Optional[str] = None) -> List[State]:
         """Create a list of all states."""
         return run_callback_threadsafe(  # type: ignore
-            self._loop, self.async_all).result()
+            self._loop, self.async_all, domain_filter).result()
 
     @callback
-    def async_all(self) -> List[State]:
+    def async_all(self, domain_filter: Optional[str] = None) -> List[State]:
         """Create a list of all states.
 
+        If domain_filter is passed, only the states of that domain are
+        returned.
+
         This method must be run in the event loop.
         """
-        return list(self._states.values())
+        if domain_filter is None:
+            return list(self._states.values())
+
+        domain_states = self._domain_index.get(domain_filter.lower())
+
+        if domain_states is None:
+            return []
+
+        return list(domain_states.values())
 
     def get(self, entity_id: str) -> Optional[State]:
         """Retrieve state of entity_id or None if not found.
@@ -858,6 +961,11 @@ class StateMachine:
         if old_state is None:
             return False
 
+        domain_states = self._domain_index[old_state.domain]
+        del domain_states[entity_id]
+        if not domain_states:
+            del self._domain_index[old_state.domain]
+
         self._bus.async_fire(EVENT_STATE_CHANGED, {
             'entity_id': entity_id,
             'old_state': old_state,
@@ -919,6 +1027,7 @@ class StateMachine:
         state = State(entity_id, new_state, attributes, last_changed, None,
                       context)
         self._states[entity_id] = state
+        self._domain_index.setdefault(state.domain, {})[entity_id] = state
         self._bus.async_fire(EVENT_STATE_CHANGED, {
             'entity_id': entity_id,
             'old_state': old_state,
@@ -1254,7 +1363,10 @@ class Config:
 
 def _async_create_timer(hass: HomeAssistant) -> None:
     """Create a timer that will start on HOMEASSISTANT_START."""
+    from homeassistant.helpers.event import async_get_point_in_time_scheduler
+
     handle = None
+    scheduler = async_get_point_in_time_scheduler(hass)
 
     def schedule_tick(now: datetime.datetime) -> None:
         """Schedule a timer tick when the next second rolls around."""
@@ -1269,8 +1381,11 @@ def _async_create_timer(hass: HomeAssistant) -> None:
         """Fire next time event."""
         now = dt_util.utcnow()
 
-        hass.bus.async_fire(EVENT_TIME_CHANGED,
-                            {ATTR_NOW: now})
+        # Point in time listeners are run by their own scheduler, only fire
+        # the time changed event every second if someone listens to it.
+        if hass.bus.async_has_listeners(EVENT_TIME_CHANGED):
+            hass.bus.async_fire(EVENT_TIME_CHANGED,
+                                {ATTR_NOW: now})
 
         # If we are more than a second late, a tick was missed
         late = monotonic() - target
@@ -1285,8 +1400,10 @@ def _async_create_timer(hass: HomeAssistant) -> None:
         """Stop the timer."""
         if handle is not None:
             handle.cancel()
+        scheduler.async_stop()
 
     hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, stop_timer)
 
     _LOGGER.info("Timer:starting")
     schedule_tick(dt_util.utcnow())
+    scheduler.async_start()
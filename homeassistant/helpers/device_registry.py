@@ -2,7 +2,8 @@
 import logging
 import uuid
 from asyncio import Event
-from collections import OrderedDict
+from collections import OrderedDict, UserDict
+from itertools import chain, count
 from typing import List, Optional, cast
 
 import attr
@@ -64,6 +65,81 @@ def format_mac(mac):
     return mac
 
 
+class DeviceRegistryItems(UserDict):
+    """Hold the registry devices by id.
+
+    The devices are also indexed by their identifiers and connections, the
+    index is updated whenever a device is set or deleted.
+    """
+
+    def __init__(self, devices=None):
+        """Initialize the registry devices."""
+        super().__init__()
+        self.data = OrderedDict()
+        # Index key to the ids of the devices that have it
+        self._device_ids = {}
+        # Device id to the position the device was added at
+        self._positions = {}
+        self._next_position = count()
+
+        if devices is not None:
+            self.update(devices)
+
+    def __setitem__(self, device_id, device):
+        """Add or replace a device."""
+        old = self.data.get(device_id)
+
+        if old is None:
+            self._positions[device_id] = next(self._next_position)
+        else:
+            self._unindex(device_id, old)
+
+        self.data[device_id] = device
+
+        for key in _index_keys(device.identifiers, device.connections):
+            self._device_ids.setdefault(key, set()).add(device_id)
+
+    def __delitem__(self, device_id):
+        """Remove a device."""
+        self._unindex(device_id, self.data.pop(device_id))
+        del self._positions[device_id]
+
+    def _unindex(self, device_id, device):
+        """Remove a device from the index."""
+        for key in _index_keys(device.identifiers, device.connections):
+            device_ids = self._device_ids.get(key)
+
+            if device_ids is None:
+                continue
+
+            device_ids.discard(device_id)
+
+            if not device_ids:
+                del self._device_ids[key]
+
+    def get_device_id(self, identifiers, connections):
+        """Return the id of a device with an identifier or connection.
+
+        If several devices match, the one added first is returned.
+        """
+        found = set()
+
+        for key in _index_keys(identifiers, connections):
+            found.update(self._device_ids.get(key, ()))
+
+        if not found:
+            return None
+
+        return min(found, key=self._positions.__getitem__)
+
+
+def _index_keys(identifiers, connections):
+    """Return the index keys of identifiers and connections."""
+    return chain(
+        (('identifier', iden) for iden in identifiers),
+        (('connection', conn) for conn in connections))
+
+
 class DeviceRegistry:
     """Class to hold a registry of devices."""
 
@@ -81,11 +157,12 @@ class DeviceRegistry:
     @callback
     def async_get_device(self, identifiers: set, connections: set):
         """Check if device is registered."""
-        for device in self.devices.values():
-            if any(iden in device.identifiers for iden in identifiers) or \
-                    any(conn in device.connections for conn in connections):
-                return device
-        return None
+        device_id = self.devices.get_device_id(identifiers, connections)
+
+        if device_id is None:
+            return None
+
+        return self.devices[device_id]
 
     @callback
     def async_get_or_create(self, *, config_entry_id, connections=None,
@@ -206,7 +283,7 @@ class DeviceRegistry:
         """Load the device registry."""
         data = await self._store.async_load()
 
-        devices = OrderedDict()
+        devices = DeviceRegistryItems()
 
         if data is not None:
             for device in data['devices']:
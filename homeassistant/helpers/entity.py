@@ -1,5 +1,6 @@
 """An abstract class for entities."""
 from datetime import timedelta
+from itertools import count
 import logging
 import functools as ft
 from timeit import default_timer as timer
@@ -20,6 +21,10 @@ from homeassistant.util import dt as dt_util
 _LOGGER = logging.getLogger(__name__)
 SLOW_UPDATE_WARNING = 10
 
+# State versions handed out by Entity.mark_state_changed. next() on a count
+# is atomic, so every call gets a new version, whichever thread it runs in.
+_STATE_VERSIONS = count(1)
+
 
 def generate_entity_id(entity_id_format: str, name: Optional[str],
                        current_ids: Optional[List[str]] = None,
@@ -88,6 +93,15 @@ class Entity:
     _context = None
     _context_set = None
 
+    # Version of the state and attributes, set by mark_state_changed for
+    # entities that opt in to skipping writes when nothing changed
+    _state_version = None  # type: Optional[int]
+    _written_state_key = None
+
+    # Force refresh of the state update scheduled by
+    # async_schedule_update_ha_state, None if there is none pending
+    _scheduled_refresh = None  # type: Optional[bool]
+
     @property
     def should_poll(self) -> bool:
         """Return True if entity has to be polled for state.
@@ -200,6 +214,15 @@ class Entity:
         self._context = context
         self._context_set = dt_util.utcnow()
 
+    def mark_state_changed(self):
+        """Mark that the state, attributes or availability changed.
+
+        Entities calling this on every such change opt in to skipping state
+        writes, and the properties they read, when nothing changed since the
+        last write. Safe to call from any thread.
+        """
+        self._state_version = next(_STATE_VERSIONS)
+
     async def async_update_ha_state(self, force_refresh=False):
         """Update Home Assistant with current state of entity.
 
@@ -239,6 +262,17 @@ class Entity:
     @callback
     def _async_write_ha_state(self):
         """Write the state to the state machine."""
+        written_key = None
+
+        if self._state_version is not None:
+            written_key = (self._state_version, self.registry_name,
+                           self.hass.data.get(DATA_CUSTOMIZE),
+                           self.hass.config.units)
+
+            if (written_key == self._written_state_key and
+                    not self.force_update):
+                return
+
         start = timer()
 
         attr = {}
@@ -322,6 +356,7 @@ class Entity:
 
         self.hass.states.async_set(
             self.entity_id, state, attr, self.force_update, self._context)
+        self._written_state_key = written_key
 
     def schedule_update_ha_state(self, force_refresh=False):
         """Schedule an update ha state change task.
@@ -333,7 +368,7 @@ class Entity:
         If state is changed more than once before the ha state change task has
         been executed, the intermediate state transitions will be missed.
         """
-        self.hass.add_job(self.async_update_ha_state(force_refresh))
+        self.hass.add_job(self.async_schedule_update_ha_state, force_refresh)
 
     @callback
     def async_schedule_update_ha_state(self, force_refresh=False):
@@ -346,8 +381,21 @@ class Entity:
         task is executed.
         If state is changed more than once before the ha state change task has
         been executed, the intermediate state transitions will be missed.
+        Updates scheduled before the task has been executed are coalesced
+        into it.
         """
-        self.hass.async_create_task(self.async_update_ha_state(force_refresh))
+        if self._scheduled_refresh is not None:
+            self._scheduled_refresh = self._scheduled_refresh or force_refresh
+            return
+
+        self._scheduled_refresh = force_refresh
+        self.hass.async_create_task(self._async_scheduled_update_ha_state())
+
+    async def _async_scheduled_update_ha_state(self):
+        """Execute the update ha state change task that was scheduled."""
+        force_refresh = self._scheduled_refresh
+        self._scheduled_refresh = None
+        await self.async_update_ha_state(force_refresh)
 
     async def async_device_update(self, warning=True):
         """Process 'update' or 'async_update' from entity.
@@ -398,6 +446,7 @@ class Entity:
                 self._on_remove.pop()()
 
         self.hass.states.async_remove(self.entity_id)
+        self._written_state_key = None
 
     @callback
     def async_registry_updated(self, old, new):
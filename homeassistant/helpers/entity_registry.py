@@ -8,7 +8,7 @@ registered. Registering a new entity while a timer is in progress resets the
 timer.
 """
 from asyncio import Event
-from collections import OrderedDict
+from collections import OrderedDict, UserDict
 from itertools import chain
 import logging
 from typing import List, Optional, cast
@@ -75,6 +75,75 @@ class RegistryEntry:
         return lambda: self.update_listeners.remove(weak_listener)
 
 
+class EntityRegistryItems(UserDict):
+    """Hold the registry entries by entity_id.
+
+    The entries are also indexed by their unique id and by their device, the
+    indexes are updated whenever an entry is set or deleted.
+    """
+
+    def __init__(self, entries=None):
+        """Initialize the registry entries."""
+        super().__init__()
+        self.data = OrderedDict()
+        self._unique_ids = {}
+        self._device_ids = {}
+
+        if entries is not None:
+            self.update(entries)
+
+    def __setitem__(self, entity_id, entry):
+        """Add or replace an entry."""
+        old = self.data.get(entity_id)
+
+        if old is not None:
+            self._unindex_unique_id(entity_id, old)
+
+            if old.device_id != entry.device_id:
+                self._unindex_device_id(entity_id, old)
+
+        self.data[entity_id] = entry
+        self._unique_ids[entry.domain, entry.platform, entry.unique_id] = \
+            entity_id
+
+        if entry.device_id is not None:
+            self._device_ids.setdefault(
+                entry.device_id, OrderedDict())[entity_id] = entry
+
+    def __delitem__(self, entity_id):
+        """Remove an entry."""
+        entry = self.data.pop(entity_id)
+        self._unindex_unique_id(entity_id, entry)
+        self._unindex_device_id(entity_id, entry)
+
+    def _unindex_unique_id(self, entity_id, entry):
+        """Remove an entry from the unique id index."""
+        key = (entry.domain, entry.platform, entry.unique_id)
+
+        if self._unique_ids.get(key) == entity_id:
+            del self._unique_ids[key]
+
+    def _unindex_device_id(self, entity_id, entry):
+        """Remove an entry from the device index."""
+        device_entries = self._device_ids.get(entry.device_id)
+
+        if device_entries is None:
+            return
+
+        device_entries.pop(entity_id, None)
+
+        if not device_entries:
+            del self._device_ids[entry.device_id]
+
+    def get_entity_id(self, domain, platform, unique_id):
+        """Return the entity_id of a unique id."""
+        return self._unique_ids.get((domain, platform, unique_id))
+
+    def get_entries_for_device_id(self, device_id):
+        """Return the entries of a device."""
+        return list(self._device_ids.get(device_id, {}).values())
+
+
 class EntityRegistry:
     """Class to hold a registry of entities."""
 
@@ -97,11 +166,7 @@ class EntityRegistry:
     @callback
     def async_get_entity_id(self, domain: str, platform: str, unique_id: str):
         """Check if an entity_id is currently registered."""
-        for entity in self.entities.values():
-            if entity.domain == domain and entity.platform == platform and \
-               entity.unique_id == unique_id:
-                return entity.entity_id
-        return None
+        return self.entities.get_entity_id(domain, platform, unique_id)
 
     @callback
     def async_generate_entity_id(self, domain, suggested_object_id,
@@ -231,7 +296,7 @@ class EntityRegistry:
             old_conf_load_func=load_yaml,
             old_conf_migrate_func=_async_migrate
         )
-        entities = OrderedDict()
+        entities = EntityRegistryItems()
 
         if data is not None:
             for entity in data['entities']:
@@ -306,8 +371,7 @@ async def async_get_registry(hass: HomeAssistantType) -> EntityRegistry:
 def async_entries_for_device(registry: EntityRegistry, device_id: str) \
         -> List[RegistryEntry]:
     """Return entries that match a device."""
-    return [entry for entry in registry.entities.values()
-            if entry.device_id == device_id]
+    return registry.entities.get_entries_for_device_id(device_id)
 
 
 async def _async_migrate(entities):
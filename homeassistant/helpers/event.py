@@ -1,16 +1,32 @@
 """Helpers for listening to events."""
 from datetime import timedelta
 import functools as ft
+import heapq
+import itertools
+import logging
 
 from homeassistant.loader import bind_hass
 from homeassistant.helpers.sun import get_astral_event_next
-from ..core import HomeAssistant, callback
+from ..core import HomeAssistant, callback, split_entity_id
 from ..const import (
     ATTR_NOW, EVENT_STATE_CHANGED, EVENT_TIME_CHANGED, MATCH_ALL,
     SUN_EVENT_SUNRISE, SUN_EVENT_SUNSET)
 from ..util import dt as dt_util
 from ..util.async_ import run_callback_threadsafe
 
+TRACK_STATE_CHANGE_CALLBACKS = 'track_state_change_callbacks'
+TRACK_STATE_CHANGE_LISTENER = 'track_state_change_listener'
+TRACK_STATE_DOMAIN_CALLBACKS = 'track_state_domain_callbacks'
+TRACK_STATE_DOMAIN_LISTENER = 'track_state_domain_listener'
+TRACK_POINT_IN_TIME_SCHEDULER = 'track_point_in_time_scheduler'
+
+# Maximum time the scheduler sleeps before checking the time again
+SCHEDULER_MAX_DELAY = 60
+# Minimum number of removed listeners before the scheduler heap is compacted
+SCHEDULER_COMPACT_THRESHOLD = 100
+
+_LOGGER = logging.getLogger(__name__)
+
 # PyLint does not like the use of threaded_listener_factory
 # pylint: disable=invalid-name
 
@@ -53,21 +69,9 @@ def async_track_state_change(hass, entity_ids, action, from_state=None,
     match_from_state = _process_state_match(from_state)
     match_to_state = _process_state_match(to_state)
 
-    # Ensure it is a lowercase list with entity ids we want to match on
-    if entity_ids == MATCH_ALL:
-        pass
-    elif isinstance(entity_ids, str):
-        entity_ids = (entity_ids.lower(),)
-    else:
-        entity_ids = tuple(entity_id.lower() for entity_id in entity_ids)
-
     @callback
     def state_change_listener(event):
         """Handle specific state changes."""
-        if entity_ids != MATCH_ALL and \
-           event.data.get('entity_id') not in entity_ids:
-            return
-
         old_state = event.data.get('old_state')
         if old_state is not None:
             old_state = old_state.state
@@ -81,26 +85,238 @@ def async_track_state_change(hass, entity_ids, action, from_state=None,
                                event.data.get('old_state'),
                                event.data.get('new_state'))
 
-    return hass.bus.async_listen(EVENT_STATE_CHANGED, state_change_listener)
+    if entity_ids == MATCH_ALL:
+        return hass.bus.async_listen(
+            EVENT_STATE_CHANGED, state_change_listener)
+
+    # Ensure it is a lowercase list with entity ids we want to match on
+    if isinstance(entity_ids, str):
+        entity_ids = (entity_ids.lower(),)
+    else:
+        entity_ids = tuple(entity_id.lower() for entity_id in entity_ids)
+
+    return _async_track_state_change_entities(
+        hass, entity_ids, state_change_listener)
+
+
+@callback
+def _async_track_state_change_entities(hass, entity_ids, listener):
+    """Call listener with state_changed events of entity_ids only.
+
+    All listeners share a single state_changed bus listener that looks up
+    the listeners of the changed entity, so a state change does not wake up
+    every tracker. The listener must be a callback.
+
+    Must be run within the event loop.
+    """
+    entity_callbacks = hass.data.setdefault(TRACK_STATE_CHANGE_CALLBACKS, {})
+
+    if TRACK_STATE_CHANGE_LISTENER not in hass.data:
+        @callback
+        def state_change_dispatcher(event):
+            """Dispatch state changes by entity_id."""
+            listeners = entity_callbacks.get(event.data.get('entity_id'))
+
+            if listeners is None:
+                return
+
+            for entity_listener in listeners[:]:
+                try:
+                    entity_listener(event)
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception("Error while processing state changed "
+                                      "for %s", event.data.get('entity_id'))
+
+        hass.data[TRACK_STATE_CHANGE_LISTENER] = hass.bus.async_listen(
+            EVENT_STATE_CHANGED, state_change_dispatcher)
+
+    entity_ids = set(entity_ids)
+
+    for entity_id in entity_ids:
+        entity_callbacks.setdefault(entity_id, []).append(listener)
+
+    @callback
+    def remove_listener():
+        """Remove state change listener."""
+        for entity_id in entity_ids:
+            listeners = entity_callbacks.get(entity_id)
+
+            if listeners is None or listener not in listeners:
+                continue
+
+            listeners.remove(listener)
+
+            if not listeners:
+                del entity_callbacks[entity_id]
+
+        if not entity_callbacks and TRACK_STATE_CHANGE_LISTENER in hass.data:
+            hass.data.pop(TRACK_STATE_CHANGE_LISTENER)()
+
+    return remove_listener
+
+
+@callback
+def _async_track_state_change_domains(hass, domains, listener):
+    """Call listener with state_changed events of entities in domains only.
+
+    Like _async_track_state_change_entities, all listeners share a single
+    state_changed bus listener, which looks up the listeners by domain.
+    MATCH_ALL in domains tracks the state changes of all entities.
+
+    Must be run within the event loop.
+    """
+    domain_callbacks = hass.data.setdefault(TRACK_STATE_DOMAIN_CALLBACKS, {})
+
+    if TRACK_STATE_DOMAIN_LISTENER not in hass.data:
+        @callback
+        def state_change_dispatcher(event):
+            """Dispatch state changes by domain."""
+            entity_id = event.data.get('entity_id')
+
+            for key in (split_entity_id(entity_id)[0], MATCH_ALL):
+                listeners = domain_callbacks.get(key)
+
+                if listeners is None:
+                    continue
+
+                for domain_listener in listeners[:]:
+                    try:
+                        domain_listener(event)
+                    except Exception:  # pylint: disable=broad-except
+                        _LOGGER.exception("Error while processing state "
+                                          "changed for %s", entity_id)
+
+        hass.data[TRACK_STATE_DOMAIN_LISTENER] = hass.bus.async_listen(
+            EVENT_STATE_CHANGED, state_change_dispatcher)
+
+    domains = set(domains)
+
+    for domain in domains:
+        domain_callbacks.setdefault(domain, []).append(listener)
+
+    @callback
+    def remove_listener():
+        """Remove state change listener."""
+        for domain in domains:
+            listeners = domain_callbacks.get(domain)
+
+            if listeners is None or listener not in listeners:
+                continue
+
+            listeners.remove(listener)
+
+            if not listeners:
+                del domain_callbacks[domain]
+
+        if not domain_callbacks and TRACK_STATE_DOMAIN_LISTENER in hass.data:
+            hass.data.pop(TRACK_STATE_DOMAIN_LISTENER)()
+
+    return remove_listener
 
 
 track_state_change = threaded_listener_factory(async_track_state_change)
 
 
+@callback
+@bind_hass
+def async_track_render_info(hass, info, action):
+    """Track state changes of the entities and domains a render accessed.
+
+    Returns a function that can be called to remove the listener.
+
+    Must be run within the event loop.
+    """
+    if not (info.all_states or info.domains):
+        return async_track_state_change(hass, info.entities, action)
+
+    @callback
+    def state_change_listener(event):
+        """Handle state changes of the tracked entities and domains."""
+        hass.async_run_job(action, event.data.get('entity_id'),
+                           event.data.get('old_state'),
+                           event.data.get('new_state'))
+
+    if info.all_states:
+        return _async_track_state_change_domains(
+            hass, (MATCH_ALL,), state_change_listener)
+
+    # Entities of tracked domains are only tracked through their domain
+    entities = [entity_id for entity_id in info.entities
+                if split_entity_id(entity_id)[0] not in info.domains]
+    removers = [_async_track_state_change_domains(
+        hass, info.domains, state_change_listener)]
+
+    if entities:
+        removers.append(_async_track_state_change_entities(
+            hass, entities, state_change_listener))
+
+    @callback
+    def remove_listeners():
+        """Remove the state change listeners."""
+        for remove in removers:
+            remove()
+
+    return remove_listeners
+
+
 @callback
 @bind_hass
 def async_track_template(hass, template, action, variables=None):
-    """Add a listener that track state changes with template condition."""
+    """Add a listener that track state changes with template condition.
+
+    The template is rendered again on state changes of the entities and
+    domains its last render accessed. If it did not access any state, the
+    entities are extracted from the template source instead.
+    """
     from . import condition
+    from .template import async_collect_render_info
+    from ..exceptions import TemplateError
 
     # Local variable to keep track of if the action has already been triggered
     already_triggered = False
+    removed = False
+    tracked = None
+    async_remove_listener = None
+
+    @callback
+    def track(info):
+        """Listen to the state changes that can change the template."""
+        nonlocal tracked, async_remove_listener
+
+        if info.is_static:
+            # Fall back to what can be extracted from the template source
+            entity_ids = template.extract_entities(variables)
+
+            if entity_ids == MATCH_ALL:
+                info.all_states = True
+            else:
+                info.entities.update(entity_ids)
+
+        key = (info.all_states, info.entities, info.domains)
+
+        if removed or key == tracked:
+            return
+
+        if async_remove_listener is not None:
+            async_remove_listener()
+
+        tracked = key
+        async_remove_listener = async_track_render_info(
+            hass, info, template_condition_listener)
 
     @callback
     def template_condition_listener(entity_id, from_s, to_s):
         """Check if condition is correct and run action."""
         nonlocal already_triggered
-        template_result = condition.async_template(hass, template, variables)
+
+        if removed:
+            return
+
+        with async_collect_render_info(hass) as info:
+            template_result = condition.async_template(
+                hass, template, variables)
+
+        track(info)
 
         # Check to see if template returns true
         if template_result and not already_triggered:
@@ -109,9 +325,22 @@ def async_track_template(hass, template, action, variables=None):
         elif not template_result:
             already_triggered = False
 
-    return async_track_state_change(
-        hass, template.extract_entities(variables),
-        template_condition_listener)
+    with async_collect_render_info(hass) as info:
+        try:
+            template.async_render(variables)
+        except TemplateError:
+            pass
+
+    track(info)
+
+    @callback
+    def async_remove():
+        """Remove the template listener."""
+        nonlocal removed
+        removed = True
+        async_remove_listener()
+
+    return async_remove
 
 
 track_template = threaded_listener_factory(async_track_template)
@@ -192,28 +421,8 @@ def async_track_point_in_utc_time(hass, action, point_in_time):
     # Ensure point_in_time is UTC
     point_in_time = dt_util.as_utc(point_in_time)
 
-    @callback
-    def point_in_time_listener(event):
-        """Listen for matching time_changed events."""
-        now = event.data[ATTR_NOW]
-
-        if now < point_in_time or hasattr(point_in_time_listener, 'run'):
-            return
-
-        # Set variable so that we will never run twice.
-        # Because the event bus might have to wait till a thread comes
-        # available to execute this listener it might occur that the
-        # listener gets lined up twice to be executed. This will make
-        # sure the second time it does nothing.
-        point_in_time_listener.run = True
-        async_unsub()
-
-        hass.async_run_job(action, now)
-
-    async_unsub = hass.bus.async_listen(EVENT_TIME_CHANGED,
-                                        point_in_time_listener)
-
-    return async_unsub
+    return async_get_point_in_time_scheduler(hass).async_schedule(
+        point_in_time, action)
 
 
 track_point_in_utc_time = threaded_listener_factory(
@@ -341,43 +550,41 @@ def async_track_utc_time_change(hass, action,
     matching_minutes = dt_util.parse_time_expression(minute, 0, 59)
     matching_hours = dt_util.parse_time_expression(hour, 0, 23)
 
-    next_time = None
+    scheduler = async_get_point_in_time_scheduler(hass)
+    remove = None
 
-    def calculate_next(now):
-        """Calculate and set the next time the trigger should fire."""
-        nonlocal next_time
+    def schedule_next(now):
+        """Schedule the listener for the next time matching the pattern."""
+        nonlocal remove
 
         localized_now = dt_util.as_local(now) if local else now
         next_time = dt_util.find_next_time_expression_time(
             localized_now, matching_seconds, matching_minutes,
             matching_hours)
-
-    # Make sure rolling back the clock doesn't prevent the timer from
-    # triggering.
-    last_now = None
+        remove = scheduler.async_schedule(
+            next_time, pattern_time_change_listener)
 
     @callback
-    def pattern_time_change_listener(event):
-        """Listen for matching time_changed events."""
-        nonlocal next_time, last_now
+    def pattern_time_change_listener(now):
+        """Handle points in time matching the pattern."""
+        hass.async_run_job(action, dt_util.as_local(now) if local else now)
+        schedule_next(now + timedelta(seconds=1))
 
-        now = event.data[ATTR_NOW]
-
-        if last_now is None or now < last_now:
-            # Time rolled back or next time not yet calculated
-            calculate_next(now)
+    @callback
+    def clock_rollback_listener(now):
+        """Reschedule when the system time abruptly jumps backwards."""
+        remove()
+        schedule_next(now)
 
-        last_now = now
+    remove_rollback = scheduler.async_listen_rollback(clock_rollback_listener)
+    schedule_next(dt_util.utcnow())
 
-        if next_time <= now:
-            hass.async_run_job(action, dt_util.as_local(now) if local else now)
-            calculate_next(now + timedelta(seconds=1))
+    def remove_listener():
+        """Remove time pattern listener."""
+        remove_rollback()
+        remove()
 
-    # We can't use async_track_point_in_utc_time here because it would
-    # break in the case that the system time abruptly jumps backwards.
-    # Our custom last_now logic takes care of resolving that scenario.
-    return hass.bus.async_listen(EVENT_TIME_CHANGED,
-                                 pattern_time_change_listener)
+    return remove_listener
 
 
 track_utc_time_change = threaded_listener_factory(async_track_utc_time_change)
@@ -394,6 +601,145 @@ def async_track_time_change(hass, action, hour=None, minute=None, second=None):
 track_time_change = threaded_listener_factory(async_track_time_change)
 
 
+class PointInTimeScheduler:
+    """Run point in time listeners when they are due.
+
+    Listeners are kept in a heap ordered by their point in time. Only a
+    single loop timer is armed, for the listener that is due first.
+    """
+
+    def __init__(self, hass):
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._heap = []
+        self._sequence = itertools.count()
+        self._cancelled = 0
+        self._rollback_listeners = []
+        self._last_now = dt_util.utcnow()
+        self._handle = None
+        self._running = False
+
+    @callback
+    def async_schedule(self, point_in_time, action):
+        """Run action with the current time once point_in_time passed.
+
+        Returns a function that can be called to remove the listener.
+        """
+        entry = [dt_util.as_utc(point_in_time), next(self._sequence), action]
+        heapq.heappush(self._heap, entry)
+
+        if self._heap[0] is entry:
+            self._async_arm()
+
+        @callback
+        def remove_listener():
+            """Remove point in time listener."""
+            if entry[2] is None:
+                return
+            entry[2] = None
+            self._cancelled += 1
+
+            if (self._cancelled > SCHEDULER_COMPACT_THRESHOLD and
+                    self._cancelled > len(self._heap) // 2):
+                self._heap = [item for item in self._heap
+                              if item[2] is not None]
+                heapq.heapify(self._heap)
+                self._cancelled = 0
+
+        return remove_listener
+
+    @callback
+    def async_listen_rollback(self, listener):
+        """Call listener with the current time when the clock rolls back.
+
+        Returns a function that can be called to remove the listener.
+        """
+        self._rollback_listeners.append(listener)
+
+        @callback
+        def remove_listener():
+            """Remove rollback listener."""
+            if listener in self._rollback_listeners:
+                self._rollback_listeners.remove(listener)
+
+        return remove_listener
+
+    @callback
+    def async_run_due(self, now):
+        """Run all listeners that are due at now."""
+        if now < self._last_now:
+            for listener in self._rollback_listeners[:]:
+                listener(now)
+
+        self._last_now = now
+
+        # Listeners that are scheduled while running the due ones
+        # have to wait for the next run.
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            entry = heapq.heappop(self._heap)
+
+            if entry[2] is None:
+                self._cancelled -= 1
+            else:
+                due.append(entry[2])
+                entry[2] = None
+
+        for action in due:
+            self.hass.async_run_job(action, now)
+
+        self._async_arm()
+
+    @callback
+    def async_start(self) -> None:
+        """Start running listeners on time."""
+        self._running = True
+        self._async_arm()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop running listeners."""
+        self._running = False
+        self._async_arm()
+
+    @callback
+    def _async_arm(self):
+        """Arm the loop timer for the listener that is due first."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+        if not self._running or not self._heap:
+            return
+
+        # Wake up at least every SCHEDULER_MAX_DELAY to pick up changes of
+        # the system time.
+        delay = (self._heap[0][0] - dt_util.utcnow()).total_seconds()
+        delay = min(max(delay, 0), SCHEDULER_MAX_DELAY)
+        self._handle = self.hass.loop.call_at(
+            self.hass.loop.time() + delay, self._async_timer_fired)
+
+    @callback
+    def _async_timer_fired(self):
+        """Handle the loop timer."""
+        self._handle = None
+        self.async_run_due(dt_util.utcnow())
+
+
+@callback
+@bind_hass
+def async_get_point_in_time_scheduler(
+        hass: HomeAssistant) -> PointInTimeScheduler:
+    """Return the point in time scheduler of hass."""
+    scheduler = hass.data.get(TRACK_POINT_IN_TIME_SCHEDULER)
+
+    if scheduler is None:
+        scheduler = hass.data[TRACK_POINT_IN_TIME_SCHEDULER] = \
+            PointInTimeScheduler(hass)
+
+    return scheduler
+
+
 def _process_state_match(parameter):
     """Convert parameter to function that matches input against parameter."""
     if parameter is None or parameter == MATCH_ALL:
@@ -2,7 +2,9 @@
 from datetime import datetime
 import json
 import logging
-from typing import Any
+from typing import Any, Dict, Iterable
+
+from homeassistant.core import Event, State
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,3 +26,36 @@ class JSONEncoder(json.JSONEncoder):
             return o.as_dict()
 
         return json.JSONEncoder.default(self, o)
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize an object, using the cached JSON of states."""
+    if isinstance(obj, State):
+        return obj.as_json()
+
+    return json.dumps(obj, cls=JSONEncoder, allow_nan=False)
+
+
+def dumps_states(states: Iterable[State]) -> str:
+    """Serialize a list of states from their cached JSON."""
+    return '[{}]'.format(', '.join(state.as_json() for state in states))
+
+
+def dumps_data(data: Dict) -> str:
+    """Serialize a dict, using the cached JSON of the states it holds."""
+    if not all(isinstance(key, str) for key in data):
+        return json.dumps(data, cls=JSONEncoder, allow_nan=False)
+
+    return '{{{}}}'.format(', '.join(
+        '{}: {}'.format(json.dumps(key), _dumps(value))
+        for key, value in data.items()))
+
+
+def dumps_event(event: Event) -> str:
+    """Serialize an event, using the cached JSON of the states it holds."""
+    return (
+        '{{"event_type": {}, "data": {}, "origin": {}, "time_fired": {}, '
+        '"context": {}}}').format(
+            json.dumps(event.event_type), dumps_data(event.data),
+            json.dumps(str(event.origin)), _dumps(event.time_fired),
+            json.dumps(event.context.as_dict()))
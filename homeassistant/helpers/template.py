@@ -1,4 +1,6 @@
 """Template helper methods for rendering strings with Home Assistant data."""
+from collections import OrderedDict, namedtuple
+from contextlib import contextmanager
 from datetime import datetime
 import json
 import logging
@@ -6,6 +8,7 @@ import math
 import random
 import base64
 import re
+import threading
 
 import jinja2
 from jinja2 import contextfilter
@@ -15,7 +18,7 @@ from jinja2.utils import Namespace
 from homeassistant.const import (
     ATTR_LATITUDE, ATTR_LONGITUDE, ATTR_UNIT_OF_MEASUREMENT, MATCH_ALL,
     STATE_UNKNOWN)
-from homeassistant.core import State, valid_entity_id
+from homeassistant.core import State, callback, valid_entity_id
 from homeassistant.exceptions import TemplateError
 from homeassistant.helpers import location as loc_helper
 from homeassistant.helpers.typing import TemplateVarsType
@@ -27,6 +30,7 @@ from homeassistant.util.async_ import run_callback_threadsafe
 
 _LOGGER = logging.getLogger(__name__)
 _SENTINEL = object()
+_RENDER_INFO = 'template.render_info'
 DATE_STR_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 _RE_NONE_ENTITIES = re.compile(r"distance\(|closest\(", re.I | re.M)
@@ -36,6 +40,12 @@ _RE_GET_ENTITIES = re.compile(
 )
 _RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{")
 
+# Number of compiled template sources kept in memory
+COMPILE_CACHE_SIZE = 1024
+
+CompileCacheInfo = namedtuple(
+    'CompileCacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
 
 @bind_hass
 def attach(hass, obj):
@@ -61,6 +71,74 @@ def render_complex(value, variables=None):
     return value.async_render(variables)
 
 
+class RenderInfo:
+    """Hold the entities and domains accessed by template renders."""
+
+    def __init__(self):
+        """Initialize the render info."""
+        self.entities = set()
+        self.domains = set()
+        self.all_states = False
+
+    @property
+    def is_static(self):
+        """Return True if no state was accessed."""
+        return not (self.all_states or self.entities or self.domains)
+
+    def update(self, other):
+        """Add what another render info accessed."""
+        self.entities |= other.entities
+        self.domains |= other.domains
+        self.all_states = self.all_states or other.all_states
+
+
+@contextmanager
+def async_collect_render_info(hass):
+    """Collect the states accessed by templates rendered in the block.
+
+    This method must be run in the event loop.
+    """
+    info = RenderInfo()
+    outer = hass.data.get(_RENDER_INFO)
+    hass.data[_RENDER_INFO] = info
+
+    try:
+        yield info
+    finally:
+        if outer is None:
+            hass.data.pop(_RENDER_INFO)
+        else:
+            hass.data[_RENDER_INFO] = outer
+            outer.update(info)
+
+
+@callback
+def _collect_entity(hass, entity_id):
+    """Record that a render accessed the state of an entity."""
+    info = hass.data.get(_RENDER_INFO)
+
+    if info is not None and isinstance(entity_id, str):
+        info.entities.add(entity_id.lower())
+
+
+@callback
+def _collect_domain(hass, domain):
+    """Record that a render accessed all states of a domain."""
+    info = hass.data.get(_RENDER_INFO)
+
+    if info is not None:
+        info.domains.add(domain.lower())
+
+
+@callback
+def _collect_all_states(hass):
+    """Record that a render accessed all states."""
+    info = hass.data.get(_RENDER_INFO)
+
+    if info is not None:
+        info.all_states = True
+
+
 def extract_entities(template, variables=None):
     """Extract all entities for state_changed listener from template string."""
     if template is None or _RE_JINJA_DELIMITERS.search(template) is None:
@@ -108,7 +186,7 @@ class Template:
             return
 
         try:
-            self._compiled_code = ENV.compile(self.template)
+            self._compiled_code = _COMPILE_CACHE.get(self.template)
         except jinja2.exceptions.TemplateSyntaxError as err:
             raise TemplateError(err)
 
@@ -190,7 +268,7 @@ class Template:
         global_vars = ENV.make_globals({
             'closest': template_methods.closest,
             'distance': template_methods.distance,
-            'is_state': self.hass.states.is_state,
+            'is_state': template_methods.is_state,
             'is_state_attr': template_methods.is_state_attr,
             'state_attr': template_methods.state_attr,
             'states': AllStates(self.hass),
@@ -208,6 +286,58 @@ class Template:
                 self.hass == other.hass)
 
 
+class _CompileCache:
+    """Least recently used cache of code compiled from template sources.
+
+    Code objects do not depend on hass, so all templates with the same
+    source share them. Safe to use from any thread.
+    """
+
+    def __init__(self, maxsize):
+        """Initialize the cache."""
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._codes = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, source):
+        """Return the compiled code of a template source."""
+        with self._lock:
+            code = self._codes.get(source)
+
+            if code is not None:
+                self._codes.move_to_end(source)
+                self.hits += 1
+                return code
+
+            self.misses += 1
+
+        code = ENV.compile(source)
+
+        with self._lock:
+            self._codes[source] = code
+
+            while len(self._codes) > self.maxsize:
+                self._codes.popitem(last=False)
+
+        return code
+
+    def info(self):
+        """Return the statistics of the cache."""
+        with self._lock:
+            return CompileCacheInfo(
+                self.hits, self.misses, self.maxsize, len(self._codes))
+
+
+_COMPILE_CACHE = _CompileCache(COMPILE_CACHE_SIZE)
+
+
+def compile_cache_info():
+    """Return hits, misses and size of the compiled template cache."""
+    return _COMPILE_CACHE.info()
+
+
 class AllStates:
     """Class to expose all HA states as attributes."""
 
@@ -221,6 +351,7 @@ class AllStates:
 
     def __iter__(self):
         """Return all states."""
+        _collect_all_states(self._hass)
         return iter(
             _wrap_state(state) for state in
             sorted(self._hass.states.async_all(),
@@ -228,10 +359,12 @@ class AllStates:
 
     def __len__(self):
         """Return number of states."""
+        _collect_all_states(self._hass)
         return len(self._hass.states.async_entity_ids())
 
     def __call__(self, entity_id):
         """Return the states."""
+        _collect_entity(self._hass, entity_id)
         state = self._hass.states.get(entity_id)
         return STATE_UNKNOWN if state is None else state.state
 
@@ -246,18 +379,21 @@ class DomainStates:
 
     def __getattr__(self, name):
         """Return the states."""
-        return _wrap_state(
-            self._hass.states.get('{}.{}'.format(self._domain, name)))
+        entity_id = '{}.{}'.format(self._domain, name)
+        _collect_entity(self._hass, entity_id)
+        return _wrap_state(self._hass.states.get(entity_id))
 
     def __iter__(self):
         """Return the iteration over all the states."""
+        _collect_domain(self._hass, self._domain)
         return iter(sorted(
-            (_wrap_state(state) for state in self._hass.states.async_all()
-             if state.domain == self._domain),
+            (_wrap_state(state) for state in
+             self._hass.states.async_all(self._domain)),
             key=lambda state: state.entity_id))
 
     def __len__(self):
         """Return number of states."""
+        _collect_domain(self._hass, self._domain)
         return len(self._hass.states.async_entity_ids(self._domain))
 
 
@@ -360,9 +496,14 @@ class TemplateMethods:
                 gr_entity_id = str(entities)
 
             group = self._hass.components.group
+            entity_ids = group.expand_entity_ids([gr_entity_id])
+
+            _collect_entity(self._hass, gr_entity_id)
+            for entity_id in entity_ids:
+                _collect_entity(self._hass, entity_id)
 
             states = [self._hass.states.get(entity_id) for entity_id
-                      in group.expand_entity_ids([gr_entity_id])]
+                      in entity_ids]
 
         return _wrap_state(loc_helper.closest(latitude, longitude, states))
 
@@ -421,6 +562,11 @@ class TemplateMethods:
         return self._hass.config.units.length(
             loc_util.distance(*locations[0] + locations[1]), 'm')
 
+    def is_state(self, entity_id, state):
+        """Test if a state is a specific value."""
+        _collect_entity(self._hass, entity_id)
+        return self._hass.states.is_state(entity_id, state)
+
     def is_state_attr(self, entity_id, name, value):
         """Test if a state is a specific attribute."""
         state_attr = self.state_attr(entity_id, name)
@@ -428,6 +574,7 @@ class TemplateMethods:
 
     def state_attr(self, entity_id, name):
         """Get a specific attribute from a state."""
+        _collect_entity(self._hass, entity_id)
         state_obj = self._hass.states.get(entity_id)
         if state_obj is not None:
             return state_obj.attributes.get(name)
@@ -438,6 +585,7 @@ class TemplateMethods:
         if isinstance(entity_id_or_state, State):
             return entity_id_or_state
         if isinstance(entity_id_or_state, str):
+            _collect_entity(self._hass, entity_id_or_state)
             return self._hass.states.get(entity_id_or_state)
         return None
 
@@ -2,13 +2,12 @@
 import argparse
 import asyncio
 from contextlib import suppress
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
 from timeit import default_timer as timer
 
 from homeassistant import core
-from homeassistant.const import (
-    ATTR_NOW, EVENT_STATE_CHANGED, EVENT_TIME_CHANGED)
+from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.util import dt as dt_util
 
 BENCHMARKS = {}
@@ -67,11 +66,11 @@ async def async_million_events(hass):
 
     hass.bus.async_listen(event_name, listener)
 
+    start = timer()
+
     for _ in range(10**6):
         hass.bus.async_fire(event_name)
 
-    start = timer()
-
     await event.wait()
 
     return timer() - start
@@ -79,7 +78,7 @@ async def async_million_events(hass):
 
 @benchmark
 async def async_million_time_changed_helper(hass):
-    """Run a million events through time changed helper."""
+    """Run a million points in time through time changed helper."""
     count = 0
     event = asyncio.Event(loop=hass.loop)
 
@@ -92,16 +91,17 @@ async def async_million_time_changed_helper(hass):
         if count == 10**6:
             event.set()
 
-    hass.helpers.event.async_track_time_change(listener, minute=0, second=0)
-    event_data = {
-        ATTR_NOW: datetime(2017, 10, 10, 15, 0, 0, tzinfo=dt_util.UTC)
-    }
+    scheduler = hass.helpers.event.async_get_point_in_time_scheduler()
+    now = datetime(2017, 10, 10, 15, 0, 0, tzinfo=dt_util.UTC)
 
-    for _ in range(10**6):
-        hass.bus.async_fire(EVENT_TIME_CHANGED, event_data)
+    hass.helpers.event.async_track_time_change(listener, second=0)
 
     start = timer()
 
+    for _ in range(10**6):
+        now += timedelta(minutes=1)
+        scheduler.async_run_due(now)
+
     await event.wait()
 
     return timer() - start
@@ -131,14 +131,203 @@ async def async_million_state_changed_helper(hass):
         'new_state': core.State(entity_id, 'on'),
     }
 
+    start = timer()
+
     for _ in range(10**6):
         hass.bus.async_fire(EVENT_STATE_CHANGED, event_data)
 
+    await event.wait()
+
+    return timer() - start
+
+
+@benchmark
+async def async_fire_10_listeners(hass):
+    """Fire events to 10 listeners."""
+    return await _async_fire_listeners(hass, 10)
+
+
+@benchmark
+async def async_fire_100_listeners(hass):
+    """Fire events to 100 listeners."""
+    return await _async_fire_listeners(hass, 100)
+
+
+@benchmark
+async def async_fire_1000_listeners(hass):
+    """Fire events to 1000 listeners."""
+    return await _async_fire_listeners(hass, 1000)
+
+
+async def _async_fire_listeners(hass, listener_count):
+    """Fire events to listener_count listeners and print events/sec."""
+    event_count = 10**4
+    event_name = 'benchmark_event'
+    count = 0
+    event = asyncio.Event(loop=hass.loop)
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+        if count == event_count:
+            event.set()
+
+    # Only the first listener counts, the rest are there to fan out to.
+    hass.bus.async_listen(event_name, listener)
+    for _ in range(listener_count - 1):
+        hass.bus.async_listen(event_name, core.callback(lambda _: None))
+
     start = timer()
 
+    for _ in range(event_count):
+        hass.bus.async_fire(event_name)
+
     await event.wait()
 
-    return timer() - start
+    runtime = timer() - start
+    print('{} listeners: {:.0f} events/sec'.format(
+        listener_count, event_count / runtime))
+    return runtime
+
+
+@benchmark
+async def mqtt_dispatch_replay(hass):
+    """Replay a stream of MQTT messages to 1500 subscriptions."""
+    from paho.mqtt.client import MQTTMessage
+    from homeassistant.components import mqtt
+
+    device_count = 500
+    message_count = 10**5
+    count = 0
+
+    client = mqtt.MQTT(
+        hass, 'localhost', 1883, client_id=None, keepalive=60,
+        username=None, password=None, certificate=None, client_key=None,
+        client_cert=None, tls_insecure=None, protocol=mqtt.PROTOCOL_311,
+        will_message=None, birth_message=None, tls_version=None)
+
+    @core.callback
+    def message_received(_):
+        """Handle message."""
+        nonlocal count
+        count += 1
+
+    # Subscriptions of a setup with Tasmota and zigbee2mqtt devices
+    topics = ['homeassistant/+/+/config', 'homeassistant/+/+/+/config',
+              'tele/+/LWT']
+    for idx in range(device_count):
+        topics.append('stat/tasmota_{}/POWER'.format(idx))
+        topics.append('tele/tasmota_{}/STATE'.format(idx))
+        topics.append('zigbee2mqtt/device_{}'.format(idx))
+
+    for topic in topics:
+        # pylint: disable=protected-access
+        client._async_add_subscription(
+            mqtt.Subscription(topic, message_received))
+
+    # The message stream: state updates, availability and a few topics
+    # without subscribers, as they arrive from the broker.
+    stream_topics = ('stat/tasmota_{}/POWER', 'tele/tasmota_{}/STATE',
+                     'zigbee2mqtt/device_{}', 'tele/tasmota_{}/LWT',
+                     'tele/tasmota_{}/SENSOR')
+    messages = []
+    for idx in range(message_count):
+        msg = MQTTMessage(topic=stream_topics[idx % len(stream_topics)]
+                          .format(idx % device_count).encode())
+        msg.payload = b'{"state": "ON"}'
+        messages.append(msg)
+
+    start = timer()
+
+    for msg in messages:
+        # pylint: disable=protected-access
+        client._mqtt_handle_message(msg)
+
+    runtime = timer() - start
+    print('{} subscriptions: {:.0f} messages/sec, {} dispatched'.format(
+        len(topics), message_count / runtime, count))
+    return runtime
+
+
+@benchmark
+async def template_compile(hass):
+    """Validate the templates of 500 automations, reloaded 5 times."""
+    from homeassistant.helpers import template
+
+    automation_count = 500
+    reload_count = 5
+    # Automations created from a few blueprints only differ in their entity
+    sources = [
+        "{{{{ states('sensor.temperature_{}') | float > 20 }}}}",
+        "{{{{ is_state('binary_sensor.motion_{}', 'on') and "
+        "states.sun.sun.state == 'below_horizon' }}}}",
+        "{{% if trigger.to_state.state == 'on' %}}light.room_{}"
+        "{{% else %}}light.hall{{% endif %}}",
+        "{{{{ (now() - states.switch.pump.last_changed).seconds > 300 }}}}",
+    ]
+    templates = [sources[idx % len(sources)].format(idx % 50)
+                 for idx in range(automation_count)]
+
+    start = timer()
+
+    for _ in range(reload_count):
+        for source in templates:
+            template.Template(source, hass).ensure_valid()
+
+    runtime = timer() - start
+    info = template.compile_cache_info()
+    print('{} templates: {} compiled, {} from cache'.format(
+        automation_count * reload_count, info.misses, info.hits))
+    return runtime
+
+
+@benchmark
+async def statistics_window(hass):
+    """Update the statistics of 10000 samples with 10000 new ones."""
+    import statistics
+    from collections import deque
+    from homeassistant.components.statistics.window import SampleWindow
+
+    sampling_size = 10000
+    values = [(idx * 7919) % 1000 / 10 for idx in range(sampling_size * 2)]
+
+    def recompute(samples):
+        """Compute the statistics like the sensor used to."""
+        return (statistics.mean(samples), statistics.median(samples),
+                statistics.variance(samples), sum(samples), min(samples),
+                max(samples))
+
+    def running(window):
+        """Read the running statistics of the window."""
+        return (window.mean, window.median, window.variance, window.total,
+                window.min, window.max)
+
+    samples = deque(values[:sampling_size], maxlen=sampling_size)
+    start = timer()
+
+    for value in values[sampling_size:sampling_size + 100]:
+        samples.append(value)
+        recompute(samples)
+
+    recomputed = (timer() - start) * sampling_size / 100
+
+    window = SampleWindow(sampling_size)
+    for value in values[:sampling_size]:
+        window.append(value)
+
+    start = timer()
+
+    for value in values[sampling_size:]:
+        window.append(value)
+        running(window)
+
+    runtime = timer() - start
+    print('Recomputing the statistics would take {:.2f} seconds'.format(
+        recomputed))
+    return runtime
 
 
 @benchmark
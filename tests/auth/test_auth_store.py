@@ -259,3 +259,26 @@ async def test_loading_race_condition(hass):
         mock_dev_registry.assert_called_once_with(hass)
         mock_load.assert_called_once_with()
         assert results[0] == results[1]
+
+
+async def test_refresh_token_lookups(hass):
+    """Test looking up refresh tokens by id and by token."""
+    store = auth_store.AuthStore(hass)
+    user = await store.async_create_user('Paulus')
+    other = await store.async_create_user('Other')
+    token = await store.async_create_refresh_token(user, 'client')
+    other_token = await store.async_create_refresh_token(other, 'client')
+
+    assert await store.async_get_refresh_token(token.id) is token
+    assert await store.async_get_refresh_token_by_token(token.token) is token
+    assert await store.async_get_refresh_token_by_token('invalid') is None
+
+    await store.async_remove_refresh_token(token)
+    assert token.id not in user.refresh_tokens
+    assert await store.async_get_refresh_token(token.id) is None
+    assert await store.async_get_refresh_token_by_token(token.token) is None
+
+    await store.async_remove_user(other)
+    assert await store.async_get_refresh_token(other_token.id) is None
+    assert await store.async_get_refresh_token_by_token(
+        other_token.token) is None
@@ -343,6 +343,48 @@ async def test_cannot_retrieve_expired_access_token(hass):
     )
 
 
+async def test_validated_access_tokens_are_cached(hass):
+    """Test that validated access tokens are not decoded again."""
+    manager = await auth.auth_manager_from_config(hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+
+    assert (
+        await manager.async_validate_access_token(access_token)
+        is refresh_token
+    )
+
+    with patch('homeassistant.auth.jwt.decode',
+               side_effect=jwt.InvalidTokenError) as mock_decode:
+        assert (
+            await manager.async_validate_access_token(access_token)
+            is refresh_token
+        )
+    assert len(mock_decode.mock_calls) == 0
+
+    user.is_active = False
+    assert await manager.async_validate_access_token(access_token) is None
+    user.is_active = True
+
+    # Expired tokens are decoded again
+    with patch('homeassistant.util.dt.utcnow',
+               return_value=dt_util.utcnow() +
+               auth_const.ACCESS_TOKEN_EXPIRATION), \
+            patch('homeassistant.auth.jwt.decode',
+                  side_effect=jwt.InvalidTokenError) as mock_decode:
+        assert await manager.async_validate_access_token(access_token) is None
+    assert len(mock_decode.mock_calls) == 1
+
+    assert (
+        await manager.async_validate_access_token(access_token)
+        is refresh_token
+    )
+
+    await manager.async_remove_refresh_token(refresh_token)
+    assert await manager.async_validate_access_token(access_token) is None
+
+
 async def test_generating_system_user(hass):
     """Test that we can add a system user."""
     events = []
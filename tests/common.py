@@ -31,6 +31,7 @@ from homeassistant.const import (
 from homeassistant.helpers import (
     area_registry, device_registry, entity, entity_platform, entity_registry,
     intent, restore_state, storage)
+from homeassistant.helpers.event import async_get_point_in_time_scheduler
 from homeassistant.setup import async_setup_component, setup_component
 from homeassistant.util.unit_system import METRIC_SYSTEM
 from homeassistant.util.async_ import (
@@ -254,8 +255,10 @@ fire_mqtt_message = threadsafe_callback_factory(async_fire_mqtt_message)
 
 @ha.callback
 def async_fire_time_changed(hass, time):
-    """Fire a time changes event."""
-    hass.bus.async_fire(EVENT_TIME_CHANGED, {'now': date_util.as_utc(time)})
+    """Fire a time changes event and run due point in time listeners."""
+    time = date_util.as_utc(time)
+    hass.bus.async_fire(EVENT_TIME_CHANGED, {'now': time})
+    async_get_point_in_time_scheduler(hass).async_run_due(time)
 
 
 fire_time_changed = threadsafe_callback_factory(async_fire_time_changed)
@@ -336,7 +339,7 @@ def mock_component(hass, component):
 def mock_registry(hass, mock_entries=None):
     """Mock the Entity Registry."""
     registry = entity_registry.EntityRegistry(hass)
-    registry.entities = mock_entries or OrderedDict()
+    registry.entities = entity_registry.EntityRegistryItems(mock_entries)
 
     hass.data[entity_registry.DATA_REGISTRY] = registry
     return registry
@@ -354,7 +357,7 @@ def mock_area_registry(hass, mock_entries=None):
 def mock_device_registry(hass, mock_entries=None):
     """Mock the Device Registry."""
     registry = device_registry.DeviceRegistry(hass)
-    registry.devices = mock_entries or OrderedDict()
+    registry.devices = device_registry.DeviceRegistryItems(mock_entries)
 
     hass.data[device_registry.DATA_REGISTRY] = registry
     return registry
@@ -2,7 +2,7 @@
 import asyncio
 import base64
 import io
-from unittest.mock import patch, mock_open, PropertyMock
+from unittest.mock import Mock, patch, mock_open, PropertyMock
 
 import pytest
 
@@ -10,7 +10,9 @@ from homeassistant.setup import setup_component, async_setup_component
 from homeassistant.const import (
     ATTR_ENTITY_ID, ATTR_ENTITY_PICTURE, EVENT_HOMEASSISTANT_START)
 from homeassistant.components import camera, http
-from homeassistant.components.camera.const import DOMAIN, PREF_PRELOAD_STREAM
+from homeassistant.components.camera.const import (
+    DOMAIN, PREF_FRAME_MAX_AGE, PREF_PRELOAD_STREAM)
+from homeassistant.components.camera.frames import CameraFrames
 from homeassistant.components.camera.prefs import CameraEntityPreferences
 from homeassistant.components.websocket_api.const import TYPE_RESULT
 from homeassistant.exceptions import HomeAssistantError
@@ -376,3 +378,102 @@ async def test_record_service(hass, mock_camera, mock_stream):
         # So long as we call stream.record, the rest should be covered
         # by those tests.
         assert mock_record_service.called
+
+
+async def test_get_image_coalesces_fetches(hass, mock_camera):
+    """Test concurrent requests share one fetch of the camera image."""
+    with patch('homeassistant.components.demo.camera.DemoCamera.camera_image',
+               return_value=b'Test') as mock_image:
+        images = await asyncio.gather(*(
+            camera.async_get_image(hass, 'camera.demo_camera')
+            for _ in range(3)))
+        assert [image.content for image in images] == [b'Test'] * 3
+        assert len(mock_image.mock_calls) == 1
+
+        # Without a max age, the next request fetches a new image
+        await camera.async_get_image(hass, 'camera.demo_camera')
+        assert len(mock_image.mock_calls) == 2
+
+
+async def test_get_image_frame_max_age(hass, hass_ws_client, mock_camera):
+    """Test frames are reused within the configured max age."""
+    client = await hass_ws_client(hass)
+    await client.send_json({
+        'id': 5,
+        'type': 'camera/update_prefs',
+        'entity_id': 'camera.demo_camera',
+        'frame_max_age': 60,
+    })
+    response = await client.receive_json()
+    assert response['success']
+    assert response['result'][PREF_FRAME_MAX_AGE] == 60
+
+    with patch('homeassistant.components.demo.camera.DemoCamera.camera_image',
+               return_value=b'Test') as mock_image:
+        await camera.async_get_image(hass, 'camera.demo_camera')
+        await camera.async_get_image(hass, 'camera.demo_camera')
+        assert len(mock_image.mock_calls) == 1
+
+        now = hass.loop.time()
+        with patch.object(hass.loop, 'time', return_value=now + 61):
+            await camera.async_get_image(hass, 'camera.demo_camera')
+        assert len(mock_image.mock_calls) == 2
+
+
+def _mock_frame_camera(entity_id, images):
+    """Return a camera returning the given images."""
+    cam = Mock(entity_id=entity_id)
+    cam.async_camera_image.side_effect = lambda: mock_coro(next(images))
+    return cam
+
+
+async def test_frame_cache_max_size(hass):
+    """Test the frame cache stays within its memory limit."""
+    prefs = Mock()
+    prefs.get.return_value.frame_max_age = 60
+    frames = CameraFrames(hass, prefs, max_size=10)
+    cam_1 = _mock_frame_camera('camera.one', iter([b'12345', b'12345']))
+    cam_2 = _mock_frame_camera('camera.two', iter([b'123456', b'123456']))
+    cam_3 = _mock_frame_camera('camera.three', iter([b'12345678901']))
+
+    assert await frames.async_get_frame(cam_1) == b'12345'
+    assert await frames.async_get_frame(cam_1) == b'12345'
+    assert len(cam_1.async_camera_image.mock_calls) == 1
+
+    # Evicts the frame of the first camera
+    assert await frames.async_get_frame(cam_2) == b'123456'
+    assert await frames.async_get_frame(cam_1) == b'12345'
+    assert len(cam_1.async_camera_image.mock_calls) == 2
+
+    # Evicts the frame of the second camera
+    assert await frames.async_get_frame(cam_2) == b'123456'
+    assert len(cam_2.async_camera_image.mock_calls) == 2
+
+    # Frames larger than the limit are not cached
+    assert await frames.async_get_frame(cam_3) == b'12345678901'
+    assert await frames.async_get_frame(cam_2) == b'123456'
+    assert len(cam_2.async_camera_image.mock_calls) == 2
+
+
+async def test_still_stream_fan_out(hass):
+    """Test still stream subscribers share the fetched frames."""
+    prefs = Mock()
+    prefs.get.return_value.frame_max_age = 0
+    frames = CameraFrames(hass, prefs)
+    cam = _mock_frame_camera(
+        'camera.demo', iter([b'one', b'one', b'two', None]))
+
+    queue_1 = frames.async_subscribe(cam, 0)
+    queue_2 = frames.async_subscribe(cam, 0)
+
+    assert await queue_1.get() == b'one'
+    assert await queue_2.get() == b'one'
+    assert await queue_1.get() == b'two'
+    assert await queue_2.get() == b'two'
+    assert await queue_1.get() is None
+    assert await queue_2.get() is None
+    assert len(cam.async_camera_image.mock_calls) == 4
+
+    frames.async_unsubscribe(cam, 0, queue_1)
+    frames.async_unsubscribe(cam, 0, queue_2)
+    assert not frames._broadcasts
@@ -22,7 +22,8 @@ from homeassistant.util.unit_system import METRIC_SYSTEM
 from homeassistant.components import input_boolean, switch
 from homeassistant.components.climate.const import (
     ATTR_OPERATION_MODE, STATE_HEAT, STATE_COOL, DOMAIN)
-from tests.common import assert_setup_component, mock_restore_cache
+from tests.common import (
+    assert_setup_component, async_fire_time_changed, mock_restore_cache)
 from tests.components.climate import common
 
 
@@ -925,7 +926,7 @@ async def test_temp_change_ac_trigger_off_long_enough_3(hass, setup_comp_7):
 
 def _send_time_changed(hass, now):
     """Send a time changed event."""
-    hass.bus.async_fire(ha.EVENT_TIME_CHANGED, {ha.ATTR_NOW: now})
+    async_fire_time_changed(hass, now)
 
 
 @pytest.fixture
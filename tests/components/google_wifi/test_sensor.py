@@ -5,13 +5,13 @@ from datetime import datetime, timedelta
 
 import requests_mock
 
-from homeassistant import core as ha
 from homeassistant.setup import setup_component
 import homeassistant.components.google_wifi.sensor as google_wifi
 from homeassistant.const import STATE_UNKNOWN
 from homeassistant.util import dt as dt_util
 
-from tests.common import get_test_home_assistant, assert_setup_component
+from tests.common import (
+    get_test_home_assistant, assert_setup_component, fire_time_changed)
 
 NAME = 'foo'
 
@@ -120,7 +120,7 @@ class TestGoogleWifiSensor(unittest.TestCase):
         """Fake delay to prevent update throttle."""
         hass_now = dt_util.utcnow()
         shifted_time = hass_now + timedelta(seconds=ha_delay)
-        self.hass.bus.fire(ha.EVENT_TIME_CHANGED, {ha.ATTR_NOW: shifted_time})
+        fire_time_changed(self.hass, shifted_time)
 
     def test_name(self):
         """Test the name."""
@@ -10,6 +10,7 @@ from homeassistant.const import (
     STATE_ON, STATE_OFF, STATE_HOME, STATE_UNKNOWN, ATTR_ICON, ATTR_HIDDEN,
     ATTR_ASSUMED_STATE, STATE_NOT_HOME, ATTR_FRIENDLY_NAME)
 import homeassistant.components.group as group
+from homeassistant.helpers.event import TRACK_STATE_CHANGE_CALLBACKS
 
 from tests.common import get_test_home_assistant, assert_setup_component
 from tests.components.group import common
@@ -323,6 +324,56 @@ class TestComponentsGroup(unittest.TestCase):
             sorted(group.expand_entity_ids(self.hass,
                                            ['group.group_of_groups']))
 
+    def test_expand_entity_ids_follows_nested_membership(self):
+        """Test cached expansions follow changes of nested groups."""
+        light_group = group.Group.create_group(
+            self.hass, 'light', ['light.test_1'])
+        group.Group.create_group(
+            self.hass, 'group_of_groups', ['group.light', 'switch.test_1'])
+
+        assert ['light.test_1', 'switch.test_1'] == \
+            group.expand_entity_ids(self.hass, ['group.group_of_groups'])
+
+        light_group.update_tracked_entity_ids(['light.test_1', 'light.test_2'])
+
+        assert ['light.test_1', 'light.test_2', 'switch.test_1'] == \
+            group.expand_entity_ids(self.hass, ['group.group_of_groups'])
+
+        self.hass.states.remove('group.light')
+
+        assert ['switch.test_1'] == \
+            group.expand_entity_ids(self.hass, ['group.group_of_groups'])
+
+    def test_member_change_only_reads_changed_member(self):
+        """Test a member change does not read the state of all members."""
+        entity_ids = ['light.test_{}'.format(idx) for idx in range(10)]
+        for entity_id in entity_ids:
+            self.hass.states.set(entity_id, STATE_OFF)
+        test_group = group.Group.create_group(
+            self.hass, 'init_group', entity_ids, mode=True)
+        assert STATE_OFF == self.hass.states.get(test_group.entity_id).state
+
+        with patch.object(self.hass.states, 'get',
+                          wraps=self.hass.states.get) as mock_get:
+            for entity_id in entity_ids[:-1]:
+                self.hass.states.set(entity_id, STATE_ON)
+            self.hass.block_till_done()
+            state = self.hass.states.get(test_group.entity_id)
+            assert STATE_OFF == state.state
+            assert len(mock_get.mock_calls) < len(entity_ids)
+
+        self.hass.states.set(entity_ids[-1], STATE_ON, {
+            ATTR_ASSUMED_STATE: True
+        })
+        self.hass.block_till_done()
+        state = self.hass.states.get(test_group.entity_id)
+        assert STATE_ON == state.state
+        assert not state.attributes.get(ATTR_ASSUMED_STATE)
+
+        self.hass.states.remove(entity_ids[0])
+        self.hass.block_till_done()
+        assert STATE_ON == self.hass.states.get(test_group.entity_id).state
+
     def test_set_assumed_state_based_on_tracked(self):
         """Test assumed state."""
         self.hass.states.set('light.Bowl', STATE_ON)
@@ -382,7 +433,9 @@ class TestComponentsGroup(unittest.TestCase):
         assert sorted(self.hass.states.entity_ids()) == \
             ['group.all_tests', 'group.empty_group', 'group.second_group',
              'group.test_group']
-        assert self.hass.bus.listeners['state_changed'] == 3
+        assert sorted(self.hass.data[TRACK_STATE_CHANGE_CALLBACKS]) == \
+            ['hello.world', 'light.bowl', 'sensor.happy', 'test.one',
+             'test.two']
 
         with patch('homeassistant.config.load_yaml_config_file', return_value={
             'group': {
@@ -398,7 +451,8 @@ class TestComponentsGroup(unittest.TestCase):
 
         assert sorted(self.hass.states.entity_ids()) == \
             ['group.all_tests', 'group.hello']
-        assert self.hass.bus.listeners['state_changed'] == 2
+        assert sorted(self.hass.data[TRACK_STATE_CHANGE_CALLBACKS]) == \
+            ['light.bowl', 'test.one', 'test.two']
 
     def test_changing_group_visibility(self):
         """Test that a group can be hidden and shown."""
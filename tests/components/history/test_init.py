@@ -92,6 +92,49 @@ class TestComponentHistory(unittest.TestCase):
         assert states[0] == \
             history.get_state(self.hass, future, states[0].entity_id)
 
+    def test_get_states_from_snapshot(self):
+        """Test getting states at a point in time after a snapshot."""
+        from homeassistant.components.recorder.models import StateSnapshots
+
+        self.init_recorder()
+
+        def record_state(entity_id, state, point):
+            """Record a state at point."""
+            state = ha.State(entity_id, state, {'point': point.isoformat()},
+                             last_changed=point, last_updated=point)
+            mock_state_change_event(self.hass, state)
+            return state
+
+        start = dt_util.utcnow()
+        two_hours = start + timedelta(hours=2)
+        after_snapshot = two_hours + timedelta(minutes=1)
+
+        unchanged = record_state('test.unchanged', 'on', start)
+        record_state('test.changed', 'off', start)
+        record_state('test.snapshot', 'on', two_hours)
+        self.wait_recording_done()
+
+        changed = record_state('test.changed', 'on', after_snapshot)
+        self.wait_recording_done()
+
+        with recorder.session_scope(hass=self.hass) as session:
+            snapshots = session.query(StateSnapshots).filter(
+                StateSnapshots.snapshot_time == two_hours).all()
+            assert sorted(row.entity_id for row in snapshots) == [
+                'test.changed', 'test.snapshot', 'test.unchanged']
+
+        states = history.get_states(
+            self.hass, after_snapshot + timedelta(seconds=1))
+        states = {state.entity_id: state for state in states}
+        assert states['test.unchanged'] == unchanged
+        assert states['test.changed'] == changed
+        assert states['test.snapshot'].state == 'on'
+
+        states = history.get_states(self.hass, after_snapshot)
+        states = {state.entity_id: state for state in states}
+        assert states['test.unchanged'] == unchanged
+        assert states['test.changed'].state == 'off'
+
     def test_state_changes_during_period(self):
         """Test state change during period."""
         self.init_recorder()
@@ -243,6 +286,44 @@ class TestComponentHistory(unittest.TestCase):
             filters=history.Filters())
         assert states == hist
 
+    def test_get_significant_states_entity_ids_without_filters(self):
+        """Test that the entity ids are applied without filters."""
+        zero, four, states = self.record_states()
+        del states['media_player.test2']
+        del states['thermostat.test2']
+        del states['script.can_cancel_this_one']
+
+        hist = history.get_significant_states(
+            self.hass, zero, four, ['media_player.test', 'thermostat.test'])
+        assert states == hist
+
+    def test_stream_significant_states(self):
+        """Test streaming the significant states of every entity."""
+        zero, four, _ = self.record_states()
+        one = zero + timedelta(seconds=1)
+        hist = history.get_significant_states(
+            self.hass, one, four, filters=history.Filters())
+
+        streamed = {}
+        for entity_states in history.stream_significant_states(
+                self.hass, one, four, filters=history.Filters()):
+            entity_states = list(entity_states)
+            streamed[entity_states[0].entity_id] = entity_states
+        assert streamed == hist
+
+    def test_stream_significant_states_entity_order(self):
+        """Test streaming entities in the requested order first."""
+        zero, four, states = self.record_states()
+        order = ['thermostat.test2', 'media_player.test', 'sensor.unknown']
+
+        entity_ids = [
+            list(entity_states)[0].entity_id for entity_states in
+            history.stream_significant_states(
+                self.hass, zero, four, filters=history.Filters(),
+                entity_order=order)]
+        assert entity_ids[:2] == order[:2]
+        assert sorted(entity_ids) == sorted(states)
+
     def test_get_significant_states_exclude_domain(self):
         """Test if significant states are returned when excluding domains.
 
@@ -524,3 +605,30 @@ async def test_fetch_period_api(hass, hass_client):
     response = await client.get(
         '/api/history/period/{}'.format(dt_util.utcnow().isoformat()))
     assert response.status == 200
+
+
+async def test_fetch_period_api_entity_order(hass, hass_client):
+    """Test the fetch period view streams included entities first."""
+    await hass.async_add_job(init_recorder_component, hass)
+    await async_setup_component(hass, 'history', {
+        'history': {
+            'use_include_order': True,
+            'include': {'entities': ['light.kitchen', 'light.bed']},
+        }
+    })
+    start = dt_util.utcnow()
+    hass.states.async_set('light.bed', 'on')
+    hass.states.async_set('light.kitchen', 'off')
+    hass.states.async_set('light.kitchen', 'on')
+    await hass.async_block_till_done()
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    response = await client.get(
+        '/api/history/period/{}'.format(start.isoformat()))
+    assert response.status == 200
+
+    result = await response.json()
+    assert [[state['state'] for state in states] for states in result] == [
+        ['off', 'on'], ['on']]
+    assert result[0][0]['entity_id'] == 'light.kitchen'
@@ -16,10 +16,10 @@ from homeassistant.components.homekit.const import (
     CONF_LINKED_BATTERY_SENSOR, MANUFACTURER, SERV_ACCESSORY_INFO)
 from homeassistant.const import (
     __version__, ATTR_BATTERY_CHARGING, ATTR_BATTERY_LEVEL, ATTR_ENTITY_ID,
-    ATTR_SERVICE, ATTR_NOW, EVENT_TIME_CHANGED)
+    ATTR_SERVICE)
 import homeassistant.util.dt as dt_util
 
-from tests.common import async_mock_service
+from tests.common import async_fire_time_changed, async_mock_service
 
 
 async def test_debounce(hass):
@@ -39,8 +39,7 @@ async def test_debounce(hass):
 
     with patch('homeassistant.util.dt.utcnow', return_value=now):
         await hass.async_add_job(debounce_demo, mock, 'value')
-    hass.bus.async_fire(
-        EVENT_TIME_CHANGED, {ATTR_NOW: now + timedelta(seconds=3)})
+    async_fire_time_changed(hass, now + timedelta(seconds=3))
     await hass.async_block_till_done()
     assert counter == 1
     assert len(arguments) == 2
@@ -49,8 +48,7 @@ async def test_debounce(hass):
         await hass.async_add_job(debounce_demo, mock, 'value')
         await hass.async_add_job(debounce_demo, mock, 'value')
 
-    hass.bus.async_fire(
-        EVENT_TIME_CHANGED, {ATTR_NOW: now + timedelta(seconds=3)})
+    async_fire_time_changed(hass, now + timedelta(seconds=3))
     await hass.async_block_till_done()
     assert counter == 2
 
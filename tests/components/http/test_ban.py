@@ -1,5 +1,6 @@
 """The tests for the Home Assistant HTTP component."""
 # pylint: disable=protected-access
+from datetime import timedelta
 from ipaddress import ip_address
 from unittest.mock import patch, mock_open, Mock
 
@@ -12,7 +13,10 @@ from homeassistant.components.http.view import request_handler_factory
 from homeassistant.setup import async_setup_component
 import homeassistant.components.http as http
 from homeassistant.components.http.ban import (
-    IpBan, IP_BANS_FILE, setup_bans, KEY_BANNED_IPS, KEY_FAILED_LOGIN_ATTEMPTS)
+    IpBan, IpBanList, IP_BANS_FILE, LoginAttempts, setup_bans, KEY_BANNED_IPS,
+    KEY_FAILED_LOGIN_ATTEMPTS, LOGIN_ATTEMPTS_EXPIRATION,
+    async_load_ip_bans_config)
+import homeassistant.util.dt as dt_util
 
 from . import mock_real_ip
 
@@ -39,6 +43,80 @@ async def test_access_from_banned_ip(hass, aiohttp_client):
         assert resp.status == 403
 
 
+async def test_access_from_banned_network(hass, aiohttp_client):
+    """Test accessing to server from a banned network."""
+    app = web.Application()
+    setup_bans(hass, app, 5)
+    set_real_ip = mock_real_ip(app)
+
+    with patch('homeassistant.components.http.ban.async_load_ip_bans_config',
+               return_value=mock_coro([IpBan('10.0.0.0/8')])):
+        client = await aiohttp_client(app)
+
+    set_real_ip('10.1.2.3')
+    resp = await client.get('/')
+    assert resp.status == 403
+
+    set_real_ip('11.1.2.3')
+    resp = await client.get('/')
+    assert resp.status == 404
+
+
+def test_ip_ban_list():
+    """Test checking addresses against banned addresses and networks."""
+    bans = IpBanList([IpBan(banned_ip) for banned_ip in BANNED_IPS])
+    bans.add(IpBan('192.168.0.0/16'))
+    bans.add(IpBan('2001:db8::/32'))
+
+    assert len(bans) == len(BANNED_IPS) + 2
+    assert ip_address('200.201.202.203') in bans
+    assert ip_address('200.201.202.204') not in bans
+    assert ip_address('192.168.10.1') in bans
+    assert ip_address('192.169.10.1') not in bans
+    assert ip_address('2001:db8::1') in bans
+    assert ip_address('2001:db9::1') not in bans
+    assert ip_address('::ffff:c0a8:a01') not in bans
+
+
+async def test_load_ip_bans_config(hass):
+    """Test networks with host bits are loaded and invalid bans skipped."""
+    banned_at = {'banned_at': '2019-01-01T00:00:00'}
+    with patch('homeassistant.components.http.ban.os.path.isfile',
+               return_value=True), \
+            patch('homeassistant.components.http.ban.load_yaml_config_file',
+                  return_value={'200.201.202.203': banned_at,
+                                '10.0.0.1/24': banned_at,
+                                'not_an_ip': banned_at}):
+        ip_bans = await async_load_ip_bans_config(hass, IP_BANS_FILE)
+
+    assert [str(ip_ban.ip_address) for ip_ban in ip_bans] == [
+        '200.201.202.203', '10.0.0.0/24']
+
+
+def test_login_attempts_expire():
+    """Test failed login attempts are bounded and expire."""
+    attempts = LoginAttempts()
+    remote_ip = ip_address('200.201.202.204')
+
+    assert attempts.increment(remote_ip) == 1
+    assert attempts.increment(remote_ip) == 2
+    assert attempts[remote_ip] == 2
+
+    with patch('homeassistant.util.dt.utcnow',
+               return_value=dt_util.utcnow() + LOGIN_ATTEMPTS_EXPIRATION +
+               timedelta(seconds=1)):
+        assert remote_ip not in attempts
+        assert attempts.increment(remote_ip) == 1
+
+    with patch('homeassistant.components.http.ban.MAX_LOGIN_ATTEMPTS_TRACKED',
+               2):
+        attempts.increment(ip_address('100.64.0.1'))
+        attempts.increment(ip_address('100.64.0.2'))
+
+    assert remote_ip not in attempts
+    assert attempts[ip_address('100.64.0.2')] == 1
+
+
 async def test_ban_middleware_not_loaded_by_config(hass):
     """Test accessing to server from banned IP when feature is off."""
     with patch('homeassistant.components.http.setup_bans') as mock_setup:
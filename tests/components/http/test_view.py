@@ -1,6 +1,7 @@
 """Tests for Home Assistant View."""
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
+from aiohttp import ClientError, web
 from aiohttp.web_exceptions import (
     HTTPInternalServerError, HTTPBadRequest, HTTPUnauthorized)
 import pytest
@@ -57,3 +58,73 @@ async def test_handling_service_not_found(mock_request):
             Mock(requires_auth=False),
             mock_coro_func(exception=ServiceNotFound('test', 'test'))
         )(mock_request)
+
+
+async def stream_client(hass, aiohttp_client, produce):
+    """Return a client for a view streaming the produced items."""
+    class StreamView(HomeAssistantView):
+        """View streaming JSON."""
+
+        url = '/stream'
+        name = 'stream'
+        requires_auth = False
+
+        async def get(self, request):
+            """Stream the items."""
+            return await self.json_stream(request, produce, 3)
+
+    app = web.Application()
+    app['hass'] = hass
+    StreamView().register(app, app.router)
+    return await aiohttp_client(app)
+
+
+async def test_json_stream(hass, aiohttp_client):
+    """Test streaming a JSON array with nested generators."""
+    def produce(count):
+        """Produce the items to stream."""
+        for idx in range(count):
+            yield (value for value in range(idx))
+        yield {'done': True}
+
+    client = await stream_client(hass, aiohttp_client, produce)
+
+    with patch('homeassistant.components.http.view.STREAM_CHUNK_SIZE', 2):
+        resp = await client.get('/stream')
+
+    assert resp.status == 200
+    assert resp.content_type == 'application/json'
+    assert await resp.json() == [[], [0], [0, 1], {'done': True}]
+
+
+async def test_json_stream_error_before_first_chunk(hass, aiohttp_client,
+                                                    caplog):
+    """Test an error before anything is streamed returns a 500."""
+    def produce(count):
+        """Fail to produce the items."""
+        raise ValueError('broken')
+
+    client = await stream_client(hass, aiohttp_client, produce)
+    resp = await client.get('/stream')
+
+    assert resp.status == 500
+    assert 'Error streaming JSON for /stream: broken' in caplog.text
+
+
+async def test_json_stream_error_while_streaming(hass, aiohttp_client,
+                                                 caplog):
+    """Test an error after streaming started aborts the connection."""
+    def produce(count):
+        """Fail after producing some items."""
+        yield from range(count)
+        raise ValueError('broken')
+
+    client = await stream_client(hass, aiohttp_client, produce)
+
+    with patch('homeassistant.components.http.view.STREAM_CHUNK_SIZE', 2):
+        resp = await client.get('/stream')
+        assert resp.status == 200
+        with pytest.raises(ClientError):
+            await resp.read()
+
+    assert 'Error streaming JSON for /stream: broken' in caplog.text
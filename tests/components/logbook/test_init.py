@@ -3,6 +3,7 @@
 import logging
 from datetime import (timedelta, datetime)
 import unittest
+from unittest.mock import Mock
 
 import pytest
 import voluptuous as vol
@@ -737,6 +738,62 @@ async def test_logbook_view_period_entity(hass, hass_client):
     assert json[0]['entity_id'] == entity_id_test
 
 
+async def test_logbook_view_filtered_entities(hass, hass_client):
+    """Test the logbook view with excluded entities and lazy events."""
+    await hass.async_add_job(init_recorder_component, hass)
+    await async_setup_component(hass, 'logbook', {
+        logbook.DOMAIN: {
+            'exclude': {
+                'entities': ['switch.excluded'],
+            },
+        },
+    })
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    for entity_id in ('switch.test', 'switch.excluded'):
+        hass.states.async_set(entity_id, STATE_OFF)
+        hass.states.async_set(entity_id, STATE_ON, {
+            'friendly_name': 'Test', 'nested': {'old_state': None}})
+    hass.states.async_set('switch.test', STATE_ON, {'friendly_name': 'Other'})
+    await hass.async_block_till_done()
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    assert hass.data[recorder.DATA_INSTANCE].entity_ids == {
+        'switch.test', 'switch.excluded'}
+
+    client = await hass_client()
+    start = dt_util.utcnow().date()
+    start_date = datetime(start.year, start.month, start.day)
+    response = await client.get(
+        '/api/logbook/{}'.format(start_date.isoformat()))
+    assert response.status == 200
+    json = await response.json()
+    assert len(json) == 1
+    assert json[0]['entity_id'] == 'switch.test'
+    assert json[0]['name'] == 'Test'
+    assert json[0]['message'] == 'turned on'
+
+
+def test_lazy_event_old_state_not_decoded():
+    """Test the old state of a lazy state changed event is not decoded."""
+    now = datetime(2019, 1, 1)
+    row = Mock(
+        event_type=EVENT_STATE_CHANGED, event_data='{"invalid json',
+        time_fired=now, context_id='abcd', context_user_id=None, state_id=1,
+        entity_id='switch.test', state=STATE_ON,
+        attributes='{"friendly_name": "Test"}', last_changed=now,
+        last_updated=now)
+
+    data = logbook.LazyEvent(row).data
+
+    assert data['old_state']
+    assert data['old_state']['entity_id'] == 'switch.test'
+    with pytest.raises(TypeError):
+        data['old_state']['state'] = STATE_OFF
+    assert data['new_state']['state'] == STATE_ON
+    assert data['new_state']['attributes'] == {'friendly_name': 'Test'}
+
+
 async def test_humanify_alexa_event(hass):
     """Test humanifying Alexa event."""
     hass.states.async_set('light.kitchen', 'on', {
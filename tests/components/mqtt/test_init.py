@@ -327,6 +327,22 @@ class TestMQTTCallbacks(unittest.TestCase):
         self.hass.block_till_done()
         assert 1 == len(self.calls)
 
+    def test_unsubscribe_shared_topic(self):
+        """Test unsubscribing keeps other subscriptions on the topic."""
+        unsub = mqtt.subscribe(self.hass, 'test/+', self.record_calls)
+        unsub_other = mqtt.subscribe(self.hass, 'test/+', self.record_calls)
+        mqtt.subscribe(self.hass, 'test/#', self.record_calls)
+
+        unsub()
+        fire_mqtt_message(self.hass, 'test/topic', 'test-payload')
+        self.hass.block_till_done()
+        assert 2 == len(self.calls)
+
+        unsub_other()
+        fire_mqtt_message(self.hass, 'test/topic', 'test-payload')
+        self.hass.block_till_done()
+        assert 3 == len(self.calls)
+
     def test_subscribe_topic_not_match(self):
         """Test if subscribed topic is not a match."""
         mqtt.subscribe(self.hass, 'test-topic', self.record_calls)
@@ -815,3 +831,30 @@ async def test_mqtt_ws_subscription(hass, hass_ws_client):
     })
     response = await client.receive_json()
     assert response['success']
+
+
+async def test_received_messages_handled_in_batch(hass):
+    """Test messages from the paho thread are handled in one batch."""
+    await async_mock_mqtt_client(hass)
+    calls = []
+
+    @callback
+    def record_calls(msg):
+        """Record calls."""
+        calls.append(msg)
+
+    await mqtt.async_subscribe(hass, 'test-topic', record_calls)
+    await mqtt.async_subscribe(hass, 'test-topic', record_calls)
+
+    with mock.patch.object(hass.loop, 'call_soon_threadsafe',
+                           wraps=hass.loop.call_soon_threadsafe) as mock_call:
+        for payload in (b'one', b'two', b'three'):
+            hass.data['mqtt']._mqtt_on_message(
+                None, None, mqtt.Message('test-topic', payload, 0, False))
+        await hass.async_block_till_done()
+
+    assert mock_call.call_count == 1
+    assert [msg.payload for msg in calls] == [
+        'one', 'one', 'two', 'two', 'three', 'three']
+    # Payloads are decoded once for all subscriptions
+    assert calls[0] is calls[1]
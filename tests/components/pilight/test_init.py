@@ -7,12 +7,12 @@ from datetime import timedelta
 
 import pytest
 
-from homeassistant import core as ha
 from homeassistant.setup import setup_component
 from homeassistant.components import pilight
 from homeassistant.util import dt as dt_util
 
-from tests.common import get_test_home_assistant, assert_setup_component
+from tests.common import (
+    get_test_home_assistant, assert_setup_component, fire_time_changed)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -184,15 +184,13 @@ class TestPilight(unittest.TestCase):
             service_data1['protocol'] = [service_data1['protocol']]
             service_data2['protocol'] = [service_data2['protocol']]
 
-            self.hass.bus.fire(ha.EVENT_TIME_CHANGED,
-                               {ha.ATTR_NOW: dt_util.utcnow()})
+            fire_time_changed(self.hass, dt_util.utcnow())
             self.hass.block_till_done()
             error_log_call = mock_pilight_error.call_args_list[-1]
             assert str(service_data1) in str(error_log_call)
 
             new_time = dt_util.utcnow() + timedelta(seconds=5)
-            self.hass.bus.fire(ha.EVENT_TIME_CHANGED,
-                               {ha.ATTR_NOW: new_time})
+            fire_time_changed(self.hass, new_time)
             self.hass.block_till_done()
             error_log_call = mock_pilight_error.call_args_list[-1]
             assert str(service_data2) in str(error_log_call)
@@ -384,7 +382,6 @@ class TestPilightCallrateThrottler(unittest.TestCase):
         for i in range(3):
             exp.append(i)
             shifted_time = now + (timedelta(seconds=delay + 0.1) * i)
-            self.hass.bus.fire(ha.EVENT_TIME_CHANGED,
-                               {ha.ATTR_NOW: shifted_time})
+            fire_time_changed(self.hass, shifted_time)
             self.hass.block_till_done()
             assert runs == exp
@@ -202,3 +202,127 @@ def test_recorder_setup_failure():
         rec.join()
 
     hass.stop()
+
+
+def test_saving_state_batched(hass_recorder):
+    """Test saving states in batches keeps them linked to their events."""
+    hass = hass_recorder({'commit_interval': 1, 'max_batch_size': 3})
+    entity_ids = ['test.one', 'test.two', 'test.three', 'test.four']
+    states = _add_entities(hass, entity_ids)
+    assert sorted(state.entity_id for state in states) == sorted(entity_ids)
+
+    with session_scope(hass=hass) as session:
+        for db_state in session.query(States):
+            db_event = session.query(Events).get(db_state.event_id)
+            assert db_event.event_type == 'state_changed'
+            assert db_state.entity_id in db_event.event_data
+
+    instance = hass.data[DATA_INSTANCE]
+    assert instance.queue_depth == 0
+    assert 1 <= instance.last_commit_size <= 3
+    assert instance.last_commit_duration is not None
+
+
+def test_excluded_events_not_queued(hass_recorder):
+    """Test excluded events are dropped before they reach the queue."""
+    hass = hass_recorder({'exclude': {'domains': 'test',
+                                      'event_types': 'test_event'}})
+    instance = hass.data[DATA_INSTANCE]
+
+    with patch.object(instance, 'queue') as mock_queue:
+        hass.states.set('test.recorder', 'on')
+        hass.bus.fire('test_event')
+        hass.block_till_done()
+        assert mock_queue.put.call_count == 0
+
+        hass.states.set('test2.recorder', 'on')
+        hass.block_till_done()
+        assert mock_queue.put.call_count == 1
+
+    record = mock_queue.put.call_args[0][0]
+    assert record.event.data['entity_id'] == 'test2.recorder'
+    assert record.attributes == '{}'
+
+
+def test_saving_state_not_serializable(hass_recorder):
+    """Test events and states that can not be serialized are skipped."""
+    hass = hass_recorder()
+    hass.states.set('test.recorder', 'on', {'invalid': object()})
+    hass.block_till_done()
+    hass.data[DATA_INSTANCE].block_till_done()
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 0
+        assert session.query(Events).filter_by(
+            event_type='state_changed').count() == 0
+
+
+def test_recorded_entity_ids(hass_recorder):
+    """Test the recorder tracks the entity ids that have states."""
+    hass = hass_recorder({'exclude': {'domains': 'test2'}})
+    instance = hass.data[DATA_INSTANCE]
+    assert instance.entity_ids == frozenset()
+
+    _add_entities(hass, ['test.one', 'test.two', 'test2.excluded'])
+    assert instance.entity_ids == {'test.one', 'test.two'}
+
+    entity_ids = instance.entity_ids
+    hass.states.set('test.one', 'changed')
+    hass.block_till_done()
+    instance.block_till_done()
+    assert instance.entity_ids is entity_ids
+
+
+def test_saving_batch_with_bad_event(hass_recorder):
+    """Test an event that can not be saved does not drop its batch."""
+    from sqlalchemy import exc
+
+    hass = hass_recorder({'commit_interval': 1})
+    from_event = Events.from_event
+
+    def mock_from_event(event, event_data=None):
+        """Fail to save the bad event."""
+        if event.event_type == 'bad_event':
+            raise exc.IntegrityError('INSERT', {}, Exception())
+        return from_event(event, event_data)
+
+    with patch('homeassistant.components.recorder.models.Events.from_event',
+               side_effect=mock_from_event):
+        for event_type in ('good_event', 'bad_event', 'other_event'):
+            hass.bus.fire(event_type)
+        hass.block_till_done()
+        hass.data[DATA_INSTANCE].block_till_done()
+
+    with session_scope(hass=hass) as session:
+        event_types = {
+            event.event_type for event in session.query(Events).filter(
+                Events.event_type.in_(
+                    ['good_event', 'bad_event', 'other_event']))}
+
+    assert event_types == {'good_event', 'other_event'}
+
+
+def test_snapshot_states_tracked_after_commit(hass_recorder):
+    """Test states of a failed batch are not tracked for snapshots."""
+    from sqlalchemy import exc
+
+    hass = hass_recorder({'commit_interval': 1})
+    save_snapshot = Recorder._save_snapshot
+
+    def mock_save_snapshot(self, session, dbstates):
+        """Fail to commit the bad state."""
+        result = save_snapshot(self, session, dbstates)
+        if any(dbstate.entity_id == 'test.bad' for dbstate in dbstates):
+            raise exc.IntegrityError('INSERT', {}, Exception())
+        return result
+
+    with patch.object(Recorder, '_save_snapshot', mock_save_snapshot):
+        for entity_id in ('test.good', 'test.bad', 'test.other'):
+            hass.states.set(entity_id, 'on')
+        hass.block_till_done()
+        hass.data[DATA_INSTANCE].block_till_done()
+
+    snapshot_states = hass.data[DATA_INSTANCE]._snapshot_states
+    assert 'test.good' in snapshot_states
+    assert 'test.other' in snapshot_states
+    assert 'test.bad' not in snapshot_states
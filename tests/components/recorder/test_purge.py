@@ -7,7 +7,8 @@ from unittest.mock import patch
 from homeassistant.components import recorder
 from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.purge import purge_old_data
-from homeassistant.components.recorder.models import States, Events
+from homeassistant.components.recorder.models import (
+    Events, States, StateSnapshots)
 from homeassistant.components.recorder.util import session_scope
 from tests.common import get_test_home_assistant, init_recorder_component
 
@@ -117,6 +118,29 @@ class TestRecorderPurge(unittest.TestCase):
             # we should only have 2 events left
             assert events.count() == 2
 
+    def test_purge_old_snapshots(self):
+        """Test deleting old state snapshots."""
+        now = datetime.now()
+
+        with session_scope(hass=self.hass) as session:
+            for days in (11, 5, 0):
+                timestamp = now - timedelta(days=days)
+                session.add(StateSnapshots(
+                    snapshot_time=timestamp,
+                    entity_id='test.recorder2',
+                    last_updated=timestamp,
+                ))
+
+        with session_scope(hass=self.hass) as session:
+            snapshots = session.query(StateSnapshots)
+            assert snapshots.count() == 3
+
+            # run purge_old_data()
+            purge_old_data(self.hass.data[DATA_INSTANCE], 4, repack=False)
+
+            # we should only have the snapshot of today left
+            assert snapshots.count() == 1
+
     def test_purge_method(self):
         """Test purge method."""
         service_data = {'keep_days': 4}
@@ -170,5 +194,5 @@ class TestRecorderPurge(unittest.TestCase):
                                         service_data=service_data)
                 self.hass.block_till_done()
                 self.hass.data[DATA_INSTANCE].block_till_done()
-                assert mock_logger.debug.mock_calls[3][1][0] == \
+                assert mock_logger.debug.mock_calls[4][1][0] == \
                     "Vacuuming SQLite to free space"
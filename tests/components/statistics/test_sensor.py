@@ -97,6 +97,31 @@ class TestStatisticsSensor(unittest.TestCase):
         assert self.average_change == \
             state.attributes.get('average_change')
 
+    def test_non_finite_values_ignored(self):
+        """Test NaN and infinite readings do not change the statistics."""
+        assert setup_component(self.hass, 'sensor', {
+            'sensor': {
+                'platform': 'statistics',
+                'name': 'test',
+                'entity_id': 'sensor.test_monitored',
+            }
+        })
+
+        self.hass.start()
+        self.hass.block_till_done()
+
+        for value in self.values[:4] + ['nan', 'inf'] + self.values[4:]:
+            self.hass.states.set('sensor.test_monitored', value,
+                                 {ATTR_UNIT_OF_MEASUREMENT: TEMP_CELSIUS})
+            self.hass.block_till_done()
+
+        state = self.hass.states.get('sensor.test_mean')
+
+        assert str(self.mean) == state.state
+        assert self.variance == state.attributes.get('variance')
+        assert self.total == state.attributes.get('total')
+        assert self.count == state.attributes.get('count')
+
     def test_sampling_size(self):
         """Test rotation."""
         assert setup_component(self.hass, 'sensor', {
@@ -0,0 +1,97 @@
+"""The tests for the statistics sample window."""
+import random
+import statistics
+
+import pytest
+
+from homeassistant.components.statistics.window import SampleWindow
+
+
+def test_window_matches_statistics():
+    """Test the running statistics match a recomputation."""
+    rnd = random.Random(42)
+    window = SampleWindow(25)
+    samples = []
+
+    for _ in range(200):
+        value = round(rnd.uniform(-50, 150), 1)
+        window.append(value)
+        samples = (samples + [value])[-25:]
+
+        assert list(window) == samples
+        assert window.first == samples[0]
+        assert window.last == samples[-1]
+        assert window.min == min(samples)
+        assert window.max == max(samples)
+        assert window.median == statistics.median(samples)
+        assert window.mean == pytest.approx(statistics.mean(samples))
+        assert window.total == pytest.approx(sum(samples))
+        if len(samples) > 1:
+            assert window.variance == pytest.approx(
+                statistics.variance(samples))
+
+
+def test_window_popleft():
+    """Test removing samples from the window."""
+    window = SampleWindow(3)
+
+    for value in (1, 2, 3, 4):
+        window.append(value)
+
+    assert window.popleft() == 2
+    assert list(window) == [3, 4]
+    assert window.mean == 3.5
+    assert window.variance == 0.5
+
+    assert window.popleft() == 3
+    assert window.popleft() == 4
+    assert not window
+    assert window.mean == window.total == 0
+
+    with pytest.raises(IndexError):
+        window.popleft()
+
+    window.append(7)
+    assert list(window) == [7]
+    assert window.median == window.min == window.max == 7
+
+
+def test_window_drain_and_refill():
+    """Test refilling the window after it was emptied before it was full."""
+    window = SampleWindow(3)
+    window.append(1)
+    window.append(2)
+    assert window.popleft() == 1
+    assert window.popleft() == 2
+
+    for value in (5, 6, 7, 8):
+        window.append(value)
+
+    assert list(window) == [6, 7, 8]
+    assert window.first == 6
+    assert window.last == 8
+    assert window.mean == 7
+    assert window.median == 7
+    assert window.min == 6
+    assert window.max == 8
+
+    assert window.popleft() == 6
+    assert list(window) == [7, 8]
+    assert window.min == 7
+    assert window.variance == 0.5
+
+
+def test_window_rejects_non_finite():
+    """Test NaN and infinite samples are rejected."""
+    window = SampleWindow(3)
+    window.append(1)
+    window.append(3)
+
+    for value in (float('nan'), float('inf'), float('-inf')):
+        with pytest.raises(ValueError):
+            window.append(value)
+
+    assert list(window) == [1, 3]
+    assert window.mean == 2
+    assert window.total == 4
+    assert window.variance == 2
@@ -5,11 +5,10 @@ from unittest.mock import patch
 from datetime import timedelta, datetime
 
 from homeassistant.setup import setup_component
-import homeassistant.core as ha
 import homeassistant.util.dt as dt_util
 import homeassistant.components.sun as sun
 
-from tests.common import get_test_home_assistant
+from tests.common import fire_time_changed, get_test_home_assistant
 
 
 # pylint: disable=invalid-name
@@ -122,8 +121,7 @@ class TestSun(unittest.TestCase):
         assert sun.STATE_BELOW_HORIZON == \
             self.hass.states.get(sun.ENTITY_ID).state
 
-        self.hass.bus.fire(ha.EVENT_TIME_CHANGED,
-                           {ha.ATTR_NOW: test_time + timedelta(seconds=5)})
+        fire_time_changed(self.hass, test_time + timedelta(seconds=5))
 
         self.hass.block_till_done()
 
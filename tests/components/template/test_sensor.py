@@ -316,7 +316,7 @@ class TestTemplateSensor:
 
 
 async def test_no_template_match_all(hass, caplog):
-    """Test that we do not allow sensors that match on all."""
+    """Test sensors track the states their templates render."""
     hass.states.async_set('sensor.test_sensor', 'startup')
 
     await async_setup_component(hass, 'sensor', {
@@ -346,18 +346,6 @@ async def test_no_template_match_all(hass, caplog):
     })
     await hass.async_block_till_done()
     assert len(hass.states.async_all()) == 5
-    assert ('Template sensor invalid_state has no entity ids '
-            'configured to track nor were we able to extract the entities to '
-            'track from the value template') in caplog.text
-    assert ('Template sensor invalid_icon has no entity ids '
-            'configured to track nor were we able to extract the entities to '
-            'track from the icon template') in caplog.text
-    assert ('Template sensor invalid_entity_picture has no entity ids '
-            'configured to track nor were we able to extract the entities to '
-            'track from the entity_picture template') in caplog.text
-    assert ('Template sensor invalid_friendly_name has no entity ids '
-            'configured to track nor were we able to extract the entities to '
-            'track from the friendly_name template') in caplog.text
 
     assert hass.states.get('sensor.invalid_state').state == 'unknown'
     assert hass.states.get('sensor.invalid_icon').state == 'unknown'
@@ -367,6 +355,11 @@ async def test_no_template_match_all(hass, caplog):
     hass.bus.async_fire(EVENT_HOMEASSISTANT_START)
     await hass.async_block_till_done()
 
+    assert ('Template sensor sensor.invalid_state has no entity ids '
+            'configured to track and its templates do not use the state of '
+            'any entity') in caplog.text
+    assert 'Template sensor sensor.invalid_icon' not in caplog.text
+
     assert hass.states.get('sensor.invalid_state').state == '2'
     assert hass.states.get('sensor.invalid_icon').state == 'startup'
     assert hass.states.get('sensor.invalid_entity_picture').state == 'startup'
@@ -376,20 +369,57 @@ async def test_no_template_match_all(hass, caplog):
     await hass.async_block_till_done()
 
     assert hass.states.get('sensor.invalid_state').state == '2'
-    assert hass.states.get('sensor.invalid_icon').state == 'startup'
-    assert hass.states.get('sensor.invalid_entity_picture').state == 'startup'
-    assert hass.states.get('sensor.invalid_friendly_name').state == 'startup'
+    assert hass.states.get('sensor.invalid_icon').state == 'hello'
+    assert hass.states.get('sensor.invalid_entity_picture').state == 'hello'
+    assert hass.states.get('sensor.invalid_friendly_name').state == 'hello'
 
     await hass.helpers.entity_component.async_update_entity(
         'sensor.invalid_state')
-    await hass.helpers.entity_component.async_update_entity(
-        'sensor.invalid_icon')
-    await hass.helpers.entity_component.async_update_entity(
-        'sensor.invalid_entity_picture')
-    await hass.helpers.entity_component.async_update_entity(
-        'sensor.invalid_friendly_name')
-
     assert hass.states.get('sensor.invalid_state').state == '2'
-    assert hass.states.get('sensor.invalid_icon').state == 'hello'
-    assert hass.states.get('sensor.invalid_entity_picture').state == 'hello'
-    assert hass.states.get('sensor.invalid_friendly_name').state == 'hello'
+
+
+async def test_tracks_rendered_states(hass):
+    """Test sensors follow the states accessed by their last render."""
+    hass.states.async_set('input_boolean.use_a', 'on')
+    hass.states.async_set('sensor.a', 'a1')
+    hass.states.async_set('sensor.b', 'b1')
+
+    await async_setup_component(hass, 'sensor', {
+        'sensor': {
+            'platform': 'template',
+            'sensors': {
+                'picked': {
+                    'value_template':
+                        "{% if is_state('input_boolean.use_a', 'on') %}"
+                        "{{ states('sensor.a') }}{% else %}"
+                        "{{ states('sensor.b') }}{% endif %}",
+                },
+                'lights_on': {
+                    'value_template':
+                        "{{ states.light | selectattr('state', 'eq', 'on')"
+                        " | list | count }}",
+                },
+            }
+        }
+    })
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_START)
+    await hass.async_block_till_done()
+
+    assert hass.states.get('sensor.picked').state == 'a1'
+    assert hass.states.get('sensor.lights_on').state == '0'
+
+    hass.states.async_set('sensor.b', 'b2')
+    await hass.async_block_till_done()
+    assert hass.states.get('sensor.picked').state == 'a1'
+
+    hass.states.async_set('input_boolean.use_a', 'off')
+    await hass.async_block_till_done()
+    assert hass.states.get('sensor.picked').state == 'b2'
+
+    hass.states.async_set('sensor.b', 'b3')
+    await hass.async_block_till_done()
+    assert hass.states.get('sensor.picked').state == 'b3'
+
+    hass.states.async_set('light.kitchen', 'on')
+    await hass.async_block_till_done()
+    assert hass.states.get('sensor.lights_on').state == '1'
@@ -5,12 +5,11 @@ from datetime import timedelta, datetime
 import pytz
 
 from homeassistant import setup
-import homeassistant.core as ha
 from homeassistant.const import STATE_OFF, STATE_ON
 import homeassistant.util.dt as dt_util
 from homeassistant.setup import setup_component
 from tests.common import (
-    get_test_home_assistant, assert_setup_component)
+    get_test_home_assistant, assert_setup_component, fire_time_changed)
 from homeassistant.helpers.sun import (
     get_astral_event_date, get_astral_event_next)
 
@@ -134,8 +133,7 @@ class TestBinarySensorTod(unittest.TestCase):
         with patch('homeassistant.components.tod.binary_sensor.dt_util.utcnow',
                    return_value=test_time + timedelta(hours=1)):
 
-            self.hass.bus.fire(ha.EVENT_TIME_CHANGED, {
-                ha.ATTR_NOW: test_time + timedelta(hours=1)})
+            fire_time_changed(self.hass, test_time + timedelta(hours=1))
 
             self.hass.block_till_done()
             state = self.hass.states.get('binary_sensor.night')
@@ -191,8 +189,7 @@ class TestBinarySensorTod(unittest.TestCase):
         with patch('homeassistant.components.tod.binary_sensor.dt_util.utcnow',
                    return_value=switchover_time):
 
-            self.hass.bus.fire(ha.EVENT_TIME_CHANGED, {
-                ha.ATTR_NOW: switchover_time})
+            fire_time_changed(self.hass, switchover_time)
             self.hass.block_till_done()
             state = self.hass.states.get('binary_sensor.night')
             assert state.state == STATE_ON
@@ -201,9 +198,8 @@ class TestBinarySensorTod(unittest.TestCase):
                    return_value=switchover_time + timedelta(
                        minutes=1, seconds=1)):
 
-            self.hass.bus.fire(ha.EVENT_TIME_CHANGED, {
-                ha.ATTR_NOW: switchover_time + timedelta(
-                    minutes=1, seconds=1)})
+            fire_time_changed(self.hass, switchover_time + timedelta(
+                    minutes=1, seconds=1))
 
             self.hass.block_till_done()
             state = self.hass.states.get('binary_sensor.night')
@@ -241,8 +237,7 @@ class TestBinarySensorTod(unittest.TestCase):
         with patch('homeassistant.components.tod.binary_sensor.dt_util.utcnow',
                    return_value=testtime):
 
-            self.hass.bus.fire(ha.EVENT_TIME_CHANGED, {
-                ha.ATTR_NOW: testtime})
+            fire_time_changed(self.hass, testtime)
             self.hass.block_till_done()
 
             state = self.hass.states.get(entity_id)
@@ -252,8 +247,7 @@ class TestBinarySensorTod(unittest.TestCase):
         with patch('homeassistant.components.tod.binary_sensor.dt_util.utcnow',
                    return_value=testtime):
 
-            self.hass.bus.fire(ha.EVENT_TIME_CHANGED, {
-                ha.ATTR_NOW: testtime})
+            fire_time_changed(self.hass, testtime)
             self.hass.block_till_done()
 
             state = self.hass.states.get(entity_id)
@@ -265,8 +259,7 @@ class TestBinarySensorTod(unittest.TestCase):
         with patch('homeassistant.components.tod.binary_sensor.dt_util.utcnow',
                    return_value=testtime):
 
-            self.hass.bus.fire(ha.EVENT_TIME_CHANGED, {
-                ha.ATTR_NOW: testtime})
+            fire_time_changed(self.hass, testtime)
             self.hass.block_till_done()
 
             state = self.hass.states.get(entity_id)
@@ -278,8 +271,7 @@ class TestBinarySensorTod(unittest.TestCase):
         with patch('homeassistant.components.tod.binary_sensor.dt_util.utcnow',
                    return_value=testtime):
 
-            self.hass.bus.fire(ha.EVENT_TIME_CHANGED, {
-                ha.ATTR_NOW: testtime})
+            fire_time_changed(self.hass, testtime)
             self.hass.block_till_done()
 
             state = self.hass.states.get(entity_id)
@@ -291,8 +283,7 @@ class TestBinarySensorTod(unittest.TestCase):
         with patch('homeassistant.components.tod.binary_sensor.dt_util.utcnow',
                    return_value=testtime):
 
-            self.hass.bus.fire(ha.EVENT_TIME_CHANGED, {
-                ha.ATTR_NOW: testtime})
+            fire_time_changed(self.hass, testtime)
             self.hass.block_till_done()
 
             state = self.hass.states.get(entity_id)
@@ -331,8 +322,7 @@ class TestBinarySensorTod(unittest.TestCase):
         with patch('homeassistant.components.tod.binary_sensor.dt_util.utcnow',
                    return_value=testtime):
 
-            self.hass.bus.fire(ha.EVENT_TIME_CHANGED, {
-                ha.ATTR_NOW: testtime})
+            fire_time_changed(self.hass, testtime)
             self.hass.block_till_done()
 
             state = self.hass.states.get(entity_id)
@@ -342,8 +332,7 @@ class TestBinarySensorTod(unittest.TestCase):
         with patch('homeassistant.components.tod.binary_sensor.dt_util.utcnow',
                    return_value=testtime):
 
-            self.hass.bus.fire(ha.EVENT_TIME_CHANGED, {
-                ha.ATTR_NOW: testtime})
+            fire_time_changed(self.hass, testtime)
             self.hass.block_till_done()
 
             state = self.hass.states.get(entity_id)
@@ -353,8 +342,7 @@ class TestBinarySensorTod(unittest.TestCase):
         with patch('homeassistant.components.tod.binary_sensor.dt_util.utcnow',
                    return_value=testtime):
 
-            self.hass.bus.fire(ha.EVENT_TIME_CHANGED, {
-                ha.ATTR_NOW: testtime})
+            fire_time_changed(self.hass, testtime)
             self.hass.block_till_done()
 
             state = self.hass.states.get(entity_id)
@@ -364,8 +352,7 @@ class TestBinarySensorTod(unittest.TestCase):
         with patch('homeassistant.components.tod.binary_sensor.dt_util.utcnow',
                    return_value=testtime):
 
-            self.hass.bus.fire(ha.EVENT_TIME_CHANGED, {
-                ha.ATTR_NOW: testtime})
+            fire_time_changed(self.hass, testtime)
             self.hass.block_till_done()
 
             state = self.hass.states.get(entity_id)
@@ -377,8 +364,7 @@ class TestBinarySensorTod(unittest.TestCase):
         with patch('homeassistant.components.tod.binary_sensor.dt_util.utcnow',
                    return_value=testtime):
 
-            self.hass.bus.fire(ha.EVENT_TIME_CHANGED, {
-                ha.ATTR_NOW: testtime})
+            fire_time_changed(self.hass, testtime)
             self.hass.block_till_done()
 
             state = self.hass.states.get(entity_id)
@@ -419,8 +405,7 @@ class TestBinarySensorTod(unittest.TestCase):
         testtime = after
         with patch('homeassistant.components.tod.binary_sensor.dt_util.utcnow',
                    return_value=testtime):
-            self.hass.bus.fire(ha.EVENT_TIME_CHANGED, {
-                ha.ATTR_NOW: testtime})
+            fire_time_changed(self.hass, testtime)
             self.hass.block_till_done()
 
             state = self.hass.states.get(entity_id)
@@ -429,8 +414,7 @@ class TestBinarySensorTod(unittest.TestCase):
         testtime = before + timedelta(seconds=-1)
         with patch('homeassistant.components.tod.binary_sensor.dt_util.utcnow',
                    return_value=testtime):
-            self.hass.bus.fire(ha.EVENT_TIME_CHANGED, {
-                ha.ATTR_NOW: testtime})
+            fire_time_changed(self.hass, testtime)
             self.hass.block_till_done()
 
             state = self.hass.states.get(entity_id)
@@ -439,8 +423,7 @@ class TestBinarySensorTod(unittest.TestCase):
         testtime = before
         with patch('homeassistant.components.tod.binary_sensor.dt_util.utcnow',
                    return_value=testtime):
-            self.hass.bus.fire(ha.EVENT_TIME_CHANGED, {
-                ha.ATTR_NOW: testtime})
+            fire_time_changed(self.hass, testtime)
             self.hass.block_till_done()
 
             state = self.hass.states.get(entity_id)
@@ -449,8 +432,7 @@ class TestBinarySensorTod(unittest.TestCase):
         testtime = before + timedelta(seconds=1)
         with patch('homeassistant.components.tod.binary_sensor.dt_util.utcnow',
                    return_value=testtime):
-            self.hass.bus.fire(ha.EVENT_TIME_CHANGED, {
-                ha.ATTR_NOW: testtime})
+            fire_time_changed(self.hass, testtime)
             self.hass.block_till_done()
 
             state = self.hass.states.get(entity_id)
@@ -486,8 +468,7 @@ class TestBinarySensorTod(unittest.TestCase):
         testtime = after
         with patch('homeassistant.components.tod.binary_sensor.dt_util.utcnow',
                    return_value=testtime):
-            self.hass.bus.fire(ha.EVENT_TIME_CHANGED, {
-                ha.ATTR_NOW: testtime})
+            fire_time_changed(self.hass, testtime)
             self.hass.block_till_done()
 
             state = self.hass.states.get(entity_id)
@@ -528,8 +509,7 @@ class TestBinarySensorTod(unittest.TestCase):
         with patch('homeassistant.components.tod.binary_sensor.dt_util.utcnow',
                    return_value=testtime):
 
-            self.hass.bus.fire(ha.EVENT_TIME_CHANGED, {
-                ha.ATTR_NOW: testtime})
+            fire_time_changed(self.hass, testtime)
             self.hass.block_till_done()
 
             state = self.hass.states.get(entity_id)
@@ -539,8 +519,7 @@ class TestBinarySensorTod(unittest.TestCase):
         with patch('homeassistant.components.tod.binary_sensor.dt_util.utcnow',
                    return_value=testtime):
 
-            self.hass.bus.fire(ha.EVENT_TIME_CHANGED, {
-                ha.ATTR_NOW: testtime})
+            fire_time_changed(self.hass, testtime)
             self.hass.block_till_done()
 
             state = self.hass.states.get(entity_id)
@@ -550,8 +529,7 @@ class TestBinarySensorTod(unittest.TestCase):
         with patch('homeassistant.components.tod.binary_sensor.dt_util.utcnow',
                    return_value=testtime):
 
-            self.hass.bus.fire(ha.EVENT_TIME_CHANGED, {
-                ha.ATTR_NOW: testtime})
+            fire_time_changed(self.hass, testtime)
             self.hass.block_till_done()
 
             state = self.hass.states.get(entity_id)
@@ -563,8 +541,7 @@ class TestBinarySensorTod(unittest.TestCase):
         with patch('homeassistant.components.tod.binary_sensor.dt_util.utcnow',
                    return_value=testtime):
 
-            self.hass.bus.fire(ha.EVENT_TIME_CHANGED, {
-                ha.ATTR_NOW: testtime})
+            fire_time_changed(self.hass, testtime)
             self.hass.block_till_done()
 
             state = self.hass.states.get(entity_id)
@@ -576,8 +553,7 @@ class TestBinarySensorTod(unittest.TestCase):
         with patch('homeassistant.components.tod.binary_sensor.dt_util.utcnow',
                    return_value=testtime):
 
-            self.hass.bus.fire(ha.EVENT_TIME_CHANGED, {
-                ha.ATTR_NOW: testtime})
+            fire_time_changed(self.hass, testtime)
             self.hass.block_till_done()
 
             state = self.hass.states.get(entity_id)
@@ -589,8 +565,7 @@ class TestBinarySensorTod(unittest.TestCase):
         with patch('homeassistant.components.tod.binary_sensor.dt_util.utcnow',
                    return_value=testtime):
 
-            self.hass.bus.fire(ha.EVENT_TIME_CHANGED, {
-                ha.ATTR_NOW: testtime})
+            fire_time_changed(self.hass, testtime)
             self.hass.block_till_done()
 
             state = self.hass.states.get(entity_id)
@@ -632,8 +607,7 @@ class TestBinarySensorTod(unittest.TestCase):
         with patch('homeassistant.components.tod.binary_sensor.dt_util.utcnow',
                    return_value=testtime):
 
-            self.hass.bus.fire(ha.EVENT_TIME_CHANGED, {
-                ha.ATTR_NOW: testtime})
+            fire_time_changed(self.hass, testtime)
             self.hass.block_till_done()
 
             state = self.hass.states.get(entity_id)
@@ -643,8 +617,7 @@ class TestBinarySensorTod(unittest.TestCase):
         with patch('homeassistant.components.tod.binary_sensor.dt_util.utcnow',
                    return_value=testtime):
 
-            self.hass.bus.fire(ha.EVENT_TIME_CHANGED, {
-                ha.ATTR_NOW: testtime})
+            fire_time_changed(self.hass, testtime)
             self.hass.block_till_done()
 
             state = self.hass.states.get(entity_id)
@@ -654,8 +627,7 @@ class TestBinarySensorTod(unittest.TestCase):
         with patch('homeassistant.components.tod.binary_sensor.dt_util.utcnow',
                    return_value=testtime):
 
-            self.hass.bus.fire(ha.EVENT_TIME_CHANGED, {
-                ha.ATTR_NOW: testtime})
+            fire_time_changed(self.hass, testtime)
             self.hass.block_till_done()
 
             state = self.hass.states.get(entity_id)
@@ -667,8 +639,7 @@ class TestBinarySensorTod(unittest.TestCase):
         with patch('homeassistant.components.tod.binary_sensor.dt_util.utcnow',
                    return_value=testtime):
 
-            self.hass.bus.fire(ha.EVENT_TIME_CHANGED, {
-                ha.ATTR_NOW: testtime})
+            fire_time_changed(self.hass, testtime)
             self.hass.block_till_done()
 
             state = self.hass.states.get(entity_id)
@@ -680,8 +651,7 @@ class TestBinarySensorTod(unittest.TestCase):
         with patch('homeassistant.components.tod.binary_sensor.dt_util.utcnow',
                    return_value=testtime):
 
-            self.hass.bus.fire(ha.EVENT_TIME_CHANGED, {
-                ha.ATTR_NOW: testtime})
+            fire_time_changed(self.hass, testtime)
             self.hass.block_till_done()
 
             state = self.hass.states.get(entity_id)
@@ -693,8 +663,7 @@ class TestBinarySensorTod(unittest.TestCase):
         with patch('homeassistant.components.tod.binary_sensor.dt_util.utcnow',
                    return_value=testtime):
 
-            self.hass.bus.fire(ha.EVENT_TIME_CHANGED, {
-                ha.ATTR_NOW: testtime})
+            fire_time_changed(self.hass, testtime)
             self.hass.block_till_done()
 
             state = self.hass.states.get(entity_id)
@@ -736,8 +705,7 @@ class TestBinarySensorTod(unittest.TestCase):
         with patch('homeassistant.components.tod.binary_sensor.dt_util.utcnow',
                    return_value=testtime):
 
-            self.hass.bus.fire(ha.EVENT_TIME_CHANGED, {
-                ha.ATTR_NOW: testtime})
+            fire_time_changed(self.hass, testtime)
             self.hass.block_till_done()
 
             state = self.hass.states.get(entity_id)
@@ -747,8 +715,7 @@ class TestBinarySensorTod(unittest.TestCase):
         with patch('homeassistant.components.tod.binary_sensor.dt_util.utcnow',
                    return_value=testtime):
 
-            self.hass.bus.fire(ha.EVENT_TIME_CHANGED, {
-                ha.ATTR_NOW: testtime})
+            fire_time_changed(self.hass, testtime)
             self.hass.block_till_done()
 
             state = self.hass.states.get(entity_id)
@@ -760,8 +727,7 @@ class TestBinarySensorTod(unittest.TestCase):
         with patch('homeassistant.components.tod.binary_sensor.dt_util.utcnow',
                    return_value=testtime):
 
-            self.hass.bus.fire(ha.EVENT_TIME_CHANGED, {
-                ha.ATTR_NOW: testtime})
+            fire_time_changed(self.hass, testtime)
             self.hass.block_till_done()
 
             state = self.hass.states.get(entity_id)
@@ -773,8 +739,7 @@ class TestBinarySensorTod(unittest.TestCase):
         with patch('homeassistant.components.tod.binary_sensor.dt_util.utcnow',
                    return_value=testtime):
 
-            self.hass.bus.fire(ha.EVENT_TIME_CHANGED, {
-                ha.ATTR_NOW: testtime})
+            fire_time_changed(self.hass, testtime)
             self.hass.block_till_done()
 
             state = self.hass.states.get(entity_id)
@@ -786,8 +751,7 @@ class TestBinarySensorTod(unittest.TestCase):
         with patch('homeassistant.components.tod.binary_sensor.dt_util.utcnow',
                    return_value=testtime):
 
-            self.hass.bus.fire(ha.EVENT_TIME_CHANGED, {
-                ha.ATTR_NOW: testtime})
+            fire_time_changed(self.hass, testtime)
             self.hass.block_till_done()
 
             state = self.hass.states.get(entity_id)
@@ -801,8 +765,7 @@ class TestBinarySensorTod(unittest.TestCase):
         with patch('homeassistant.components.tod.binary_sensor.dt_util.utcnow',
                    return_value=testtime):
 
-            self.hass.bus.fire(ha.EVENT_TIME_CHANGED, {
-                ha.ATTR_NOW: testtime})
+            fire_time_changed(self.hass, testtime)
             self.hass.block_till_done()
 
             state = self.hass.states.get(entity_id)
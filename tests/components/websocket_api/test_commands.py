@@ -1,4 +1,6 @@
 """Tests for WebSocket API commands."""
+from unittest.mock import patch
+
 from async_timeout import timeout
 
 from homeassistant.core import callback
@@ -8,6 +10,7 @@ from homeassistant.components.websocket_api.auth import (
 )
 from homeassistant.components.websocket_api import const
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.json import dumps_event
 from homeassistant.setup import async_setup_component
 
 from tests.common import async_mock_service
@@ -160,6 +163,114 @@ async def test_subscribe_unsubscribe_events(hass, websocket_client):
     assert sum(hass.bus.async_listeners().values()) == init_count
 
 
+async def test_subscribe_events_serialized_once(hass, websocket_client):
+    """Test an event is serialized once for all subscriptions."""
+    for iden in (5, 6):
+        await websocket_client.send_json({
+            'id': iden,
+            'type': 'subscribe_events',
+            'event_type': 'test_event'
+        })
+        msg = await websocket_client.receive_json()
+        assert msg['success']
+
+    with patch('homeassistant.components.websocket_api.messages.dumps_event',
+               side_effect=dumps_event) as mock_dump:
+        hass.bus.async_fire('test_event', {'hello': 'world'})
+
+        with timeout(3, loop=hass.loop):
+            msgs = [await websocket_client.receive_json() for _ in range(2)]
+
+    assert mock_dump.call_count == 1
+    assert sorted(msg['id'] for msg in msgs) == [5, 6]
+    for msg in msgs:
+        assert msg['type'] == 'event'
+        assert msg['event']['event_type'] == 'test_event'
+        assert msg['event']['data'] == {'hello': 'world'}
+
+
+async def test_subscribe_entities(hass, websocket_client, hass_admin_user):
+    """Test subscribe entities command."""
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy({
+        'entities': {
+            'entity_ids': {
+                'light.kitchen': True,
+                'sensor.temperature': True,
+            }
+        }
+    })
+
+    await websocket_client.send_json({
+        'id': 5,
+        'type': 'subscribe_entities',
+        'entity_ids': ['light.kitchen', 'light.bed'],
+        'domains': ['sensor'],
+    })
+    msg = await websocket_client.receive_json()
+    assert msg['id'] == 5
+    assert msg['success']
+
+    hass.states.async_set('light.bed', 'on')
+    hass.states.async_set('light.hallway', 'on')
+    hass.states.async_set('switch.fan', 'on')
+    hass.states.async_set('light.kitchen', 'on', {'brightness': 100})
+    hass.states.async_set('sensor.temperature', '21')
+
+    with timeout(3, loop=hass.loop):
+        msgs = [await websocket_client.receive_json() for _ in range(2)]
+
+    assert [msg['event']['data']['entity_id'] for msg in msgs] == [
+        'light.kitchen', 'sensor.temperature']
+    assert msgs[0]['id'] == 5
+    assert msgs[0]['event']['event_type'] == 'state_changed'
+    assert msgs[0]['event']['data']['new_state']['attributes'] == {
+        'brightness': 100}
+
+
+async def test_subscribe_entities_attributes(hass, websocket_client):
+    """Test subscribe entities command with pruned attributes."""
+    hass.states.async_set('light.kitchen', 'off', {
+        'brightness': 0, 'friendly_name': 'Kitchen'})
+
+    await websocket_client.send_json({
+        'id': 5,
+        'type': 'subscribe_entities',
+        'entity_ids': ['light.kitchen'],
+        'attributes': ['brightness'],
+    })
+    msg = await websocket_client.receive_json()
+    assert msg['success']
+
+    hass.states.async_set('light.kitchen', 'on', {
+        'brightness': 100, 'friendly_name': 'Kitchen'})
+
+    with timeout(3, loop=hass.loop):
+        msg = await websocket_client.receive_json()
+
+    assert msg['id'] == 5
+    data = msg['event']['data']
+    assert data['entity_id'] == 'light.kitchen'
+    assert data['old_state']['state'] == 'off'
+    assert data['old_state']['attributes'] == {'brightness': 0}
+    assert data['new_state']['state'] == 'on'
+    assert data['new_state']['attributes'] == {'brightness': 100}
+    assert hass.states.get('light.kitchen').attributes['friendly_name'] == \
+        'Kitchen'
+
+
+async def test_subscribe_entities_requires_filter(hass, websocket_client):
+    """Test subscribe entities command without entities or domains."""
+    await websocket_client.send_json({
+        'id': 5,
+        'type': 'subscribe_entities',
+    })
+    msg = await websocket_client.receive_json()
+    assert msg['id'] == 5
+    assert not msg['success']
+    assert msg['error']['code'] == const.ERR_INVALID_FORMAT
+
+
 async def test_get_states(hass, websocket_client):
     """Test get_states command."""
     hass.states.async_set('greeting.hello', 'world')
@@ -177,7 +288,7 @@ async def test_get_states(hass, websocket_client):
 
     states = []
     for state in hass.states.async_all():
-        state = state.as_dict()
+        state = dict(state.as_dict())
         state['last_changed'] = state['last_changed'].isoformat()
         state['last_updated'] = state['last_updated'].isoformat()
         states.append(state)
@@ -1,7 +1,7 @@
 """Test zone component."""
 
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from homeassistant import setup
 from homeassistant.components import zone
@@ -38,6 +38,55 @@ async def test_unload_entry_successful(hass):
     assert not hass.data[zone.DOMAIN]
 
 
+async def test_active_zone_prunes_distant_zones(hass):
+    """Test only zones near the location get their distance calculated."""
+    for idx in range(1, 21):
+        hass.states.async_set('zone.zone_{}'.format(idx), 'zoning', {
+            'latitude': 32.88 + idx,
+            'longitude': -117.23,
+            'radius': 250,
+        })
+    hass.states.async_set('zone.near', 'zoning', {
+        'latitude': 32.8801,
+        'longitude': -117.2301,
+        'radius': 250,
+    })
+
+    with patch('homeassistant.components.zone.zone.distance',
+               wraps=zone.zone.distance) as mock_distance:
+        active = zone.zone.async_active_zone(hass, 32.88, -117.23)
+
+    assert active.entity_id == 'zone.near'
+    assert len(mock_distance.mock_calls) == 1
+
+    assert zone.zone.async_active_zone(hass, 62.88, -117.23) is None
+
+
+async def test_active_zone_index_rebuilt_on_change(hass):
+    """Test the zone index follows changes of the zone states."""
+    hass.states.async_set('zone.moving', 'zoning', {
+        'latitude': 32.88,
+        'longitude': -117.23,
+        'radius': 250,
+    })
+    assert zone.zone.async_active_zone(
+        hass, 32.88, -117.23).entity_id == 'zone.moving'
+
+    hass.states.async_set('zone.moving', 'zoning', {
+        'latitude': 42.88,
+        'longitude': -117.23,
+        'radius': 250,
+    })
+    await hass.async_block_till_done()
+    assert zone.zone.async_active_zone(hass, 32.88, -117.23) is None
+    assert zone.zone.async_active_zone(
+        hass, 42.88, -117.23).entity_id == 'zone.moving'
+
+    hass.states.async_remove('zone.moving')
+    await hass.async_block_till_done()
+    assert zone.zone.async_active_zone(hass, 42.88, -117.23) is None
+
+
 class TestComponentZone(unittest.TestCase):
     """Test the zone component."""
 
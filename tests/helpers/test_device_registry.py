@@ -374,6 +374,52 @@ async def test_update(registry):
     assert updated_entry.name_by_user == 'Test Friendly Name'
 
 
+async def test_get_device_by_merged_identifiers(registry):
+    """Test devices are found by identifiers and connections merged later."""
+    entry = registry.async_get_or_create(
+        config_entry_id='1234',
+        identifiers={('bridgeid', '0123')})
+    registry.async_get_or_create(
+        config_entry_id='1234',
+        identifiers={('bridgeid', '0123'), ('serial', 'abc')},
+        connections={
+            (device_registry.CONNECTION_NETWORK_MAC, '12:34:56:AB:CD:EF')
+        })
+
+    assert registry.async_get_device({('serial', 'abc')}, set()).id == \
+        entry.id
+    assert registry.async_get_device(set(), {
+        (device_registry.CONNECTION_NETWORK_MAC, '12:34:56:ab:cd:ef')
+    }).id == entry.id
+    assert registry.async_get_device({('serial', 'other')}, set()) is None
+
+    del registry.devices[entry.id]
+    assert registry.async_get_device({('bridgeid', '0123')}, set()) is None
+
+
+def test_get_device_id_prefers_first_added():
+    """Test the device added first wins when several devices match."""
+    mac = (device_registry.CONNECTION_NETWORK_MAC, '12:34:56:ab:cd:ef')
+    first = device_registry.DeviceEntry(connections={mac})
+    second = device_registry.DeviceEntry(
+        identifiers={('serial', 'abc')}, connections={mac})
+    devices = device_registry.DeviceRegistryItems()
+    devices[first.id] = first
+    devices[second.id] = second
+
+    # The identifier matches the second device, the connection the first
+    assert devices.get_device_id({('serial', 'abc')}, {mac}) == first.id
+    assert devices.get_device_id({('serial', 'abc')}, set()) == second.id
+
+    # Updating a device keeps its position
+    devices[first.id] = first
+    assert devices.get_device_id({('serial', 'abc')}, {mac}) == first.id
+
+    # Other devices keep a key when the first device with it is removed
+    del devices[first.id]
+    assert devices.get_device_id(set(), {mac}) == second.id
+
+
 async def test_loading_race_condition(hass):
     """Test only one storage load called when concurrent loading occurred ."""
     with asynctest.patch(
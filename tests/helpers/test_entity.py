@@ -497,3 +497,87 @@ async def test_set_context_expired(hass):
     assert hass.states.get('hello.world').context != context
     assert ent._context is None
     assert ent._context_set is None
+
+
+async def test_async_schedule_update_ha_state_coalesced(hass):
+    """Test updates scheduled in the same iteration are written once."""
+    updates = []
+
+    async def async_update():
+        """Mock async update."""
+        updates.append(1)
+
+    ent = entity.Entity()
+    ent.hass = hass
+    ent.entity_id = 'hello.world'
+    ent.async_update = async_update
+
+    with patch.object(hass.states, 'async_set') as mock_set:
+        ent.async_schedule_update_ha_state()
+        ent.async_schedule_update_ha_state(True)
+        ent.async_schedule_update_ha_state()
+        await hass.async_block_till_done()
+
+        assert len(updates) == 1
+        assert len(mock_set.mock_calls) == 1
+
+        ent.async_schedule_update_ha_state()
+        await hass.async_block_till_done()
+
+        assert len(updates) == 1
+        assert len(mock_set.mock_calls) == 2
+
+
+async def test_write_skipped_without_state_change(hass):
+    """Test entities marking state changes are only written on change."""
+    ent = entity.Entity()
+    ent.hass = hass
+    ent.entity_id = 'hello.world'
+    ent.mark_state_changed()
+
+    with patch.object(entity.Entity, 'state',
+                      new_callable=PropertyMock) as mock_state:
+        mock_state.return_value = 'on'
+        await ent.async_update_ha_state()
+        await ent.async_update_ha_state()
+        assert len(mock_state.mock_calls) == 1
+        assert hass.states.get('hello.world').state == 'on'
+
+        mock_state.return_value = 'off'
+        ent.mark_state_changed()
+        await ent.async_update_ha_state()
+        await ent.async_update_ha_state()
+        assert len(mock_state.mock_calls) == 2
+        assert hass.states.get('hello.world').state == 'off'
+
+        # Registry updates are written
+        ent.registry_name = 'Registry name'
+        await ent.async_update_ha_state()
+        assert len(mock_state.mock_calls) == 3
+        assert hass.states.get('hello.world').name == 'Registry name'
+
+        # Written again after being removed
+        await ent.async_remove()
+        await ent.async_update_ha_state()
+        assert len(mock_state.mock_calls) == 4
+        assert hass.states.get('hello.world').state == 'off'
+
+
+def test_mark_state_changed_from_threads():
+    """Test marking state changes from threads never reuses a version."""
+    versions = []
+
+    def mark():
+        """Mark state changes and collect the versions."""
+        ent = entity.Entity()
+        for _ in range(1000):
+            ent.mark_state_changed()
+            versions.append(ent._state_version)
+
+    threads = [threading.Thread(target=mark) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(set(versions)) == len(versions)
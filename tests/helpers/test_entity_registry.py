@@ -189,6 +189,32 @@ def test_removing_config_entry_id(registry):
     assert entry.config_entry_id is None
 
 
+def test_indexes_follow_updates(registry):
+    """Test lookups by unique id and device follow updates and removals."""
+    registry.async_get_or_create('light', 'hue', '1234', device_id='dev_1')
+    registry.async_get_or_create('light', 'hue', '5678', device_id='dev_1')
+
+    assert [entry.entity_id for entry in entity_registry
+            .async_entries_for_device(registry, 'dev_1')] == \
+        ['light.hue_1234', 'light.hue_5678']
+
+    registry.async_update_entity('light.hue_1234',
+                                 new_entity_id='light.kitchen')
+    assert registry.async_get_entity_id('light', 'hue', '1234') == \
+        'light.kitchen'
+
+    registry.async_get_or_create('light', 'hue', '1234', device_id='dev_2')
+    assert [entry.entity_id for entry in entity_registry
+            .async_entries_for_device(registry, 'dev_1')] == \
+        ['light.hue_5678']
+    assert entity_registry.async_entries_for_device(
+        registry, 'dev_2') == [registry.async_get('light.kitchen')]
+
+    registry.async_remove('light.kitchen')
+    assert registry.async_get_entity_id('light', 'hue', '1234') is None
+    assert entity_registry.async_entries_for_device(registry, 'dev_2') == []
+
+
 async def test_migration(hass):
     """Test migration from old data to new."""
     old_conf = {
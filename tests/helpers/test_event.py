@@ -10,9 +10,15 @@ import pytest
 from homeassistant.core import callback
 from homeassistant.setup import setup_component
 import homeassistant.core as ha
-from homeassistant.const import MATCH_ALL
+from homeassistant.const import EVENT_STATE_CHANGED, MATCH_ALL
 from homeassistant.helpers.event import (
+    SCHEDULER_COMPACT_THRESHOLD,
     async_call_later,
+    async_get_point_in_time_scheduler,
+    async_track_point_in_utc_time,
+    async_track_render_info,
+    async_track_state_change,
+    async_track_template,
     call_later,
     track_point_in_utc_time,
     track_point_in_time,
@@ -25,7 +31,8 @@ from homeassistant.helpers.event import (
     track_sunrise,
     track_sunset,
 )
-from homeassistant.helpers.template import Template
+from homeassistant.helpers.template import (
+    RenderInfo, Template, async_collect_render_info)
 from homeassistant.components import sun
 import homeassistant.util.dt as dt_util
 
@@ -492,7 +499,7 @@ class TestEventHelpers(unittest.TestCase):
 
     def _send_time_changed(self, now):
         """Send a time changed event."""
-        self.hass.bus.fire(ha.EVENT_TIME_CHANGED, {ha.ATTR_NOW: now})
+        fire_time_changed(self.hass, now)
 
 
 class TestTrackTimeChange(unittest.TestCase):
@@ -510,7 +517,7 @@ class TestTrackTimeChange(unittest.TestCase):
 
     def _send_time_changed(self, now):
         """Send a time changed event."""
-        self.hass.bus.fire(ha.EVENT_TIME_CHANGED, {ha.ATTR_NOW: now})
+        fire_time_changed(self.hass, now)
 
     def test_track_time_change(self):
         """Test tracking time change."""
@@ -771,3 +778,204 @@ def test_async_call_later(hass):
     assert p_action is action
     assert p_point == now + timedelta(seconds=3)
     assert remove is mock()
+
+
+async def test_async_track_state_change_entity_index(hass):
+    """Test state change trackers share one listener indexed by entity."""
+    light_calls = []
+    switch_calls = []
+    init_count = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+
+    @callback
+    def light_listener(entity_id, old_state, new_state):
+        """Record light changes."""
+        light_calls.append(entity_id)
+
+    @callback
+    def switch_listener(entity_id, old_state, new_state):
+        """Record switch changes."""
+        switch_calls.append(entity_id)
+
+    unsub_light = async_track_state_change(
+        hass, ['Light.Kitchen', 'light.bed'], light_listener)
+    unsub_switch = async_track_state_change(
+        hass, 'switch.tv', switch_listener)
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == init_count + 1
+
+    hass.states.async_set('light.kitchen', 'on')
+    hass.states.async_set('switch.tv', 'on')
+    hass.states.async_set('light.other', 'on')
+    await hass.async_block_till_done()
+    assert light_calls == ['light.kitchen']
+    assert switch_calls == ['switch.tv']
+
+    unsub_light()
+    unsub_light()
+    hass.states.async_set('light.kitchen', 'off')
+    hass.states.async_set('switch.tv', 'off')
+    await hass.async_block_till_done()
+    assert light_calls == ['light.kitchen']
+    assert switch_calls == ['switch.tv', 'switch.tv']
+
+    unsub_switch()
+    assert hass.bus.async_listeners().get(
+        EVENT_STATE_CHANGED, 0) == init_count
+
+
+async def test_point_in_time_scheduler(hass):
+    """Test the scheduler arms a single timer for the first listener."""
+    runs = []
+    now = dt_util.utcnow()
+    scheduler = async_get_point_in_time_scheduler(hass)
+
+    with patch.object(hass.loop, 'call_at') as mock_call_at:
+        scheduler.async_start()
+        assert mock_call_at.call_count == 0
+
+        async_track_point_in_utc_time(
+            hass, callback(lambda now: runs.append('later')),
+            now + timedelta(seconds=30))
+        assert mock_call_at.call_count == 1
+
+        unsub = async_track_point_in_utc_time(
+            hass, callback(lambda now: runs.append('removed')),
+            now + timedelta(seconds=10))
+        async_track_point_in_utc_time(
+            hass, callback(lambda now: runs.append('first')),
+            now + timedelta(seconds=20))
+        # Only the earliest listener re-arms the timer
+        assert mock_call_at.call_count == 2
+        when, run_due = mock_call_at.call_args_list[1][0]
+        assert 9 < when - hass.loop.time() <= 10
+        unsub()
+
+        with patch('homeassistant.util.dt.utcnow',
+                   return_value=now + timedelta(seconds=25)):
+            run_due()
+
+        assert runs == ['first']
+        when, run_due = mock_call_at.call_args[0]
+        assert 4 < when - hass.loop.time() <= 5
+
+        with patch('homeassistant.util.dt.utcnow',
+                   return_value=now + timedelta(seconds=30)):
+            run_due()
+
+        assert runs == ['first', 'later']
+        assert mock_call_at.return_value.cancel.called
+
+        scheduler.async_stop()
+
+
+async def test_point_in_time_scheduler_compacts_removed(hass):
+    """Test removed listeners do not pile up in the scheduler."""
+    scheduler = async_get_point_in_time_scheduler(hass)
+    point_in_time = dt_util.utcnow() + timedelta(days=1)
+
+    for _ in range(SCHEDULER_COMPACT_THRESHOLD * 3):
+        async_track_point_in_utc_time(
+            hass, callback(lambda now: None), point_in_time)()
+
+    assert len(scheduler._heap) <= SCHEDULER_COMPACT_THRESHOLD * 2
+
+
+async def test_async_track_render_info(hass):
+    """Test tracking the entities and domains a render accessed."""
+    calls = []
+
+    @callback
+    def listener(entity_id, old_state, new_state):
+        """Record state changes."""
+        calls.append(entity_id)
+
+    with async_collect_render_info(hass) as info:
+        Template(
+            "{{ states('sensor.temp') }} {{ states.light | count }}",
+            hass).async_render()
+
+    assert info.entities == {'sensor.temp'}
+    assert info.domains == {'light'}
+
+    unsub = async_track_render_info(hass, info, listener)
+    hass.states.async_set('sensor.temp', '20')
+    hass.states.async_set('sensor.other', '20')
+    hass.states.async_set('light.kitchen', 'on')
+    await hass.async_block_till_done()
+    assert calls == ['sensor.temp', 'light.kitchen']
+
+    unsub()
+    hass.states.async_set('light.kitchen', 'off')
+    await hass.async_block_till_done()
+    assert calls == ['sensor.temp', 'light.kitchen']
+
+
+async def test_async_track_render_info_shares_domain_listener(hass):
+    """Test domain trackers share a listener and only see their domains."""
+    calls = []
+    init_count = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+
+    @callback
+    def listener(entity_id, old_state, new_state):
+        """Record state changes."""
+        calls.append(entity_id)
+
+    unsubs = []
+    for domain in ('light', 'switch', 'sensor'):
+        info = RenderInfo()
+        info.domains.add(domain)
+        info.entities.add('{}.tracked'.format(domain))
+        unsubs.append(async_track_render_info(hass, info, listener))
+
+    all_info = RenderInfo()
+    all_info.all_states = True
+    unsubs.append(async_track_render_info(hass, all_info, listener))
+
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == init_count + 1
+
+    hass.states.async_set('light.tracked', 'on')
+    hass.states.async_set('cover.garage', 'open')
+    await hass.async_block_till_done()
+    assert calls == ['light.tracked', 'light.tracked', 'cover.garage']
+
+    for unsub in unsubs:
+        unsub()
+
+    assert hass.bus.async_listeners().get(
+        EVENT_STATE_CHANGED, 0) == init_count
+
+
+async def test_async_track_template_follows_render(hass):
+    """Test template tracking follows the states of the last render."""
+    calls = []
+    hass.states.async_set('input_boolean.use_a', 'on')
+    hass.states.async_set('sensor.a', '1')
+    hass.states.async_set('sensor.b', '1')
+
+    @callback
+    def action(entity_id, old_state, new_state):
+        """Record template matches."""
+        calls.append(entity_id)
+
+    unsub = async_track_template(hass, Template(
+        "{% if is_state('input_boolean.use_a', 'on') %}"
+        "{{ is_state('sensor.a', '2') }}{% else %}"
+        "{{ is_state('sensor.b', '2') }}{% endif %}", hass), action)
+
+    hass.states.async_set('sensor.b', '2')
+    await hass.async_block_till_done()
+    assert calls == []
+
+    hass.states.async_set('input_boolean.use_a', 'off')
+    await hass.async_block_till_done()
+    assert calls == ['input_boolean.use_a']
+
+    hass.states.async_set('sensor.b', '1')
+    hass.states.async_set('sensor.b', '2')
+    await hass.async_block_till_done()
+    assert calls == ['input_boolean.use_a', 'sensor.b']
+
+    unsub()
+    hass.states.async_set('sensor.b', '1')
+    hass.states.async_set('sensor.b', '2')
+    await hass.async_block_till_done()
+    assert calls == ['input_boolean.use_a', 'sensor.b']
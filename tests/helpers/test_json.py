@@ -1,8 +1,12 @@
 """Test Home Assistant remote methods and classes."""
+import json
+from unittest.mock import patch
+
 import pytest
 
 from homeassistant import core
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import (
+    JSONEncoder, dumps_data, dumps_event, dumps_states)
 from homeassistant.util import dt as dt_util
 
 
@@ -19,3 +23,43 @@ def test_json_encoder(hass):
 
     now = dt_util.utcnow()
     assert ha_json_enc.default(now) == now.isoformat()
+
+
+def test_state_json_cached(hass):
+    """Test states serialize once and match the JSON encoder."""
+    state = core.State('light.kitchen', 'on', {
+        'brightness': 180, 'effects': {'colorloop'}, 'name': 'Kitchen "1"',
+    })
+
+    assert state.as_dict() is state.as_dict()
+    assert state.as_json() is state.as_json()
+    assert json.loads(state.as_json()) == json.loads(
+        json.dumps(state, cls=JSONEncoder))
+    assert json.loads(state.attributes_json()) == {
+        'brightness': 180, 'effects': ['colorloop'], 'name': 'Kitchen "1"'}
+
+    with pytest.raises(ValueError):
+        core.State('sensor.nan', '1', {'value': float('nan')}).as_json()
+
+
+def test_dumps_with_cached_states(hass):
+    """Test serializing objects holding states."""
+    old_state = core.State('light.kitchen', 'off')
+    new_state = core.State('light.kitchen', 'on')
+    event = core.Event('state_changed', {
+        'entity_id': 'light.kitchen',
+        'old_state': old_state,
+        'new_state': new_state,
+    })
+
+    assert json.loads(dumps_states([old_state, new_state])) == \
+        json.loads(json.dumps([old_state, new_state], cls=JSONEncoder))
+    assert json.loads(dumps_data({1: 'one'})) == {'1': 'one'}
+
+    with patch.object(core.State, 'as_json',
+                      side_effect=core.State.as_json,
+                      autospec=True) as mock_as_json:
+        assert json.loads(dumps_event(event)) == \
+            json.loads(json.dumps(event, cls=JSONEncoder))
+
+    assert mock_as_json.call_count == 2
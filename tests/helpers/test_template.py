@@ -5,6 +5,7 @@ import unittest
 import random
 import math
 import pytz
+import jinja2
 from unittest.mock import patch
 
 from homeassistant.components import group
@@ -1076,3 +1077,69 @@ def test_length_of_states(hass):
 
     tpl = template.Template('{{ states.sensor | length }}', hass)
     assert tpl.async_render() == '2'
+
+
+def test_compiled_code_shared_between_templates(hass):
+    """Test templates with the same source are compiled once."""
+    source = '{{ 1 + 2 }} compile cache'
+    info = template.compile_cache_info()
+
+    tpl_1 = template.Template(source, hass)
+    tpl_2 = template.Template(source, hass)
+    assert tpl_1.async_render() == '3 compile cache'
+    assert tpl_2.async_render() == '3 compile cache'
+
+    new_info = template.compile_cache_info()
+    assert new_info.misses == info.misses + 1
+    assert new_info.hits == info.hits + 1
+    assert new_info.currsize == info.currsize + 1
+
+
+def test_compile_cache_evicts_least_recently_used(hass):
+    """Test the compile cache keeps the most recently used sources."""
+    cache = template._CompileCache(2)
+    cache.get('{{ 1 }}')
+    cache.get('{{ 2 }}')
+    cache.get('{{ 1 }}')
+    cache.get('{{ 3 }}')
+
+    assert cache.info() == template.CompileCacheInfo(1, 3, 2, 2)
+
+    cache.get('{{ 1 }}')
+    cache.get('{{ 2 }}')
+    assert cache.info() == template.CompileCacheInfo(2, 4, 2, 2)
+
+    with pytest.raises(jinja2.TemplateSyntaxError):
+        cache.get('{{ 1')
+    assert cache.info().currsize == 2
+
+
+def test_collect_render_info(hass):
+    """Test collecting the states accessed while rendering."""
+    hass.states.async_set('sensor.temp', '20')
+    hass.states.async_set('light.kitchen', 'on')
+
+    with template.async_collect_render_info(hass) as info:
+        template.Template('{{ 1 + 1 }}', hass).async_render()
+    assert info.is_static
+
+    with template.async_collect_render_info(hass) as info:
+        template.Template(
+            "{{ states.sensor.temp.state }} "
+            "{{ is_state('light.kitchen', 'on') }} "
+            "{{ state_attr('Switch.TV', 'power') }}", hass).async_render()
+    assert info.entities == {'sensor.temp', 'light.kitchen', 'switch.tv'}
+    assert not info.domains
+    assert not info.all_states
+
+    with template.async_collect_render_info(hass) as outer:
+        with template.async_collect_render_info(hass) as info:
+            template.Template(
+                '{{ states.light | list | count }}', hass).async_render()
+        assert info.domains == {'light'}
+        template.Template('{{ states | count }}', hass).async_render()
+    assert outer.domains == {'light'}
+    assert outer.all_states
+
+    template.Template('{{ states | count }}', hass).async_render()
+    assert template._RENDER_INFO not in hass.data
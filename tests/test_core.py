@@ -23,7 +23,8 @@ from homeassistant.const import (
     __version__, EVENT_STATE_CHANGED, ATTR_FRIENDLY_NAME, CONF_UNIT_SYSTEM,
     ATTR_NOW, EVENT_TIME_CHANGED, EVENT_TIMER_OUT_OF_SYNC, ATTR_SECONDS,
     EVENT_HOMEASSISTANT_STOP, EVENT_HOMEASSISTANT_CLOSE,
-    EVENT_SERVICE_REGISTERED, EVENT_SERVICE_REMOVED, EVENT_CALL_SERVICE)
+    EVENT_SERVICE_REGISTERED, EVENT_SERVICE_REMOVED, EVENT_CALL_SERVICE,
+    MATCH_ALL)
 
 from tests.common import get_test_home_assistant, async_mock_service
 
@@ -571,6 +572,24 @@ class TestStateMachine(unittest.TestCase):
         states = sorted(state.entity_id for state in self.states.all())
         assert ['light.bowl', 'switch.ac'] == states
 
+    def test_all_domain_filter(self):
+        """Test getting all states of a domain."""
+        self.states.set('light.Kitchen', 'off')
+
+        states = sorted(state.entity_id for state in self.states.all('Light'))
+        assert ['light.bowl', 'light.kitchen'] == states
+        assert [] == self.states.all('sensor')
+
+        self.states.set('light.Bowl', 'off')
+        assert 'off' == [state for state in self.states.all('light')
+                         if state.entity_id == 'light.bowl'][0].state
+
+        self.states.remove('light.bowl')
+        self.states.remove('light.kitchen')
+        assert [] == self.states.all('light')
+        assert [] == self.states.entity_ids('light')
+        assert ['switch.ac'] == self.states.entity_ids('switch')
+
     def test_remove(self):
         """Test remove method."""
         events = []
@@ -968,6 +987,29 @@ def test_create_timer(mock_monotonic, loop):
     assert event_data[ATTR_NOW] == datetime(2018, 12, 31, 3, 4, 6, 100000)
 
 
+@patch('homeassistant.core.monotonic')
+def test_timer_without_time_changed_listeners(mock_monotonic, loop):
+    """Test the timer only fires time changed if there are listeners."""
+    hass = MagicMock()
+    hass.bus.async_has_listeners.return_value = False
+    mock_monotonic.side_effect = 10.2, 10.8, 11.3
+
+    with patch('homeassistant.core.dt_util.utcnow',
+               return_value=datetime(2018, 12, 31, 3, 4, 5, 333333)):
+        ha._async_create_timer(hass)
+
+    delay, callback, target = hass.loop.call_later.mock_calls[0][1]
+
+    with patch('homeassistant.core.dt_util.utcnow',
+               return_value=datetime(2018, 12, 31, 3, 4, 6, 100000)):
+        callback(target)
+
+    assert len(hass.bus.async_fire.mock_calls) == 0
+    assert len(hass.loop.call_later.mock_calls) == 2
+    assert hass.bus.async_has_listeners.mock_calls[0][1][0] == \
+        EVENT_TIME_CHANGED
+
+
 @patch('homeassistant.core.monotonic')
 def test_timer_out_of_sync(mock_monotonic, loop):
     """Test create timer."""
@@ -1128,3 +1170,77 @@ def test_context():
     assert c.user_id == 23
     assert c.parent_id == 100
     assert c.id is not None
+
+
+async def test_bus_callback_listener_runs_inline(hass):
+    """Test callback listeners are run when the event is fired."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Record event."""
+        calls.append(event)
+
+    hass.bus.async_listen('test_event', listener)
+    hass.bus.async_listen('test_event', functools.partial(listener))
+
+    hass.bus.async_fire('test_event')
+    assert len(calls) == 2
+
+
+async def test_bus_dispatch_follows_listener_changes(hass):
+    """Test cached dispatch lists are rebuilt when listeners change."""
+    calls = []
+    all_calls = []
+    hass.bus.async_fire('test_event')
+
+    unsub = hass.bus.async_listen(
+        'test_event', ha.callback(lambda event: calls.append(event)))
+    unsub_all = hass.bus.async_listen(
+        MATCH_ALL, ha.callback(lambda event: all_calls.append(event)))
+    hass.bus.async_fire('test_event')
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_CLOSE)
+    assert len(calls) == 1
+    assert [event.event_type for event in all_calls] == ['test_event']
+
+    unsub_all()
+    hass.bus.async_fire('test_event')
+    assert len(calls) == 2
+    assert len(all_calls) == 1
+
+    unsub()
+    hass.bus.async_fire('test_event')
+    assert len(calls) == 2
+
+
+async def test_bus_callback_listener_exception(hass, caplog):
+    """Test a failing callback listener does not stop other listeners."""
+    calls = []
+
+    @ha.callback
+    def bad_listener(event):
+        """Raise an error."""
+        raise ValueError('boom')
+
+    hass.bus.async_listen('test_event', bad_listener)
+    hass.bus.async_listen(
+        'test_event', ha.callback(lambda event: calls.append(event)))
+
+    hass.bus.async_fire('test_event')
+    assert len(calls) == 1
+    assert 'Error running listener' in caplog.text
+
+
+async def test_bus_has_listeners(hass):
+    """Test checking for listeners of an event type."""
+    assert not hass.bus.async_has_listeners('test_event')
+
+    hass.bus.async_listen(MATCH_ALL, ha.callback(lambda event: None))
+    assert not hass.bus.async_has_listeners('test_event')
+
+    unsub = hass.bus.async_listen(
+        'test_event', ha.callback(lambda event: None))
+    assert hass.bus.async_has_listeners('test_event')
+
+    unsub()
+    assert not hass.bus.async_has_listeners('test_event')